@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Model-based search over the rule model's parameters: CMA-ES for the rates,
+a TPE sampler for the thresholds and bonuses.
+
+param_search.random_search() perturbs two or three parameters at random
+and keeps the best, so most evaluations are wasted. This optimizer learns
+where good parameters are instead, alternating between two samplers over
+the param_search.SEARCH_SPACE schema:
+
+    CMA-ES   the float parameters (mileage and receipt rates), searched in
+             coordinates normalized to [0, 1]; it adapts a full covariance
+             matrix, so correlated rates move together
+    TPE      the integer parameters (thresholds, per diem, bonuses); per
+             parameter, a Parzen density of the best quarter of the
+             observations over one of the rest picks the most promising of
+             24 draws (uniform draws until there are 20 observations)
+
+Each generation varies one group with the other fixed at the best
+parameters so far. Candidates are evaluated through param_search.Search.
+
+The run stops after --max-evals evaluations, after --patience evaluations
+without improvement, or when CMA-ES has converged. Its whole state (both
+samplers, the best parameters, the random generator) is checkpointed to a
+JSON file after every --checkpoint-every generations and on Ctrl-C, and
+--resume continues a run exactly where it stopped. Checkpoints only ever
+hold generation boundaries: a generation interrupted mid-evaluation is
+rolled back (its evaluations are discarded and the random generator is
+rewound), so after Ctrl-C the resumed run repeats that generation.
+
+Usage:
+    python3 adaptive_search.py [--max-evals 100000] [--patience 20000] [--seed 0]
+                               [--start params.json] [--out best_params.json]
+                               [--checkpoint adaptive_search.json] [--resume]
+"""
+
+import argparse
+import json
+import math
+import os
+import signal
+import time
+
+import numpy as np
+
+from param_eval import DEFAULT_PARAMS, PARAM_NAMES
+from param_search import SEARCH_SPACE, Search, load_params
+
+CHECKPOINT_PATH = 'adaptive_search.json'
+
+class CMAES:
+    """Covariance matrix adaptation evolution strategy (minimization) with ask/tell"""
+
+    def __init__(self, mean, sigma, popsize=None):
+        n = len(mean)
+        self.n = n
+        self.popsize = popsize or 4 + int(3 * math.log(n))
+        mu = self.popsize // 2
+        weights = math.log(mu + 0.5) - np.log(np.arange(1, mu + 1))
+        self.weights = weights / weights.sum()
+        self.mueff = 1 / (self.weights ** 2).sum()
+
+        # Strategy parameters from Hansen's tutorial
+        self.cc = (4 + self.mueff / n) / (n + 4 + 2 * self.mueff / n)
+        self.cs = (self.mueff + 2) / (n + self.mueff + 5)
+        self.c1 = 2 / ((n + 1.3) ** 2 + self.mueff)
+        self.cmu = min(1 - self.c1, 2 * (self.mueff - 2 + 1 / self.mueff) / ((n + 2) ** 2 + self.mueff))
+        self.damps = 1 + 2 * max(0, math.sqrt((self.mueff - 1) / (n + 1)) - 1) + self.cs
+        self.chi_n = math.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n ** 2))
+
+        self.mean = np.array(mean, dtype=np.float64)
+        self.sigma = float(sigma)
+        self.C = np.eye(n)
+        self.ps = np.zeros(n)
+        self.pc = np.zeros(n)
+        self.generation = 0
+
+    def ask(self, rng):
+        """popsize samples, one per row"""
+        eigenvalues, B = np.linalg.eigh(self.C)
+        D = np.sqrt(np.maximum(eigenvalues, 0))
+        z = rng.standard_normal((self.popsize, self.n))
+        return self.mean + self.sigma * (z * D) @ B.T
+
+    def tell(self, samples, losses):
+        """Update the distribution from the samples of one ask() and their losses"""
+        order = np.argsort(losses, kind='stable')[:len(self.weights)]
+        old_mean = self.mean
+        steps = (samples[order] - old_mean) / self.sigma
+        self.mean = old_mean + self.sigma * (self.weights @ steps)
+        step = self.weights @ steps
+
+        eigenvalues, B = np.linalg.eigh(self.C)
+        inv_sqrt = B @ np.diag(1 / np.sqrt(np.maximum(eigenvalues, 1e-30))) @ B.T
+        self.ps = (1 - self.cs) * self.ps + math.sqrt(self.cs * (2 - self.cs) * self.mueff) * (inv_sqrt @ step)
+        self.generation += 1
+        ps_norm = np.linalg.norm(self.ps) / math.sqrt(1 - (1 - self.cs) ** (2 * self.generation))
+        hsig = ps_norm / self.chi_n < 1.4 + 2 / (self.n + 1)
+        self.pc = (1 - self.cc) * self.pc + hsig * math.sqrt(self.cc * (2 - self.cc) * self.mueff) * step
+
+        rank_mu = (steps.T * self.weights) @ steps
+        self.C = ((1 - self.c1 - self.cmu) * self.C
+                  + self.c1 * (np.outer(self.pc, self.pc) + (1 - hsig) * self.cc * (2 - self.cc) * self.C)
+                  + self.cmu * rank_mu)
+        self.C = (self.C + self.C.T) / 2
+        self.sigma *= math.exp((self.cs / self.damps) * (np.linalg.norm(self.ps) / self.chi_n - 1))
+
+    def state(self):
+        return {'popsize': self.popsize, 'mean': self.mean.tolist(), 'sigma': self.sigma,
+                'C': self.C.tolist(), 'ps': self.ps.tolist(), 'pc': self.pc.tolist(),
+                'generation': self.generation}
+
+    @classmethod
+    def from_state(cls, state):
+        cma = cls(state['mean'], state['sigma'], state['popsize'])
+        cma.C = np.array(state['C'])
+        cma.ps = np.array(state['ps'])
+        cma.pc = np.array(state['pc'])
+        cma.generation = state['generation']
+        return cma
+
+class TPE:
+    """Tree-structured Parzen estimator over integer parameters, one independent density per parameter"""
+
+    def __init__(self, space, gamma=0.25, startup=20, draws=24, history=1000):
+        self.space = space
+        self.gamma = gamma
+        self.startup = startup
+        self.draws = draws
+        self.history = history
+        self.observations = []
+
+    def observe(self, values, loss):
+        """Record the loss of a {name: value} assignment"""
+        self.observations.append(([values[p.name] for p in self.space], loss))
+        del self.observations[:-self.history]
+
+    @staticmethod
+    def _density(x, points, low, high):
+        """Gaussian Parzen density around points, mixed with a uniform prior over [low, high]"""
+        bandwidth = max(1.0, (high - low) / 4 * len(points) ** -0.2)
+        # Observations repeat a lot (the incumbent's values), so sum over distinct ones
+        centers, counts = np.unique(points, return_counts=True)
+        kernels = np.exp(-0.5 * ((x[:, None] - centers[None, :]) / bandwidth) ** 2) / (bandwidth * math.sqrt(2 * math.pi))
+        return (kernels @ counts + 1 / (high - low + 1)) / (len(points) + 1)
+
+    def ask(self, rng, count):
+        """count {name: value} assignments"""
+        samples = [{} for _ in range(count)]
+        if len(self.observations) < self.startup:
+            for param in self.space:
+                for sample, value in zip(samples, rng.integers(param.low, param.high + 1, count)):
+                    sample[param.name] = int(value)
+            return samples
+
+        values = np.array([v for v, _ in self.observations], dtype=np.float64)
+        losses = np.array([loss for _, loss in self.observations])
+        order = np.argsort(losses, kind='stable')
+        n_good = max(1, math.ceil(self.gamma * len(order)))
+        good, bad = values[order[:n_good]], values[order[n_good:]]
+
+        for k, param in enumerate(self.space):
+            low, high = param.low, param.high
+            bandwidth = max(1.0, (high - low) / 4 * n_good ** -0.2)
+            # Draw from the good density: a good observation plus noise, or the prior
+            component = rng.integers(n_good + 1, size=(count, self.draws))
+            from_good = component < n_good
+            centers = np.where(from_good, good[np.minimum(component, n_good - 1), k],
+                               rng.uniform(low, high, component.shape))
+            noise = np.where(from_good, rng.normal(0, bandwidth, component.shape), 0)
+            x = np.clip(np.round(centers + noise), low, high).ravel()
+            score = np.log(self._density(x, good[:, k], low, high))
+            if len(bad):
+                score -= np.log(self._density(x, bad[:, k], low, high))
+            best = x.reshape(count, self.draws)[np.arange(count), score.reshape(count, self.draws).argmax(axis=1)]
+            for sample, value in zip(samples, best):
+                sample[param.name] = int(value)
+        return samples
+
+    def state(self):
+        return {'observations': self.observations}
+
+    def restore(self, state):
+        self.observations = [(list(values), loss) for values, loss in state['observations']]
+
+class AdaptiveSearch:
+    """Alternating CMA-ES / TPE generations around the best parameters so far"""
+
+    def __init__(self, search, base, space=SEARCH_SPACE, seed=0, sigma=0.2):
+        self.search = search
+        self.continuous = [p for p in space if p.decimals is not None]
+        self.discrete = [p for p in space if p.decimals is None]
+        self.rng = np.random.default_rng(seed)
+        self.cma = CMAES(self._normalize(base), sigma)
+        self.best_params = dict(base)
+        self.best_total = search.evaluator.evaluate(base)[2]
+        self.tpe = TPE(self.discrete)
+        self.tpe.observe(base, self.best_total)
+        self.generation = 0
+        self.evaluations = 0
+        self.last_improvement = 0
+
+    def _normalize(self, params):
+        return np.array([(params[p.name] - p.low) / (p.high - p.low) for p in self.continuous]).clip(0, 1)
+
+    def _rates(self, x):
+        """{name: value} for a point in normalized coordinates, clipped and rounded"""
+        return {p.name: round(p.low + float(v) * (p.high - p.low), p.decimals)
+                for p, v in zip(self.continuous, np.clip(x, 0, 1))}
+
+    def step(self):
+        """Run one generation; return the new bests it found as (evaluation, params, stats)"""
+        # Until every candidate is evaluated, only the random generator has moved
+        rng_state = self.rng.bit_generator.state
+        try:
+            if self.generation % 2 == 0:
+                samples = self.cma.ask(self.rng)
+                candidates = [dict(self.best_params, **self._rates(x)) for x in samples]
+            else:
+                candidates = [dict(self.best_params, **values)
+                              for values in self.tpe.ask(self.rng, self.cma.popsize)]
+            results = list(self.search.evaluate(candidates))
+        except BaseException:
+            self.rng.bit_generator.state = rng_state
+            raise
+
+        # Apply the generation as a whole: Ctrl-C waits until the state is consistent again
+        blocked = hasattr(signal, 'pthread_sigmask')
+        if blocked:
+            signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGINT})
+        try:
+            return self._apply(samples if self.generation % 2 == 0 else None, results)
+        finally:
+            if blocked:
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGINT})
+
+    def _apply(self, samples, results):
+        improvements = []
+        losses = []
+        for params, stats in results:
+            self.evaluations += 1
+            losses.append(stats[2])
+            self.tpe.observe(params, stats[2])
+            if stats[2] < self.best_total:
+                self.best_total = stats[2]
+                self.last_improvement = self.evaluations
+                improvements.append((self.evaluations, params, stats))
+        if samples is not None:
+            self.cma.tell(samples, np.array(losses))
+        if improvements:
+            self.best_params = improvements[-1][1]
+        self.generation += 1
+        return improvements
+
+    def converged(self, tolerance=1e-6):
+        return self.cma.sigma < tolerance
+
+    def state(self):
+        return {'generation': self.generation, 'evaluations': self.evaluations,
+                'last_improvement': self.last_improvement,
+                'best_params': self.best_params, 'best_total': self.best_total,
+                'rng': self.rng.bit_generator.state, 'cma': self.cma.state(), 'tpe': self.tpe.state()}
+
+    def save(self, path):
+        """Write the optimizer state to a JSON checkpoint atomically"""
+        with open(path + '.tmp', 'w') as f:
+            json.dump(self.state(), f)
+        os.replace(path + '.tmp', path)
+
+    @classmethod
+    def load(cls, path, search, space=SEARCH_SPACE):
+        """Resume an optimizer from a checkpoint written by save()"""
+        with open(path, 'r') as f:
+            state = json.load(f)
+        optimizer = cls(search, state['best_params'], space)
+        optimizer.generation = state['generation']
+        optimizer.evaluations = state['evaluations']
+        optimizer.last_improvement = state['last_improvement']
+        optimizer.best_total = state['best_total']
+        optimizer.rng.bit_generator.state = state['rng']
+        optimizer.cma = CMAES.from_state(state['cma'])
+        optimizer.tpe.restore(state['tpe'])
+        return optimizer
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CMA-ES / TPE search over the rule model's parameters")
+    parser.add_argument('--max-evals', type=int, default=100_000, help="evaluation budget (default: 100000)")
+    parser.add_argument('--patience', type=int, default=20_000,
+                        help="stop after this many evaluations without improvement (default: 20000)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument('--sigma', type=float, default=0.2, help="initial CMA-ES step size, in range units (default: 0.2)")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--cases', default='public_cases.json', help="case file (default: public_cases.json)")
+    parser.add_argument('--start', help="JSON file of starting parameters (default: param_eval.DEFAULT_PARAMS)")
+    parser.add_argument('--out', help="write the best parameters to this JSON file")
+    parser.add_argument('--checkpoint', default=CHECKPOINT_PATH, help=f"state file (default: {CHECKPOINT_PATH})")
+    parser.add_argument('--checkpoint-every', type=int, default=50, help="generations between checkpoints (default: 50)")
+    parser.add_argument('--resume', action='store_true', help="continue from the checkpoint")
+    args = parser.parse_args()
+
+    with Search(args.cases, jobs=args.jobs) as search:
+        if args.resume:
+            optimizer = AdaptiveSearch.load(args.checkpoint, search)
+            print(f"Resumed {args.checkpoint}: generation {optimizer.generation}, "
+                  f"{optimizer.evaluations} evaluations, score {optimizer.best_total / 100:.2f}")
+        else:
+            base = load_params(args.start) if args.start else DEFAULT_PARAMS
+            optimizer = AdaptiveSearch(search, base, seed=args.seed, sigma=args.sigma)
+            print(f"Start: score {optimizer.best_total / 100:.2f}")
+        start_params = dict(optimizer.best_params)
+
+        started = time.time()
+        start_evaluations = optimizer.evaluations
+        last_report = started
+        reason = "evaluation budget reached"
+        try:
+            while optimizer.evaluations < args.max_evals:
+                for evaluation, params, (avg_error, _, total_error, high_errors) in optimizer.step():
+                    print(f"  🎯 Evaluation {evaluation}: score {total_error / 100:.2f} "
+                          f"(avg ${avg_error:.2f}, {high_errors} errors >$500)", flush=True)
+                now = time.time()
+                if now - last_report >= 10:
+                    rate = (optimizer.evaluations - start_evaluations) / (now - started)
+                    print(f"  generation {optimizer.generation}, {optimizer.evaluations} evaluations, "
+                          f"{rate:.0f} evals/s, step size {optimizer.cma.sigma:.2g}", flush=True)
+                    last_report = now
+                if optimizer.generation % args.checkpoint_every == 0:
+                    optimizer.save(args.checkpoint)
+                if optimizer.evaluations - optimizer.last_improvement >= args.patience:
+                    reason = f"no improvement in {args.patience} evaluations"
+                    break
+                if optimizer.converged():
+                    reason = "CMA-ES converged"
+                    break
+        except KeyboardInterrupt:
+            # step() rolled the unfinished generation back; stop its workers before saving
+            search.terminate()
+            reason = "interrupted"
+        optimizer.save(args.checkpoint)
+
+    elapsed = time.time() - started
+    evaluations = optimizer.evaluations - start_evaluations
+    print(f"\nStopped ({reason}) after {optimizer.generation} generations")
+    print(f"{evaluations} evaluations in {elapsed:.1f}s ({evaluations / max(elapsed, 1e-9):.0f} evals/s)")
+    print(f"Best score: {optimizer.best_total / 100:.2f}   (state saved to {args.checkpoint})")
+    for name in PARAM_NAMES:
+        if optimizer.best_params[name] != start_params[name]:
+            print(f"  {name}: {start_params[name]} → {optimizer.best_params[name]}")
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(optimizer.best_params, f, indent=2)
+        print(f"✅ Wrote {args.out}")
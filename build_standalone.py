@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Precompile the self-contained RandomForest solution.
+
+run_self_contained.sh and run_best_standalone.sh used to pipe 1.1 MB of
+generated Python through a heredoc, so every call tokenized, parsed and
+compiled the whole forest again before predicting once. They now import
+rf_standalone.py (which imports the forest from rf_pure_python.py), and an
+imported module's bytecode is cached in __pycache__.
+
+This writes that cache ahead of time as checked-hash .pyc files (PEP 552):
+Python validates them against a hash of the source rather than its mtime,
+so they stay valid across a fresh checkout or copy as long as the source
+bytes are unchanged, and are recompiled if the source is edited. Without
+them the scripts still work, they just compile on the first call.
+
+Usage:
+    python3 build_standalone.py                     (compile the modules)
+    python3 build_standalone.py --check             (compare the run scripts with the module)
+    python3 build_standalone.py --benchmark [--runs 20]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import py_compile
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MODULES = ('rf_pure_python.py', 'rf_standalone.py')
+RUN_SCRIPTS = ('run_self_contained.sh', 'run_best_standalone.sh')
+
+def build(directory=HERE):
+    """Compile MODULES to checked-hash .pyc files in __pycache__; return the .pyc paths"""
+    compiled = []
+    for name in MODULES:
+        source = os.path.join(directory, name)
+        compiled.append(py_compile.compile(
+            source, cfile=importlib.util.cache_from_source(source), doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH))
+    return compiled
+
+def run(script, case, env=None):
+    """stdout of one run script call for case = (days, miles, receipts)"""
+    result = subprocess.run([os.path.join(HERE, script), *map(str, case)],
+                            capture_output=True, text=True, env=env, check=True)
+    return result.stdout.strip()
+
+def check(cases, scripts=RUN_SCRIPTS):
+    """Mismatches between each run script and rf_standalone.predict_reimbursement, as (script, case, got, expected)"""
+    sys.path.insert(0, HERE)
+    from rf_standalone import predict_reimbursement
+
+    mismatches = []
+    for case in cases:
+        expected = f"{predict_reimbursement(*case):.2f}"
+        for script in scripts:
+            got = run(script, case)
+            if got != expected:
+                mismatches.append((script, case, got, expected))
+    return mismatches
+
+def benchmark(case, runs):
+    """Mean seconds per call of run_self_contained.sh without and with the cached bytecode"""
+    timings = {}
+    with tempfile.TemporaryDirectory() as empty:
+        # An empty, read-only cache prefix makes every call compile from source,
+        # like the old heredoc scripts did
+        os.chmod(empty, 0o500)
+        cold = dict(os.environ, PYTHONPYCACHEPREFIX=empty, PYTHONDONTWRITEBYTECODE='1')
+        for label, env in (('compile every call', cold), ('cached bytecode', None)):
+            run(RUN_SCRIPTS[0], case, env)
+            started = time.perf_counter()
+            for _ in range(runs):
+                run(RUN_SCRIPTS[0], case, env)
+            timings[label] = (time.perf_counter() - started) / runs
+    return timings
+
+def load_cases(path, limit):
+    """The first `limit` (days, miles, receipts) inputs of a case file"""
+    with open(path, 'r') as f:
+        data = json.load(f)
+    return [(case['input']['trip_duration_days'], case['input']['miles_traveled'],
+             case['input']['total_receipts_amount']) for case in data[:limit]]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompile the self-contained RandomForest solution")
+    parser.add_argument('--check', action='store_true', help="compare the run scripts with the module on sample cases")
+    parser.add_argument('--benchmark', action='store_true', help="time run_self_contained.sh without and with the cache")
+    parser.add_argument('--cases', default='public_cases.json', help="case file (default: public_cases.json)")
+    parser.add_argument('--limit', type=int, default=50, help="cases to check (default: 50)")
+    parser.add_argument('--runs', type=int, default=20, help="calls per benchmark timing (default: 20)")
+    args = parser.parse_args()
+
+    for path in build():
+        print(f"✅ Compiled {os.path.relpath(path, HERE)}")
+
+    if args.check:
+        cases = load_cases(os.path.join(HERE, args.cases), args.limit)
+        mismatches = check(cases)
+        for script, case, got, expected in mismatches[:10]:
+            print(f"  {script} {case}: {got!r} != {expected!r}")
+        print(f"{'✅' if not mismatches else '❌'} {len(mismatches)} mismatches over "
+              f"{len(cases)} cases x {len(RUN_SCRIPTS)} scripts")
+        if mismatches:
+            sys.exit(1)
+
+    if args.benchmark:
+        timings = benchmark((3, 93, 1.42), args.runs)
+        for label, seconds in timings.items():
+            print(f"  {label:>18}: {seconds * 1000:7.1f} ms per call")
+        cold, cached = timings.values()
+        print(f"  {cold / cached:.1f}x faster with the cached bytecode")
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Streaming reader for case and trip files of any size.
+
+json.load() and `jq -r '.[]'` materialize the whole array before the first
+case is processed. These generators read the input in fixed-size blocks
+instead, decoding one record at a time with JSONDecoder.raw_decode, so
+memory stays bounded by the chunk size rather than the file size.
+
+Accepted layouts:
+    JSON array of nested cases   [{"input": {...}, "expected_output": ...}, ...]
+    JSON array of flat trips     [{"trip_duration_days": ..., ...}, ...]
+    NDJSON of either             one object per line
+    CSV                          days,miles,receipts with an optional header
+                                 (iter_trip_chunks only)
+
+Usage:
+    python3 case_reader.py FILE     (prints the number of cases)
+"""
+
+import csv
+import io
+import itertools
+import json
+import sys
+
+BLOCK_SIZE = 1 << 16
+CHUNK_SIZE = 4096
+
+# Whitespace, plus the commas between array elements
+_SEPARATORS = ' \t\r\n,'
+
+def trip_from_record(record):
+    """Extract (days, miles, receipts) from a public_cases.json-style or private_cases.json-style record"""
+    trip = record.get('input', record)
+    return (int(trip['trip_duration_days']),
+            float(trip['miles_traveled']),
+            float(trip['total_receipts_amount']))
+
+def _peek(stream):
+    """Read the first block of a stream and return it with its first non-blank character"""
+    prefix = stream.read(BLOCK_SIZE)
+    while prefix and not prefix.strip():
+        block = stream.read(BLOCK_SIZE)
+        if not block:
+            break
+        prefix += block
+    stripped = prefix.lstrip()
+    return prefix, stripped[:1]
+
+def iter_records(stream, prefix=''):
+    """
+    Yield the JSON objects of a top-level array or of an NDJSON stream one
+    by one. `prefix` is text already read from the front of the stream.
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, eof = prefix, 0, False
+    started = False
+
+    while True:
+        # Skip separators, refilling the buffer once it is used up
+        while True:
+            while pos < len(buf) and buf[pos] in _SEPARATORS:
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            buf, pos = stream.read(BLOCK_SIZE), 0
+            eof = not buf
+        if pos >= len(buf):
+            return
+
+        if not started:
+            started = True
+            if buf[pos] == '[':
+                pos += 1
+                continue
+        if buf[pos] == ']':
+            return
+
+        try:
+            record, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            # The record runs past the end of the buffer: read more and retry
+            block = stream.read(BLOCK_SIZE)
+            eof = not block
+            buf, pos = buf[pos:] + block, 0
+            continue
+        if not isinstance(record, dict):
+            raise ValueError(f"expected a JSON object per case, got {type(record).__name__}")
+        yield record
+
+        pos = end
+        if pos > BLOCK_SIZE:
+            buf, pos = buf[pos:], 0
+
+def chunked(items, chunk_size=CHUNK_SIZE):
+    """Group an iterable into lists of at most chunk_size items"""
+    items = iter(items)
+    while True:
+        chunk = list(itertools.islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def iter_case_chunks(stream, chunk_size=CHUNK_SIZE):
+    """Yield lists of case records (nested or flat) from a JSON array or NDJSON stream"""
+    prefix, _ = _peek(stream)
+    return chunked(iter_records(stream, prefix), chunk_size)
+
+def _iter_csv_trips(stream, prefix):
+    # Finish the line the prefix ends in, then hand csv the rest of the stream line by line
+    lines = itertools.chain(io.StringIO(prefix + stream.readline()), stream)
+    first = True
+    for row in csv.reader(lines):
+        if not row or not ''.join(row).strip():
+            continue
+        try:
+            days, miles, receipts = (value.strip() for value in row[:3])
+            trip = (int(days), float(miles), float(receipts))
+        except ValueError:
+            # Header line such as "trip_duration_days,miles_traveled,total_receipts_amount"
+            if first:
+                first = False
+                continue
+            raise
+        first = False
+        yield trip
+
+def iter_trip_chunks(stream, chunk_size=CHUNK_SIZE):
+    """Yield lists of (days, miles, receipts) trips from a JSON array, NDJSON or CSV stream, in order"""
+    prefix, first = _peek(stream)
+    if first in ('[', '{'):
+        trips = map(trip_from_record, iter_records(stream, prefix))
+    else:
+        trips = _iter_csv_trips(stream, prefix)
+    return chunked(trips, chunk_size)
+
+def open_input(path):
+    """Open a case file for streaming, with '-' meaning stdin"""
+    if path == '-':
+        return sys.stdin
+    return open(path, 'r')
+
+def iter_cases(path):
+    """Yield the case records of a file one by one, reading it a chunk at a time"""
+    with open_input(path) as f:
+        for chunk in iter_case_chunks(f):
+            yield from chunk
+
+def count_cases(path):
+    """Number of cases in a file, without keeping them in memory"""
+    return sum(1 for _ in iter_cases(path))
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: case_reader.py FILE|-", file=sys.stderr)
+        sys.exit(1)
+
+    print(count_cases(sys.argv[1]))
@@ -0,0 +1,61 @@
+#!/bin/bash
+
+# Black Box Challenge - case runner shared by eval.sh and generate_results.sh
+# Source it, then:
+#   parse_jobs "$@"           sets $jobs from EVAL_JOBS and -j N / --jobs N (-j 0 uses every core)
+#   start_workers <name>      with more than one job, runs every entry of test_cases
+#                             ("days:miles:receipts[:...]") through a pool of $jobs workers
+#   run_case <i> <days> <miles> <receipts>
+#                             sets script_output (and error_msg on failure) and returns
+#                             run.sh's exit status, from the pool or by running run.sh now
+
+parse_jobs() {
+    jobs="${EVAL_JOBS:-1}"
+    while [ $# -gt 0 ]; do
+        case "$1" in
+            -j|--jobs) jobs="$2"; shift 2 ;;
+            -j*) jobs="${1#-j}"; shift ;;
+            *) echo "Usage: $0 [-j jobs]" >&2; exit 1 ;;
+        esac
+    done
+    if ! [[ "$jobs" =~ ^[0-9]+$ ]]; then
+        echo "❌ Error: the job count must be a non-negative integer" >&2
+        exit 1
+    fi
+    if [ "$jobs" -eq 0 ]; then
+        jobs=$(getconf _NPROCESSORS_ONLN 2>/dev/null || echo 1)
+    fi
+}
+
+# Each worker leaves <case index>.out/.err/.status in results_dir, so results are
+# still collected in case order, whatever order the workers finish in. Records are
+# NUL-delimited, so an empty field or one containing spaces stays one argument and
+# every case keeps its own index.
+results_dir=""
+start_workers() {
+    [ "$jobs" -gt 1 ] || return 0
+    results_dir=$(mktemp -d "${TMPDIR:-/tmp}/$1.XXXXXX")
+    trap 'rm -rf "$results_dir"' EXIT
+    local i trip_duration miles_traveled receipts_amount rest
+    for ((i=0; i<${#test_cases[@]}; i++)); do
+        IFS=':' read -r trip_duration miles_traveled receipts_amount rest <<< "${test_cases[i]}"
+        printf '%s\0' "$i" "$trip_duration" "$miles_traveled" "$receipts_amount"
+    done | xargs -0 -n 4 -P "$jobs" sh -c '
+        ./run.sh "$2" "$3" "$4" > "$0/$1.out" 2> "$0/$1.err"
+        echo $? > "$0/$1.status"
+    ' "$results_dir"
+}
+
+run_case() {
+    if [ -n "$results_dir" ]; then
+        script_output=$(cat "$results_dir/$1.out")
+        error_msg=$(tr -d '\n' < "$results_dir/$1.err")
+        return "$(cat "$results_dir/$1.status")"
+    fi
+    if script_output=$(./run.sh "$2" "$3" "$4" 2>/dev/null); then
+        return 0
+    fi
+    # Capture stderr for error reporting
+    error_msg=$(./run.sh "$2" "$3" "$4" 2>&1 >/dev/null | tr -d '\n')
+    return 1
+}
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Columnar binary store for the case files.
+
+Parsing public_cases.json / private_cases.json and walking nested dicts row
+by row dominates the start-up of every analysis and training script. This
+module converts a case file once into a structured .npy array next to it
+(public_cases.json -> public_cases.npy) with one record per case:
+
+    days            int32
+    miles           float64   (a few cases have fractional miles)
+    receipts_cents  int64     receipts in integer cents
+    expected        float64   expected output, NaN for private cases
+
+A sidecar (public_cases.npy.json) records the SHA-256, size and mtime of
+the JSON it was built from. load_cases() rebuilds the store whenever the
+JSON's contents change, and otherwise memory-maps it, so every column is a
+zero-copy NumPy view:
+
+    cases = load_cases('public_cases.json')
+    days, cents = cases['days'], cases['receipts_cents']
+
+Usage:
+    python3 case_store.py [public_cases.json private_cases.json ...]
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+import numpy as np
+
+CASE_DTYPE = np.dtype([
+    ('days', '<i4'),
+    ('miles', '<f8'),
+    ('receipts_cents', '<i8'),
+    ('expected', '<f8'),
+])
+
+def store_path(json_path):
+    """Location of the columnar store for a case file"""
+    return os.path.splitext(json_path)[0] + '.npy'
+
+def _source_stats(json_path):
+    st = os.stat(json_path)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def receipts_to_cents(receipts):
+    """Exact integer cents for receipt amounts, refusing sub-cent values"""
+    receipts = np.asarray(receipts, dtype=np.float64)
+    cents = np.round(receipts * 100).astype(np.int64)
+    if not np.array_equal(cents / 100, receipts):
+        bad = receipts[cents / 100 != receipts][0]
+        raise ValueError(f"receipt amount {bad!r} is not a whole number of cents")
+    return cents
+
+def cases_to_array(cases):
+    """Structured CASE_DTYPE array from public_cases.json- or private_cases.json-style records"""
+    out = np.empty(len(cases), dtype=CASE_DTYPE)
+    trips = [case.get('input', case) for case in cases]
+    out['days'] = [trip['trip_duration_days'] for trip in trips]
+    out['miles'] = [trip['miles_traveled'] for trip in trips]
+    out['receipts_cents'] = receipts_to_cents([trip['total_receipts_amount'] for trip in trips])
+    out['expected'] = [case.get('expected_output', np.nan) for case in cases]
+    return out
+
+def build(json_path):
+    """Convert a case file to its columnar store; return the store path"""
+    with open(json_path, 'r') as f:
+        cases = json.load(f)
+    path = store_path(json_path)
+
+    # Write under temporary names so a concurrent reader never maps a partial file
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        np.save(f, cases_to_array(cases))
+    meta = dict(_source_stats(json_path), source=os.path.basename(json_path),
+                sha256=file_sha256(json_path), cases=len(cases))
+    with open(path + '.json.tmp', 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp, path)
+    os.replace(path + '.json.tmp', path + '.json')
+    return path
+
+def is_current(json_path):
+    """True if the store for json_path was built from the file's current contents"""
+    try:
+        with open(store_path(json_path) + '.json', 'r') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if not os.path.exists(store_path(json_path)):
+        return False
+    stats = _source_stats(json_path)
+    if meta.get('size') == stats['size'] and meta.get('mtime_ns') == stats['mtime_ns']:
+        return True
+    # Touched but possibly unchanged: settle it by content
+    if meta.get('sha256') != file_sha256(json_path):
+        return False
+    meta.update(stats)
+    with open(store_path(json_path) + '.json', 'w') as f:
+        json.dump(meta, f)
+    return True
+
+def load_cases(json_path='public_cases.json'):
+    """Memory-mapped CASE_DTYPE array for a case file, (re)building the store if it is stale"""
+    if not is_current(json_path):
+        build(json_path)
+    return np.load(store_path(json_path), mmap_mode='r')
+
+def columns(json_path='public_cases.json'):
+    """(days, miles, receipts, expected) float columns; receipts is derived from the cents column"""
+    cases = load_cases(json_path)
+    return cases['days'], cases['miles'], cases['receipts_cents'] / 100, cases['expected']
+
+if __name__ == "__main__":
+    paths = sys.argv[1:] or ['public_cases.json', 'private_cases.json']
+    for json_path in paths:
+        if is_current(json_path):
+            print(f"✓ {store_path(json_path)} is up to date")
+        else:
+            print(f"✅ Wrote {build(json_path)} ({len(load_cases(json_path))} cases)")
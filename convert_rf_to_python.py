@@ -2,19 +2,166 @@
 """
 Convert RandomForest model to pure Python code using m2cgen
 This will create a self-contained solution with no external dependencies
+
+Backends:
+  m2cgen       (default) nested-if source in rf_pure_python.py, imported by rf_standalone.py
+               and run_self_contained.sh
+  arrays       flat node arrays in rf_forest.bin, evaluated by rf_forest.py
+  quickscorer  QuickScorer bitvector evaluator in rf_quickscorer.py
 """
 
+import argparse
 import pickle
 import subprocess
 import sys
 
-# First, install m2cgen if not available
-try:
-    import m2cgen as m2c
-except ImportError:
-    print("Installing m2cgen...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "m2cgen"])
-    import m2cgen as m2c
+def extract_trees(rf_model):
+    """Pull the fitted node arrays out of every estimator, with child indices local to each tree"""
+    trees = []
+    for estimator in rf_model.estimators_:
+        tree = estimator.tree_
+        trees.append({
+            'feature': [int(f) for f in tree.feature],
+            'threshold': [float(t) for t in tree.threshold],
+            'left': [int(c) for c in tree.children_left],
+            'right': [int(c) for c in tree.children_right],
+            'value': [float(v) for v in tree.value[:, 0, 0]],
+        })
+    return trees
+
+def export_arrays(rf_model, feature_cols, path='rf_forest.bin'):
+    """Write the forest as flat arrays for rf_forest.py"""
+    from rf_forest import Forest
+
+    forest = Forest.from_trees(len(feature_cols), extract_trees(rf_model))
+    forest.save(path)
+    return forest
+
+QUICKSCORER_RUNTIME = '''
+# ===== QUICKSCORER EVALUATION =====
+# Leaves of each tree are numbered left to right and every tree owns a
+# _SLOT-bit field of one big bitvector. A node whose test `x <= t` is false
+# rules out the leaves of its left subtree; the exit leaf of a tree is the
+# lowest bit still set in its field. Because thresholds are sorted per
+# feature, the tests that are false for a value x are exactly the prefix of
+# thresholds below x, so the AND of their masks is precomputed per prefix and
+# each feature costs one bisect and one AND.
+
+_SLOT = 128
+
+def _build():
+    full = 0
+    ones = 0
+    luts = []
+    for t, leaves in enumerate(LEAF_VALUES):
+        full |= ((1 << len(leaves)) - 1) << (t * _SLOT)
+        ones |= 1 << (t * _SLOT)
+        # One lookup per 64-bit word; the empty word contributes an exact 0.0
+        for half in range(_SLOT // 64):
+            lut = {0: 0.0}
+            for i, value in enumerate(leaves[half * 64:(half + 1) * 64]):
+                lut[1 << i] = value
+            luts.append(lut)
+
+    features = []
+    for f, thresholds in THRESHOLDS.items():
+        prefix = [full]
+        mask = full
+        for nodes in FALSE_NODES[f]:
+            for t, lo, hi in nodes:
+                mask &= ~((((1 << hi) - 1) ^ ((1 << lo) - 1)) << (t * _SLOT))
+            prefix.append(mask)
+        features.append((f, thresholds, prefix))
+
+    words = len(luts)
+    unpack = struct.Struct(f'<{words}Q').unpack
+    return full, ones, features, luts, unpack, words * 8
+
+_FULL, _ONES, _FEATURES, _LUTS, _UNPACK, _NBYTES = _build()
+
+def score(input):
+    bits = _FULL
+    for f, thresholds, prefix in _FEATURES:
+        bits &= prefix[bisect_left(thresholds, input[f])]
+    # Isolate the lowest set bit of every tree's field at once
+    exits = bits & ~(bits - _ONES)
+    words = _UNPACK(exits.to_bytes(_NBYTES, 'little'))
+    # Summed in tree order, like the nested-if version
+    return reduce(add, map(getitem, _LUTS, words), 0.0) * %r
+'''
+
+def leaf_ranges(tree):
+    """Number leaves left to right; return leaf values and each internal node's left-subtree leaf range"""
+    leaves = []
+    ranges = []
+
+    def walk(node):
+        if tree['left'][node] < 0:
+            leaves.append(tree['value'][node])
+            return
+        lo = len(leaves)
+        walk(tree['left'][node])
+        ranges.append((node, lo, len(leaves)))
+        walk(tree['right'][node])
+
+    walk(0)
+    return leaves, ranges
+
+def render_quickscorer(trees):
+    """Generate a QuickScorer evaluator module for the forest"""
+    leaf_values = []
+    tests = {}
+    for t, tree in enumerate(trees):
+        leaves, ranges = leaf_ranges(tree)
+        if len(leaves) > 128:
+            raise ValueError(f"tree {t} has {len(leaves)} leaves; QuickScorer slots hold 128")
+        leaf_values.append(leaves)
+        for node, lo, hi in ranges:
+            key = (tree['feature'][node], tree['threshold'][node])
+            tests.setdefault(key, []).append((t, lo, hi))
+
+    by_feature = {}
+    for (f, threshold), nodes in tests.items():
+        by_feature.setdefault(f, []).append((threshold, nodes))
+
+    n_nodes = sum(len(nodes) for nodes in tests.values())
+    lines = [
+        "# Auto-generated QuickScorer RandomForest model in pure Python",
+        "# No sklearn or external dependencies required",
+        f"# {len(trees)} trees, {n_nodes} split nodes, {len(tests)} distinct (feature, threshold) tests",
+        "",
+        "import struct",
+        "from bisect import bisect_left",
+        "from functools import reduce",
+        "from operator import add, getitem",
+        "",
+        "# feature index -> sorted distinct split thresholds",
+        "THRESHOLDS = {",
+    ]
+    for f in sorted(by_feature):
+        thresholds = sorted(threshold for threshold, _ in by_feature[f])
+        lines.append(f"    {f}: ({', '.join(repr(t) for t in thresholds)},),")
+    lines += [
+        "}",
+        "",
+        "# feature index -> for each threshold, the (tree, lo, hi) left-subtree leaf",
+        "# ranges ruled out when input[feature] is greater than that threshold",
+        "FALSE_NODES = {",
+    ]
+    for f in sorted(by_feature):
+        groups = [tuple(nodes) for _, nodes in sorted(by_feature[f])]
+        lines.append(f"    {f}: {tuple(groups)!r},")
+    lines += ["}", "", "# leaf values of each tree, left to right", "LEAF_VALUES = ("]
+    for leaves in leaf_values:
+        lines.append(f"    ({', '.join(repr(v) for v in leaves)},),")
+    lines.append(")")
+
+    code = "\n".join(lines) + "\n" + QUICKSCORER_RUNTIME % (1.0 / len(trees))
+    return code, n_nodes, len(tests)
+
+parser = argparse.ArgumentParser(description="Export rf_model.pkl for dependency-free evaluation")
+parser.add_argument('--backend', choices=['m2cgen', 'arrays', 'quickscorer'], default='m2cgen')
+args = parser.parse_args()
 
 print("Loading RandomForest model...")
 with open('rf_model.pkl', 'rb') as f:
@@ -29,6 +176,29 @@ print(f"  Features: {len(feature_cols)}")
 print(f"  Trees: {rf_model.n_estimators}")
 print(f"  Max depth: {rf_model.max_depth}")
 
+if args.backend == 'arrays':
+    forest = export_arrays(rf_model, feature_cols)
+    print(f"\n✅ Saved {forest.n_trees} trees ({forest.n_nodes} nodes) to rf_forest.bin")
+    print("   Evaluate with: python3 rf_forest.py 3 93 1.42")
+    sys.exit(0)
+
+if args.backend == 'quickscorer':
+    code, n_nodes, n_tests = render_quickscorer(extract_trees(rf_model))
+    with open('rf_quickscorer.py', 'w') as f:
+        f.write(code)
+    print(f"\n✅ Saved QuickScorer model to rf_quickscorer.py ({len(code)} bytes)")
+    print(f"   {n_nodes} split nodes share {n_tests} distinct (feature, threshold) tests")
+    print(f"   Drop-in replacement for rf_pure_python.score: from rf_quickscorer import score")
+    sys.exit(0)
+
+# First, install m2cgen if not available
+try:
+    import m2cgen as m2c
+except ImportError:
+    print("Installing m2cgen...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "m2cgen"])
+    import m2cgen as m2c
+
 # Convert to pure Python
 print("\nConverting to pure Python code...")
 code = m2c.export_to_python(rf_model)
@@ -115,41 +285,41 @@ def create_features(days, miles, receipts):
     return [features[name] for name in feature_names]
 ''' % repr(feature_cols)
 
-# Save feature engineering code
-with open('features_pure_python.py', 'w') as f:
-    f.write(feature_code)
-
-print("\n✅ Saved feature engineering to features_pure_python.py")
+# Save feature engineering for the in-repo evaluators; the shared builder lives in features.py
+from features import RF_FEATURES
+if tuple(feature_cols) != RF_FEATURES:
+    sys.exit("❌ rf_model.pkl was trained with a different column order than features.RF_FEATURES")
+pure_python_features = '''import math
 
-# Create the complete self-contained solution
-print("\nCreating self-contained run.sh...")
+from features import rf_features
 
-run_sh_content = '''#!/bin/bash
+def create_features(days, miles, receipts):
+    """Create all 38 features exactly as used in training"""
+    # libm log1p, as in the self-contained run scripts. It can differ from training's
+    # np.log1p in the last bit but never changes a split of the forest (see features.py)
+    return rf_features(days, miles, receipts, log1p=math.log1p)
+'''
+with open('features_pure_python.py', 'w') as f:
+    f.write(pure_python_features)
 
-# Black Box Legacy Reimbursement System - Self-Contained RandomForest Solution
-# Pure Python implementation with no external dependencies
-# Expected score: ~5364 (MAE ~$52.64)
+print("\n✅ Saved feature engineering to features_pure_python.py")
 
-if [ "$#" -ne 3 ]; then
-    echo "Usage: $0 <trip_duration_days> <miles_traveled> <total_receipts_amount>" >&2
-    exit 1
-fi
+# Create the self-contained solution: a stdlib-only module around the generated
+# forest, and a run script that imports it so the bytecode is cached between calls
+print("\nCreating self-contained rf_standalone.py and run_self_contained.sh...")
 
-if ! [[ "$1" =~ ^[0-9]+\\.?[0-9]*$ ]] || ! [[ "$2" =~ ^[0-9]+\\.?[0-9]*$ ]] || ! [[ "$3" =~ ^[0-9]+\\.?[0-9]*$ ]]; then
-    echo "Error: All arguments must be numeric" >&2
-    exit 1
-fi
+standalone_module = '''# Auto-generated by convert_rf_to_python.py: self-contained RandomForest solution
+# Standard library only; the forest itself is imported from rf_pure_python.py
+# Entry point of run_self_contained.sh and run_best_standalone.sh
 
-python3 - <<'PYTHON_CODE' "$1" "$2" "$3"
 import sys
 import math
 
+from rf_pure_python import score
+
 # ===== FEATURE ENGINEERING (must match training exactly) =====
 ''' + feature_code + '''
 
-# ===== PURE PYTHON RANDOM FOREST MODEL =====
-''' + code + '''
-
 # ===== MAIN PREDICTION FUNCTION =====
 def predict_reimbursement(days, miles, receipts):
     """Main prediction function with all adjustments"""
@@ -171,11 +341,12 @@ def predict_reimbursement(days, miles, receipts):
     return round(max(0.0, prediction), 2)
 
 # ===== ENTRY POINT =====
-if __name__ == "__main__":
+def main(argv):
+    """Print the prediction for argv = [days, miles, receipts]"""
     try:
-        days = int(sys.argv[1])
-        miles = float(sys.argv[2])
-        receipts = float(sys.argv[3])
+        days = int(argv[0])
+        miles = float(argv[1])
+        receipts = float(argv[2])
         
         result = predict_reimbursement(days, miles, receipts)
         print(f"{result:.2f}")
@@ -184,15 +355,47 @@ if __name__ == "__main__":
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-PYTHON_CODE
+if __name__ == "__main__":
+    main(sys.argv[1:])
+'''
+
+with open('rf_standalone.py', 'w') as f:
+    f.write(standalone_module)
+
+print("✅ Saved rf_standalone.py")
+
+run_sh_content = '''#!/bin/bash
+
+# Black Box Legacy Reimbursement System - Self-Contained RandomForest Solution
+# Pure Python implementation with no external dependencies
+# Expected score: ~5364 (MAE ~$52.64)
+
+if [ "$#" -ne 3 ]; then
+    echo "Usage: $0 <trip_duration_days> <miles_traveled> <total_receipts_amount>" >&2
+    exit 1
+fi
+
+if ! [[ "$1" =~ ^[0-9]+\\.?[0-9]*$ ]] || ! [[ "$2" =~ ^[0-9]+\\.?[0-9]*$ ]] || ! [[ "$3" =~ ^[0-9]+\\.?[0-9]*$ ]]; then
+    echo "Error: All arguments must be numeric" >&2
+    exit 1
+fi
+
+# Import (rather than run) rf_standalone.py so Python loads the forest from the
+# bytecode cached in __pycache__ (precompile with: python3 build_standalone.py)
+exec python3 -c 'import sys; sys.path.insert(0, sys.argv.pop(1)); import rf_standalone; rf_standalone.main(sys.argv[1:])' "$(dirname "$0")" "$1" "$2" "$3"
 '''
 
-with open('run_self_contained.sh', 'w') as f:
-    f.write(run_sh_content)
+for path in ('run_self_contained.sh', 'run_best_standalone.sh'):
+    with open(path, 'w') as f:
+        f.write(run_sh_content)
+
+from build_standalone import build
+for path in build():
+    print(f"✅ Compiled {path}")
 
-print("✅ Created run_self_contained.sh")
+print("✅ Created run_self_contained.sh and run_best_standalone.sh")
 print("\nNext steps:")
-print("1. chmod +x run_self_contained.sh")
+print("1. chmod +x run_self_contained.sh run_best_standalone.sh")
 print("2. Test with: ./run_self_contained.sh 3 93 1.42")
 print("3. Run full evaluation to verify score")
-print("4. Replace run.sh with this self-contained version") 
\ No newline at end of file
+print("4. Replace run.sh with this self-contained version")
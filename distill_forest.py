@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Distill the RandomForest into a compact standalone surrogate.
+
+The 100-tree forest (rf_forest.bin, the same trees as rf_pure_python.py)
+is the teacher: its raw score is computed for a dense synthetic grid of
+realistic trips (1-14 days, 0-1400 miles, $0-2600 of receipts with random,
+.49 and .99 cents) and every candidate surrogate is fitted to those scores:
+
+    trees N x depth D     N shallow gradient-boosted trees on days, miles,
+                          receipts, miles/day, receipts/day and the receipt
+                          cents (fitted with sklearn, evaluated without it)
+    table $B              a linear formula in the mileage tiers and receipts
+                          for every days x $B receipt band x .49/.99/other cell
+
+Each candidate's deviation from the forest is measured with exactly the
+arithmetic of the emitted code, on the grid, on the public and private case
+inputs and on random off-grid trips. The smallest candidate whose maximum
+and mean deviation are both within tolerance is written as a run_*.sh
+script in the usual standalone shape (the forest's .49/.99 bonus and
+rounding applied on top). If no candidate is within tolerance, nothing is
+written and the exit status is 1.
+
+Usage:
+    python3 distill_forest.py [--max-deviation 50] [--mean-deviation 10]
+                              [--step 20] [--out run_distilled.sh]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from case_store import columns
+from features import receipt_cents_batch, rf_feature_matrix
+from rf_forest import score_batch
+
+# Extent of the synthetic inputs, a little past the case files
+MAX_DAYS = 14
+MAX_MILES = 1400
+MAX_RECEIPTS = 2600
+
+# (trees, depth, learning rate) and table band widths in dollars
+TREE_CANDIDATES = ((10, 3, 0.5), (25, 4, 0.3), (50, 5, 0.2))
+TABLE_CANDIDATES = (200, 100)
+
+RANDOM_INPUTS = 20_000
+
+def synthetic_grid(step=20, seed=0):
+    """
+    (days, miles, receipts) over every day count and a step-dollar grid.
+    Every point appears three times: with random cents, .49 and .99, so the
+    rare receipt endings the forest treats specially are as dense as the rest.
+    """
+    rng = np.random.default_rng(seed)
+    days, miles, receipts = (a.ravel() for a in np.meshgrid(np.arange(1, MAX_DAYS + 1, dtype=np.float64),
+                                                            np.arange(0, MAX_MILES + 1, step, dtype=np.float64),
+                                                            np.arange(0, MAX_RECEIPTS + 1, step, dtype=np.float64),
+                                                            indexing='ij'))
+    cents = np.concatenate([rng.integers(0, 100, receipts.size), np.full(receipts.size, 49), np.full(receipts.size, 99)])
+    return np.tile(days, 3), np.tile(miles, 3), np.round(np.tile(receipts, 3) + cents / 100, 2)
+
+def random_inputs(n, seed=1):
+    """n random trips in the grid's range, off the grid"""
+    rng = np.random.default_rng(seed)
+    return (rng.integers(1, MAX_DAYS + 1, n).astype(np.float64),
+            rng.integers(0, MAX_MILES * 100 + 1, n) / 100,
+            rng.integers(0, MAX_RECEIPTS * 100 + 1, n) / 100)
+
+def teacher(days, miles, receipts):
+    """The forest's raw score, before the .49/.99 bonus and rounding"""
+    return score_batch(rf_feature_matrix(days, miles, receipts))
+
+def endings(receipts):
+    """Receipt cents 0-99, as f"{receipts:.2f}" ends"""
+    return receipt_cents_batch(receipts) % 100
+
+# The emitted scripts compute the same inputs from one trip
+SCALAR_INPUTS = '''
+def surrogate_inputs(days, miles, receipts):
+    cents = int(f"{receipts:.2f}"[-2:])
+    miles_per_day = miles / days if days > 0 else miles
+    receipts_per_day = receipts / days if days > 0 else receipts
+    return (days, miles, receipts, miles_per_day, receipts_per_day, cents)
+'''
+
+def surrogate_inputs(days, miles, receipts):
+    """The tree surrogate's input columns as an (N, 6) matrix"""
+    days_or_one = np.where(days > 0, days, 1.0)
+    return np.column_stack([days, miles, receipts,
+                            np.where(days > 0, miles / days_or_one, miles),
+                            np.where(days > 0, receipts / days_or_one, receipts),
+                            endings(receipts)]).astype(np.float64)
+
+class ShallowTrees:
+    """Gradient-boosted shallow trees with the learning rate folded into the leaf values"""
+
+    def __init__(self, base, trees, depth):
+        self.base = base
+        # (feature, threshold, left, right, value) lists per tree; leaves have left == -1
+        self.trees = trees
+        self.depth = depth
+
+    @classmethod
+    def fit(cls, days, miles, receipts, target, n_trees, depth, learning_rate):
+        from sklearn.ensemble import GradientBoostingRegressor
+
+        model = GradientBoostingRegressor(n_estimators=n_trees, max_depth=depth,
+                                          learning_rate=learning_rate, random_state=0)
+        model.fit(surrogate_inputs(days, miles, receipts), target)
+        trees = []
+        for estimator in model.estimators_[:, 0]:
+            tree = estimator.tree_
+            trees.append(([int(f) for f in tree.feature], [float(t) for t in tree.threshold],
+                          [int(c) for c in tree.children_left], [int(c) for c in tree.children_right],
+                          [float(v) * learning_rate for v in tree.value[:, 0, 0]]))
+        return cls(float(np.ravel(model.init_.constant_)[0]), trees, depth)
+
+    @property
+    def name(self):
+        return f"trees {len(self.trees)} x depth {self.depth}"
+
+    @property
+    def size(self):
+        """Stored numbers: nodes x (feature, threshold, children, value)"""
+        return sum(len(tree[0]) for tree in self.trees) * 5
+
+    def predict(self, days, miles, receipts):
+        X = surrogate_inputs(days, miles, receipts)
+        rows = np.arange(len(X))
+        total = np.full(len(X), self.base)
+        for feature, threshold, left, right, value in self.trees:
+            feature, threshold, value = np.array(feature), np.array(threshold), np.array(value)
+            # Leaves point at themselves so finished rows stay put
+            own = np.arange(len(feature))
+            left = np.where(np.array(left) < 0, own, left)
+            right = np.where(np.array(right) < 0, own, right)
+            node = np.zeros(len(X), dtype=np.intp)
+            for _ in range(self.depth):
+                node = np.where(X[rows, np.maximum(feature[node], 0)] <= threshold[node], left[node], right[node])
+            # One tree at a time, in the scalar code's summation order
+            total += value[node]
+        return total
+
+    def source(self):
+        lines = [SCALAR_INPUTS, f"BASE = {self.base!r}", "TREES = ("]
+        for tree in self.trees:
+            lines.append("    (" + ", ".join(f"({', '.join(repr(v) for v in column)},)" for column in tree) + "),")
+        lines.append(")")
+        lines.append('''
+def surrogate(days, miles, receipts):
+    x = surrogate_inputs(days, miles, receipts)
+    total = BASE
+    for feature, threshold, left, right, value in TREES:
+        node = 0
+        while left[node] >= 0:
+            node = left[node] if x[feature[node]] <= threshold[node] else right[node]
+        total += value[node]
+    return total
+''')
+        return "\n".join(lines)
+
+class BandTable:
+    """Per days x receipt band x ending cell: a + b1*tier1 + b2*tier2 + b3*tier3 + c*receipts"""
+
+    def __init__(self, band, coefficients):
+        self.band = band
+        self.n_bands = MAX_RECEIPTS // band + 1
+        # (a, b1, b2, b3, c) per cell
+        self.coefficients = coefficients
+
+    def cells(self, days, receipts):
+        """Cell index of every trip"""
+        day = np.clip(days, 1, MAX_DAYS).astype(np.intp) - 1
+        band = np.minimum(receipts // self.band, self.n_bands - 1).astype(np.intp)
+        cents = endings(receipts)
+        ending = np.where(cents == 49, 1, np.where(cents == 99, 2, 0))
+        return (day * self.n_bands + band) * 3 + ending
+
+    @staticmethod
+    def design(miles, receipts):
+        return np.column_stack([np.ones_like(miles), np.minimum(miles, 100.0),
+                                np.minimum(np.maximum(miles - 100, 0.0), 300.0),
+                                np.maximum(miles - 400, 0.0), receipts])
+
+    @classmethod
+    def fit(cls, days, miles, receipts, target, band):
+        table = cls(band, None)
+        cells = table.cells(days, receipts)
+        A = cls.design(miles, receipts)
+        coefficients = np.zeros((MAX_DAYS * table.n_bands * 3, A.shape[1]))
+        order = np.argsort(cells, kind='stable')
+        bounds = np.flatnonzero(np.diff(cells[order])) + 1
+        for idx in np.split(order, bounds):
+            coefficients[cells[idx[0]]] = np.linalg.lstsq(A[idx], target[idx], rcond=None)[0]
+        table.coefficients = [tuple(float(c) for c in row) for row in coefficients]
+        return table
+
+    @property
+    def name(self):
+        return f"table ${self.band} bands"
+
+    @property
+    def size(self):
+        return len(self.coefficients) * 5
+
+    def predict(self, days, miles, receipts):
+        a, b1, b2, b3, c = np.array(self.coefficients)[self.cells(days, receipts)].T
+        # Same operations in the same order as the scalar code
+        return (a + b1 * np.minimum(miles, 100.0) + b2 * np.minimum(np.maximum(miles - 100, 0.0), 300.0)
+                + b3 * np.maximum(miles - 400, 0.0) + c * receipts)
+
+    def source(self):
+        rows = "\n".join(f"    ({', '.join(repr(c) for c in row)})," for row in self.coefficients)
+        return f'''
+BAND = {self.band!r}
+N_BANDS = {self.n_bands}
+TABLE = (
+{rows}
+)
+
+def surrogate(days, miles, receipts):
+    day = min(max(int(days), 1), {MAX_DAYS}) - 1
+    band = min(int(receipts // BAND), N_BANDS - 1)
+    cents = f"{{receipts:.2f}}"[-2:]
+    ending = 1 if cents == "49" else 2 if cents == "99" else 0
+    a, b1, b2, b3, c = TABLE[(day * N_BANDS + band) * 3 + ending]
+    return (a + b1 * min(miles, 100.0) + b2 * min(max(miles - 100, 0.0), 300.0)
+            + b3 * max(miles - 400, 0.0) + c * receipts)
+'''
+
+def fit_candidates(days, miles, receipts, target):
+    """Every candidate surrogate fitted to the teacher's scores, smallest first"""
+    candidates = [ShallowTrees.fit(days, miles, receipts, target, *spec) for spec in TREE_CANDIDATES]
+    candidates += [BandTable.fit(days, miles, receipts, target, band) for band in TABLE_CANDIDATES]
+    return sorted(candidates, key=lambda candidate: candidate.size)
+
+def post_process(receipts, raw):
+    """The forest's .49/.99 bonus and rounding, as in rf_forest.predict_batch"""
+    bonus = np.isin(endings(receipts), (49, 99))
+    return np.array([round(max(0.0, p), 2) for p in (raw + np.where(bonus, 5.01, 0.0)).tolist()])
+
+RUN_SCRIPT = '''#!/bin/bash
+
+# Black Box Legacy Reimbursement System - Distilled RandomForest Surrogate
+# {name}, fitted to the 100-tree forest's predictions (distill_forest.py)
+# Deviation from the forest: max ${max_deviation:.2f}, mean ${mean_deviation:.2f} over {inputs} inputs
+
+# Validate arguments
+if [ "$#" -ne 3 ]; then
+    echo "Usage: $0 <trip_duration_days> <miles_traveled> <total_receipts_amount>" >&2
+    exit 1
+fi
+
+# Input validation
+if ! [[ "$1" =~ ^[0-9]+\\.?[0-9]*$ ]] || ! [[ "$2" =~ ^[0-9]+\\.?[0-9]*$ ]] || ! [[ "$3" =~ ^[0-9]+\\.?[0-9]*$ ]]; then
+    echo "Error: All arguments must be numeric" >&2
+    exit 1
+fi
+
+exec python3 -c '
+import sys
+{source}
+def predict_reimbursement(days, miles, receipts):
+    prediction = surrogate(days, miles, receipts)
+
+    # Rounding bug bonus - discovered in analysis
+    receipt_str = f"{{receipts:.2f}}"
+    if receipt_str.endswith(("49", "99")):
+        prediction += 5.01
+
+    # Ensure non-negative and round to cents
+    return round(max(0.0, prediction), 2)
+
+try:
+    result = predict_reimbursement(int(sys.argv[1]), float(sys.argv[2]), float(sys.argv[3]))
+    print(f"{{result:.2f}}")
+except ValueError as e:
+    print(f"Error: {{e}}", file=sys.stderr)
+    sys.exit(1)
+' "$1" "$2" "$3"
+'''
+
+def render(candidate, max_deviation, mean_deviation, inputs):
+    """The run_*.sh script for a surrogate"""
+    source = candidate.source()
+    if "'" in source:
+        raise ValueError("surrogate source must not contain single quotes")
+    return RUN_SCRIPT.format(name=candidate.name, source=source, max_deviation=max_deviation,
+                             mean_deviation=mean_deviation, inputs=inputs)
+
+def check_source(candidate, days, miles, receipts):
+    """The emitted scalar code must reproduce predict() exactly"""
+    namespace = {}
+    exec(candidate.source(), namespace)
+    scalar = [namespace['surrogate'](int(d), m, r) for d, m, r in zip(days.tolist(), miles.tolist(), receipts.tolist())]
+    if scalar != candidate.predict(days, miles, receipts).tolist():
+        raise RuntimeError(f"emitted code for {candidate.name} disagrees with its batch evaluation")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Distill the RandomForest into a compact standalone surrogate")
+    parser.add_argument('--max-deviation', type=float, default=50.0,
+                        help="largest allowed |surrogate - forest| in dollars (default: 50)")
+    parser.add_argument('--mean-deviation', type=float, default=10.0,
+                        help="largest allowed mean |surrogate - forest| in dollars (default: 10)")
+    parser.add_argument('--step', type=int, default=20, help="grid step in miles and dollars (default: 20)")
+    parser.add_argument('--out', default='run_distilled.sh', help="run script to write (default: run_distilled.sh)")
+    args = parser.parse_args()
+
+    started = time.time()
+    grid = synthetic_grid(args.step)
+    cases = [np.concatenate(column) for column in zip(*(columns(path)[:3] for path in
+                                                       ('public_cases.json', 'private_cases.json')))]
+    held_out = random_inputs(RANDOM_INPUTS)
+    sets = (('grid', grid), ('cases', cases), ('random', held_out))
+    targets = {name: teacher(*inputs) for name, inputs in sets}
+    print(f"Teacher: forest scores for {len(targets['grid'])} grid, {len(targets['cases'])} case "
+          f"and {len(targets['random'])} random inputs ({time.time() - started:.1f}s)")
+
+    days, miles, receipts, expected = columns('public_cases.json')
+    print(f"{'candidate':<24}{'size':>8}   {'max / mean deviation ($)':<42}{'public MAE':>11}")
+    print(f"{'':<24}{'':>8}   {'grid':<14}{'cases':<14}{'random':<14}")
+    chosen = None
+    for candidate in fit_candidates(*grid, targets['grid']):
+        deviations = {name: np.abs(candidate.predict(*inputs) - targets[name]) for name, inputs in sets}
+        worst = max(d.max() for d in deviations.values())
+        mean = np.concatenate(list(deviations.values())).mean()
+        mae = np.abs(post_process(receipts, candidate.predict(days, miles, receipts)) - expected).mean()
+        passes = worst <= args.max_deviation and mean <= args.mean_deviation
+        print(f"{candidate.name:<24}{candidate.size:>8}   "
+              + "".join(f"{d.max():>6.1f} /{d.mean():>5.1f}  " for d in deviations.values())
+              + f"{mae:>9.2f}  {'✅' if passes else '❌'}", flush=True)
+        if passes and chosen is None:
+            chosen = candidate, worst, mean
+
+    forest_mae = np.abs(post_process(receipts, teacher(days, miles, receipts)) - expected).mean()
+    print(f"Full forest public MAE: {forest_mae:.2f}")
+    if chosen is None:
+        print(f"❌ No surrogate within max ${args.max_deviation:.2f} / mean ${args.mean_deviation:.2f} "
+              f"of the forest; nothing written", file=sys.stderr)
+        sys.exit(1)
+
+    candidate, worst, mean = chosen
+    check_source(candidate, *cases)
+    script = render(candidate, worst, mean, sum(len(t) for t in targets.values()))
+    with open(args.out, 'w') as f:
+        f.write(script)
+    os.chmod(args.out, 0o755)
+    print(f"✅ Wrote {args.out} ({candidate.name}, {len(script)} bytes) in {time.time() - started:.0f}s")
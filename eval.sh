@@ -5,6 +5,10 @@
 
 set -e
 
+# Number of cases to run concurrently: ./eval.sh -j 8 (or EVAL_JOBS=8); -j 0 uses every core
+source "$(dirname "$0")/case_runner.sh"
+parse_jobs "$@"
+
 echo "🧾 Black Box Challenge - Reimbursement System Evaluation"
 echo "======================================================="
 echo
@@ -72,6 +76,13 @@ max_error_case=""
 results_array=()
 errors_array=()
 
+# With more than one job, run every case up front through a pool of workers
+# (case_runner.sh); run_case then picks up each result in case order
+if [ "$jobs" -gt 1 ]; then
+    echo "Running $num_cases cases with $jobs parallel workers..." >&2
+fi
+start_workers eval
+
 # Process each test case
 for ((i=0; i<num_cases; i++)); do
     if [ $((i % 100)) -eq 0 ]; then
@@ -82,7 +93,7 @@ for ((i=0; i<num_cases; i++)); do
     IFS=':' read -r trip_duration miles_traveled receipts_amount expected <<< "${test_cases[i]}"
     
     # Run the user's implementation
-    if script_output=$(./run.sh "$trip_duration" "$miles_traveled" "$receipts_amount" 2>/dev/null); then
+    if run_case "$i" "$trip_duration" "$miles_traveled" "$receipts_amount"; then
         # Check if output is a valid number
         output=$(echo "$script_output" | tr -d '[:space:]')
         if [[ $output =~ ^-?[0-9]+\.?[0-9]*$ ]]; then
@@ -119,8 +130,6 @@ for ((i=0; i<num_cases; i++)); do
             errors_array+=("Case $((i+1)): Invalid output format: $output")
         fi
     else
-        # Capture stderr for error reporting
-        error_msg=$(./run.sh "$trip_duration" "$miles_traveled" "$receipts_amount" 2>&1 >/dev/null | tr -d '\n')
         errors_array+=("Case $((i+1)): Script failed with error: $error_msg")
     fi
 done
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+In-process replacement for eval.sh.
+
+eval.sh forks ./run.sh once per case and bc up to four more times to score
+it. This evaluator imports a model's entry point instead and computes the
+same metrics in one pass: exact matches (within $0.01), close matches
+(within $1.00), average and maximum error, the score
+`avg_error * 100 + (N - exact) * 0.1` and the five worst cases.
+
+The report is printed in eval.sh's exact format. Arithmetic is done with
+Decimal following bc's rules (errors keep the scale of their operands,
+`scale=2` / `scale=1` divisions truncate, numbers below one print without
+a leading zero), and model outputs are formatted to two decimals like the
+run scripts print them.
+
+A model is any callable `f(days, miles, receipts)` returning the
+reimbursement, named as `module:function` or `path/to/file.py:function`,
+or a run script (`run_final.sh`) that is called once per case like
+eval.sh does.
+
+Per-case results are kept in the result store (see result_store.py), so
+re-evaluating an unchanged model runs nothing. `--changed EXPR` declares
+which inputs an edit can affect; only those cases are run again and the
+rest are taken from the model's previous evaluation.
+
+Usage:
+    python3 evaluate.py [MODEL] [--cases public_cases.json] [--changed EXPR] [--no-store]
+    python3 evaluate.py rf_forest:predict_reimbursement
+    python3 evaluate.py run_final.sh --changed "days == 5"
+    python3 evaluate.py model_registry:ultimate
+"""
+
+import argparse
+import heapq
+import importlib
+import importlib.util
+import inspect
+import os
+import re
+import subprocess
+import sys
+from decimal import Decimal, ROUND_DOWN
+
+from case_reader import chunked, count_cases, iter_cases
+from result_store import ResultStore, compile_region, fingerprint
+
+DEFAULT_MODEL = 'predict_optimized:calculate_reimbursement'
+NUMBER = re.compile(r'^-?[0-9]+\.?[0-9]*$')
+WORST_CASES_SHOWN = 5
+MAX_ERRORS_SHOWN = 10
+
+class ScriptError(Exception):
+    """A run script exited with a non-zero status"""
+
+def script_model(path):
+    """Call a run script once per case, passing the inputs as eval.sh would"""
+    path = os.path.abspath(path)
+
+    def predict(days, miles, receipts):
+        proc = subprocess.run([path, jq_number(days), jq_number(miles), jq_number(receipts)],
+                              capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise ScriptError(proc.stderr.replace('\n', ''))
+        return proc.stdout
+    return predict
+
+def load_entry_point(spec):
+    """Resolve 'module:function', 'file.py:function' or 'run_script.sh' to a callable"""
+    if spec.endswith('.sh'):
+        return script_model(spec)
+    target, _, name = spec.rpartition(':')
+    if not target or not name:
+        raise ValueError(f"model must look like module:function, got {spec!r}")
+    if target.endswith('.py'):
+        module_name = os.path.splitext(os.path.basename(target))[0]
+        module_spec = importlib.util.spec_from_file_location(module_name, target)
+        module = importlib.util.module_from_spec(module_spec)
+        module_spec.loader.exec_module(module)
+    else:
+        module = importlib.import_module(target)
+    return getattr(module, name)
+
+def entry_point_file(spec, predict):
+    """The file that defines a model, for fingerprinting"""
+    if spec.endswith('.sh'):
+        return spec
+    # Registry models (model_registry.py) name the run script they came from
+    return getattr(predict, 'source_file', None) or inspect.getsourcefile(predict)
+
+def jq_number(value):
+    """Render a JSON number the way `jq -r` prints it, as eval.sh sees it"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+def bc_str(value):
+    """Render a Decimal the way bc prints it"""
+    if value == 0:
+        return '0'
+    text = format(value, 'f')
+    if text.startswith('0.'):
+        return text[1:]
+    if text.startswith('-0.'):
+        return '-' + text[2:]
+    return text
+
+def truncate(value, places):
+    """bc division result at `scale=places`"""
+    return value.quantize(Decimal(1).scaleb(-places), rounding=ROUND_DOWN)
+
+def case_fields(case):
+    """(days, miles, receipts, expected) as the strings jq extracts for eval.sh"""
+    trip = case['input']
+    return (jq_number(trip['trip_duration_days']), jq_number(trip['miles_traveled']),
+            jq_number(trip['total_receipts_amount']), jq_number(case['expected_output']))
+
+def format_output(result):
+    """What a run script would print for this return value"""
+    if isinstance(result, str):
+        return ''.join(result.split())
+    return f"{result:.2f}"
+
+def run_case(predict, days, miles, receipts):
+    """Call the model like run.sh would; return (output string, None) or (None, error message)"""
+    try:
+        result = predict(int(days), float(miles), float(receipts))
+    except ScriptError as e:
+        return None, str(e)
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+    return format_output(result), None
+
+def _worst_key(result):
+    """eval.sh's `sort -t: -k4 -nr` order: by error, ties broken by the whole line"""
+    case_num, expected, actual, error, days, miles, receipts = result
+    return error, f"{case_num}:{expected}:{actual}:{bc_str(error)}:{days}:{miles}:{receipts}".encode()
+
+def evaluate(outcomes):
+    """
+    Score model outputs against the cases with eval.sh's arithmetic.
+
+    `outcomes` yields one (case, (output string, error message)) pair per
+    case, in case order. Only the worst cases and the first errors are
+    kept, so memory does not grow with the number of cases. Returns a dict
+    with every metric eval.sh reports.
+    """
+    num_cases = successful = exact = close = 0
+    total_error = Decimal(0)
+    max_error = Decimal(0)
+    max_error_case = ''
+    worst = []
+    errors = []
+    error_count = 0
+
+    for i, (case, (output, failure)) in enumerate(outcomes):
+        num_cases += 1
+        days, miles, receipts, expected = case_fields(case)
+        if failure is not None or not NUMBER.match(output):
+            if len(errors) < MAX_ERRORS_SHOWN:
+                if failure is not None:
+                    errors.append(f"Case {i + 1}: Script failed with error: {failure}")
+                else:
+                    errors.append(f"Case {i + 1}: Invalid output format: {output}")
+            error_count += 1
+            continue
+
+        error = abs(Decimal(output) - Decimal(expected))
+        result = (i + 1, expected, output, error, days, miles, receipts)
+        entry = (_worst_key(result), result)
+        if len(worst) < WORST_CASES_SHOWN:
+            heapq.heappush(worst, entry)
+        elif entry[0] > worst[0][0]:
+            heapq.heapreplace(worst, entry)
+        successful += 1
+        if error < Decimal('0.01'):
+            exact += 1
+        if error < Decimal('1.0'):
+            close += 1
+        total_error += error
+        if error > max_error:
+            max_error = error
+            max_error_case = f"Case {i + 1}: {days} days, {miles} miles, ${receipts} receipts"
+
+    summary = {
+        'num_cases': num_cases,
+        'successful_runs': successful,
+        'exact_matches': exact,
+        'close_matches': close,
+        'total_error': total_error,
+        'max_error': max_error,
+        'max_error_case': max_error_case,
+        'worst_cases': [result for _, result in sorted(worst, reverse=True)],
+        'errors': errors,
+        'error_count': error_count,
+    }
+    if successful:
+        avg_error = truncate(total_error / successful, 2)
+        summary['avg_error'] = avg_error
+        summary['exact_pct'] = truncate(Decimal(exact * 100) / successful, 1)
+        summary['close_pct'] = truncate(Decimal(close * 100) / successful, 1)
+        summary['score'] = avg_error * 100 + Decimal(num_cases - exact) * Decimal('0.1')
+    return summary
+
+def report(summary, out=sys.stdout):
+    """Print the results exactly as eval.sh does"""
+    w = lambda text='': print(text, file=out)
+    num_cases = summary['num_cases']
+    exact = summary['exact_matches']
+
+    if summary['successful_runs'] == 0:
+        w("❌ No successful test cases!")
+        w("")
+        w("Your script either:")
+        w("  - Failed to run properly")
+        w("  - Produced invalid output format")
+        w("  - Timed out on all cases")
+        w("")
+        w("Check the errors below for details.")
+    else:
+        w("✅ Evaluation Complete!")
+        w("")
+        w("📈 Results Summary:")
+        w(f"  Total test cases: {num_cases}")
+        w(f"  Successful runs: {summary['successful_runs']}")
+        w(f"  Exact matches (±$0.01): {exact} ({bc_str(summary['exact_pct'])}%)")
+        w(f"  Close matches (±$1.00): {summary['close_matches']} ({bc_str(summary['close_pct'])}%)")
+        w(f"  Average error: ${bc_str(summary['avg_error'])}")
+        w(f"  Maximum error: ${bc_str(summary['max_error'])}")
+        w("")
+        w(f"🎯 Your Score: {bc_str(summary['score'])} (lower is better)")
+        w("")
+
+        if exact == num_cases:
+            w("🏆 PERFECT SCORE! You have reverse-engineered the system completely!")
+        elif exact > 950:
+            w("🥇 Excellent! You are very close to the perfect solution.")
+        elif exact > 800:
+            w("🥈 Great work! You have captured most of the system behavior.")
+        elif exact > 500:
+            w("🥉 Good progress! You understand some key patterns.")
+        else:
+            w("📚 Keep analyzing the patterns in the interviews and test cases.")
+
+        w("")
+        w("💡 Tips for improvement:")
+        if exact < num_cases:
+            w("  Check these high-error cases:")
+            for case_num, expected, actual, error, days, miles, receipts in summary['worst_cases']:
+                w(f"    Case {case_num}: {days} days, {miles} miles, ${receipts} receipts")
+                w(f"      Expected: ${Decimal(expected):.2f}, Got: ${Decimal(actual):.2f}, Error: ${error:.2f}")
+
+    error_count = summary['error_count']
+    if error_count:
+        w()
+        w("⚠️  Errors encountered:")
+        for message in summary['errors']:
+            w(f"  {message}")
+        if error_count > MAX_ERRORS_SHOWN:
+            w(f"  ... and {error_count - MAX_ERRORS_SHOWN} more errors")
+
+    w()
+    w("📝 Next steps:")
+    w("  1. Fix any script errors shown above")
+    w("  2. Ensure your run.sh outputs only a number")
+    w("  3. Analyze the patterns in the interviews and public cases")
+    w("  4. Test edge cases around trip length and receipt amounts")
+    w("  5. Submit your solution via the Google Form when ready!")
+
+def model_outputs(predict, cases, num_cases):
+    """Run the model over every case in order, reporting progress like eval.sh"""
+    for i, case in enumerate(cases):
+        if i % 100 == 0:
+            print(f"Progress: {i}/{num_cases} cases processed...", file=sys.stderr)
+        days, miles, receipts, _ = case_fields(case)
+        yield case, run_case(predict, days, miles, receipts)
+
+def stored_outputs(store, spec, predict, cases_path, cases, num_cases, region=None):
+    """
+    model_outputs() through the result store: only cases without a valid
+    stored result are run, and the new results are recorded.
+
+    With a region predicate, cases outside it reuse the results of the
+    model's previous evaluation on the same cases file. Cases are looked up
+    and saved a chunk at a time.
+    """
+    model = f"{spec}@{os.path.abspath(cases_path)}"
+    key = fingerprint(entry_point_file(spec, predict), cases_path)
+    base = store.previous(model)
+    if region is None or base == key:
+        base = None
+
+    reused = ran = 0
+    start = 0
+    for chunk in chunked(cases):
+        stop = start + len(chunk)
+        stored = store.results(key, start, stop)
+        previous = store.results(base, start, stop) if base else {}
+        new = {}
+        for i, case in enumerate(chunk, start):
+            if i % 100 == 0:
+                print(f"Progress: {i}/{num_cases} cases processed...", file=sys.stderr)
+            result = stored.get(i)
+            if result is None and i in previous:
+                trip = case['input']
+                if not region(trip['trip_duration_days'], trip['miles_traveled'],
+                              trip['total_receipts_amount']):
+                    result = new[i] = previous[i]
+            if result is None:
+                days, miles, receipts, _ = case_fields(case)
+                result = new[i] = run_case(predict, days, miles, receipts)
+                ran += 1
+            else:
+                reused += 1
+            yield case, result
+        store.add(key, new)
+        start = stop
+
+    store.finish(model, key)
+    print(f"Result store: reused {reused} results, ran {ran} cases", file=sys.stderr)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate a model entry point in-process, like eval.sh")
+    parser.add_argument('model', nargs='?', default=DEFAULT_MODEL,
+                        help=f"module:function or file.py:function (default: {DEFAULT_MODEL})")
+    parser.add_argument('--cases', default='public_cases.json', help="cases with expected outputs")
+    parser.add_argument('--changed', metavar='EXPR',
+                        help="only re-run cases matching this region, e.g. \"days == 5\" or "
+                             "\"ending in ('49', '99')\"")
+    parser.add_argument('--no-store', action='store_true', help="run every case, bypassing the result store")
+    args = parser.parse_args()
+
+    predict = load_entry_point(args.model)
+    region = compile_region(args.changed) if args.changed else None
+    store = None if args.no_store else ResultStore.from_env()
+    # A counting pass first, so the header and progress can show the total without holding every case
+    num_cases = count_cases(args.cases)
+
+    print("🧾 Black Box Challenge - Reimbursement System Evaluation")
+    print("=======================================================")
+    print()
+    print(f"📊 Running evaluation against {num_cases:,} test cases...")
+    print()
+    print("Extracting test data...")
+
+    cases = iter_cases(args.cases)
+    if store is None:
+        summary = evaluate(model_outputs(predict, cases, num_cases))
+    else:
+        summary = evaluate(stored_outputs(store, args.model, predict, args.cases, cases, num_cases, region))
+        store.close()
+    report(summary)
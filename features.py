@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Feature engineering for the tree models, in one place.
+
+Two feature sets are in use, each emitted in the column order the models
+were trained with:
+    RF_FEATURES        38 columns   rf_model.pkl, rf_pure_python.py, rf_forest.bin
+                                    (create_rf_model.py)
+    ENHANCED_FEATURES  62 columns   optimized_model.pkl (optimize_further.py)
+
+Each set has a scalar path for one trip (rf_features / enhanced_features,
+a list of floats) and a NumPy batch path for arrays of trips
+(rf_feature_matrix / enhanced_feature_matrix, an (N, k) float64 matrix).
+Both reproduce the training code's arithmetic bit for bit:
+
+- log1p is NumPy's, as in training. libm's math.log1p rounds differently
+  from NumPy's SIMD log1p for many inputs.
+- Powers use Python's float `**` (C pow), element by element in the batch
+  path. Neither `x * x` nor NumPy's vectorized power always agrees with it.
+- The receipt digit features come from integer cents instead of
+  formatting f"{receipts:.2f}" per row. Amounts within a hair of half a
+  cent, where the float product could round the other way, fall back to
+  the formatting.
+
+`python3 features.py --check` compares the batch path with the scalar path
+over the public and private cases and a dense input grid.
+"""
+
+import math
+import sys
+
+RF_FEATURES = (
+    'days', 'miles', 'receipts', 'miles_per_day', 'receipts_per_day', 'total_input',
+    'is_1_day', 'is_2_day', 'is_3_day', 'is_4_day', 'is_5_day', 'is_weekend',
+    'log_receipts', 'sqrt_receipts', 'receipts_squared', 'receipts_cubed',
+    'ends_49', 'ends_99', 'ends_00', 'last_digit', 'second_last_digit',
+    'tier1_miles', 'tier2_miles', 'tier3_miles',
+    'efficiency_bonus', 'high_efficiency', 'low_efficiency',
+    'low_spend', 'medium_spend', 'high_spend', 'very_high_spend',
+    'days_x_miles', 'days_x_receipts', 'miles_x_receipts', 'efficiency_x_receipts',
+    'miles_to_receipts', 'receipts_to_miles', 'days_to_miles',
+)
+
+ENHANCED_FEATURES = (
+    'days', 'miles', 'receipts', 'miles_per_day', 'receipts_per_day', 'total_input',
+    *(f'is_{d}_day' for d in range(1, 15)),
+    'log_receipts', 'sqrt_receipts', 'receipts_squared', 'receipts_cubed',
+    'ends_49', 'ends_99', 'ends_00',
+    *(f'last_digit_{d}' for d in range(10)),
+    'ends_49_x_receipts', 'ends_99_x_receipts', 'ends_49_x_log_receipts', 'ends_99_x_log_receipts',
+    'tier1_miles', 'tier2_miles', 'tier3_miles', 'miles_squared', 'log_miles', 'sqrt_miles',
+    'efficiency_bonus', 'efficiency_penalty',
+    'very_low_spend', 'low_spend', 'medium_spend', 'high_spend', 'very_high_spend', 'extreme_spend',
+    'days_squared', 'days_x_miles_squared', 'days_squared_x_miles', 'days_x_receipts_squared',
+    'receipts_to_total', 'miles_to_total', 'days_to_total',
+)
+
+# |receipts * 100 - (n + 0.5)| below this is settled by formatting instead
+HALF_CENT_TOLERANCE = 1e-6
+
+def _np_log1p(x):
+    from numpy import log1p
+    return float(log1p(x))
+
+def receipt_cents(receipts):
+    """Receipts in whole cents: the digits of f"{receipts:.2f}" as an integer"""
+    scaled = abs(receipts) * 100
+    if abs(scaled - math.floor(scaled) - 0.5) < HALF_CENT_TOLERANCE:
+        return abs(int(f"{receipts:.2f}".replace('.', '')))
+    return int(math.floor(scaled + 0.5))
+
+def rf_features(days, miles, receipts, log1p=_np_log1p):
+    """The 38 RF_FEATURES for one trip, in column order"""
+    days, miles, receipts = float(days), float(miles), float(receipts)
+    mpd = miles / days if days > 0 else miles
+    rpd = receipts / days if days > 0 else receipts
+    cents = receipt_cents(receipts)
+    ending = cents % 100
+    return [
+        days, miles, receipts, mpd, rpd, days + miles + receipts,
+        float(days == 1), float(days == 2), float(days == 3), float(days == 4), float(days == 5),
+        float(days in (2, 3)),
+        log1p(receipts), math.sqrt(receipts), receipts ** 2, receipts ** 3,
+        float(ending == 49), float(ending == 99), float(ending == 0),
+        float(cents % 10), float(cents // 10 % 10),
+        min(miles, 100.0), max(0.0, min(miles - 100, 300.0)), max(0.0, miles - 400),
+        float(180 <= mpd <= 220), float(mpd > 200), float(mpd < 50),
+        float(rpd < 100), float(100 <= rpd < 300), float(300 <= rpd < 500), float(rpd >= 500),
+        days * miles, days * receipts, miles * receipts, mpd * receipts,
+        miles / (receipts + 1), receipts / (miles + 1), days / (miles + 1),
+    ]
+
+def enhanced_features(days, miles, receipts, log1p=_np_log1p):
+    """The 62 ENHANCED_FEATURES for one trip, in column order"""
+    days, miles, receipts = float(days), float(miles), float(receipts)
+    mpd = miles / days if days > 0 else miles
+    rpd = receipts / days if days > 0 else receipts
+    cents = receipt_cents(receipts)
+    ending = cents % 100
+    ends_49, ends_99 = float(ending == 49), float(ending == 99)
+    log_receipts = log1p(receipts)
+    total = days + miles + receipts + 1
+    return [
+        days, miles, receipts, mpd, rpd, days + miles + receipts,
+        *(float(days == d) for d in range(1, 15)),
+        log_receipts, math.sqrt(receipts), receipts ** 2, receipts ** 3,
+        ends_49, ends_99, float(ending == 0),
+        *(float(cents % 10 == d) for d in range(10)),
+        ends_49 * receipts, ends_99 * receipts, ends_49 * log_receipts, ends_99 * log_receipts,
+        min(miles, 100.0), max(0.0, min(miles - 100, 300.0)), max(0.0, miles - 400),
+        miles ** 2, log1p(miles), math.sqrt(miles),
+        float(180 <= mpd <= 220), float(mpd > 300),
+        float(rpd < 50), float(50 <= rpd < 100), float(100 <= rpd < 300), float(300 <= rpd < 500),
+        float(rpd >= 500), float(rpd >= 700),
+        days ** 2, days * miles ** 2, days ** 2 * miles, days * receipts ** 2,
+        receipts / total, miles / total, days / total,
+    ]
+
+def receipt_cents_batch(receipts):
+    """receipt_cents() over an array"""
+    import numpy as np
+
+    receipts = np.asarray(receipts, dtype=np.float64)
+    scaled = np.abs(receipts) * 100
+    cents = np.floor(scaled + 0.5).astype(np.int64)
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < HALF_CENT_TOLERANCE
+    for i in np.flatnonzero(near_half):
+        cents[i] = receipt_cents(float(receipts[i]))
+    return cents
+
+def _pow(x, exponent):
+    """Python's float ** applied element-wise, to match the scalar path bit for bit"""
+    import numpy as np
+    return np.fromiter((v ** exponent for v in x.tolist()), dtype=np.float64, count=len(x))
+
+def _inputs(days, miles, receipts):
+    import numpy as np
+    days, miles, receipts = (np.asarray(a, dtype=np.float64).ravel() for a in (days, miles, receipts))
+    if not len(days) == len(miles) == len(receipts):
+        raise ValueError("days, miles and receipts must have the same length")
+    mpd = np.divide(miles, days, out=miles.copy(), where=days > 0)
+    rpd = np.divide(receipts, days, out=receipts.copy(), where=days > 0)
+    return days, miles, receipts, mpd, rpd
+
+def rf_feature_matrix(days, miles, receipts):
+    """RF_FEATURES for arrays of trips as an (N, 38) float64 matrix"""
+    import numpy as np
+
+    days, miles, receipts, mpd, rpd = _inputs(days, miles, receipts)
+    cents = receipt_cents_batch(receipts)
+    ending = cents % 100
+    columns = [
+        days, miles, receipts, mpd, rpd, days + miles + receipts,
+        days == 1, days == 2, days == 3, days == 4, days == 5, (days == 2) | (days == 3),
+        np.log1p(receipts), np.sqrt(receipts), _pow(receipts, 2), _pow(receipts, 3),
+        ending == 49, ending == 99, ending == 0, cents % 10, cents // 10 % 10,
+        np.minimum(miles, 100.0), np.maximum(0.0, np.minimum(miles - 100, 300.0)),
+        np.maximum(0.0, miles - 400),
+        (180 <= mpd) & (mpd <= 220), mpd > 200, mpd < 50,
+        rpd < 100, (100 <= rpd) & (rpd < 300), (300 <= rpd) & (rpd < 500), rpd >= 500,
+        days * miles, days * receipts, miles * receipts, mpd * receipts,
+        miles / (receipts + 1), receipts / (miles + 1), days / (miles + 1),
+    ]
+    return np.column_stack(columns).astype(np.float64, copy=False)
+
+def enhanced_feature_matrix(days, miles, receipts):
+    """ENHANCED_FEATURES for arrays of trips as an (N, 62) float64 matrix"""
+    import numpy as np
+
+    days, miles, receipts, mpd, rpd = _inputs(days, miles, receipts)
+    cents = receipt_cents_batch(receipts)
+    ending = cents % 100
+    last_digit = cents % 10
+    ends_49, ends_99 = (ending == 49).astype(np.float64), (ending == 99).astype(np.float64)
+    log_receipts = np.log1p(receipts)
+    total = days + miles + receipts + 1
+    columns = [
+        days, miles, receipts, mpd, rpd, days + miles + receipts,
+        *(days == d for d in range(1, 15)),
+        log_receipts, np.sqrt(receipts), _pow(receipts, 2), _pow(receipts, 3),
+        ends_49, ends_99, ending == 0,
+        *(last_digit == d for d in range(10)),
+        ends_49 * receipts, ends_99 * receipts, ends_49 * log_receipts, ends_99 * log_receipts,
+        np.minimum(miles, 100.0), np.maximum(0.0, np.minimum(miles - 100, 300.0)),
+        np.maximum(0.0, miles - 400),
+        _pow(miles, 2), np.log1p(miles), np.sqrt(miles),
+        (180 <= mpd) & (mpd <= 220), mpd > 300,
+        rpd < 50, (50 <= rpd) & (rpd < 100), (100 <= rpd) & (rpd < 300), (300 <= rpd) & (rpd < 500),
+        rpd >= 500, rpd >= 700,
+        _pow(days, 2), days * _pow(miles, 2), _pow(days, 2) * miles, days * _pow(receipts, 2),
+        receipts / total, miles / total, days / total,
+    ]
+    return np.column_stack(columns).astype(np.float64, copy=False)
+
+FEATURE_SETS = {
+    RF_FEATURES: (rf_features, rf_feature_matrix),
+    ENHANCED_FEATURES: (enhanced_features, enhanced_feature_matrix),
+}
+
+def _feature_set(feature_cols):
+    """The feature set that provides feature_cols, and the index of each column in it"""
+    wanted = tuple(feature_cols)
+    for columns, builders in FEATURE_SETS.items():
+        if set(wanted) <= set(columns):
+            index = None if wanted == columns else [columns.index(c) for c in wanted]
+            return builders, index
+    raise ValueError(f"no feature set provides columns {sorted(set(wanted) - set(ENHANCED_FEATURES))}")
+
+def feature_vector(feature_cols, days, miles, receipts):
+    """One trip's features in a model's feature_cols order"""
+    (scalar, _), index = _feature_set(feature_cols)
+    values = scalar(days, miles, receipts)
+    return values if index is None else [values[i] for i in index]
+
+def feature_matrix(feature_cols, days, miles, receipts):
+    """Arrays of trips as an (N, len(feature_cols)) matrix in a model's feature_cols order"""
+    (_, batch), index = _feature_set(feature_cols)
+    X = batch(days, miles, receipts)
+    return X if index is None else X[:, index]
+
+def check():
+    """Compare the batch path with the scalar path; return the number of mismatching rows"""
+    import json
+    import numpy as np
+
+    trips = []
+    with open('public_cases.json', 'r') as f:
+        trips += [tuple(c['input'].values()) for c in json.load(f)]
+    with open('private_cases.json', 'r') as f:
+        trips += [(c['trip_duration_days'], c['miles_traveled'], c['total_receipts_amount'])
+                  for c in json.load(f)]
+    # Every cent up to $3,000 and fractional miles, across all trip lengths
+    rng = np.random.default_rng(0)
+    n = 300_000
+    trips += zip(rng.integers(1, 15, n).tolist(),
+                 (rng.integers(0, 150_000, n) / 100).tolist(),
+                 (np.arange(n) / 100).tolist())
+    trips += zip(rng.integers(0, 21, n).tolist(), rng.integers(0, 1_500, n).tolist(),
+                 (rng.integers(0, 300_000, n) / 100 + rng.integers(0, 10, n) / 1000).tolist())
+
+    days, miles, receipts = (np.array(column, dtype=np.float64) for column in zip(*trips))
+    mismatches = 0
+    for name, (scalar, batch) in (('RF_FEATURES', (rf_features, rf_feature_matrix)),
+                                  ('ENHANCED_FEATURES', (enhanced_features, enhanced_feature_matrix))):
+        expected = np.array([scalar(*trip) for trip in trips])
+        actual = batch(days, miles, receipts)
+        same = (actual == expected) | (np.isnan(actual) & np.isnan(expected))
+        bad = int((~same.all(axis=1)).sum())
+        print(f"{name}: {len(trips) - bad}/{len(trips)} rows identical between scalar and batch paths")
+        mismatches += bad
+    return mismatches
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ['--check']:
+        print("Usage: features.py --check", file=sys.stderr)
+        sys.exit(1)
+    sys.exit(1 if check() else 0)
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Fixed-point integer arithmetic for the Decimal-based rule models.
+
+The rule scripts (phase2_rules.py, phase4_final.py, simple_ratio.py,
+run_zero_error.sh, run_final_ensemble.sh) used to build decimal.Decimal
+values with D(str(x)) for every input and constant of every prediction.
+Their amounts are now plain ints counting 10**-k dollars, with k chosen
+per calculation so that every sum and product is exact:
+
+    receipts = fixed(receipts_in, 2)          # 123.45 -> 12345 hundredths
+    amount = receipts * 55                    # x 0.55 -> 10**-4 dollars
+    cents = round_half_even(amount, 100)      # back to hundredths
+
+Python ints never round, so the only rounding is the explicit half-even
+step to whole cents, the same rule as round(Decimal, 2). Rates with more
+decimals, or products of several rates, just use a smaller unit.
+
+Usage:
+    from fixed_point import fixed, round_half_even
+"""
+
+def fixed(value, decimals):
+    """value (int, float or numeric string) as an exact int number of 10**-decimals units"""
+    if isinstance(value, int):
+        return value * 10 ** decimals
+    if isinstance(value, float) and decimals >= 2 and abs(value) < 1e13:
+        # Whole cents, the common case: the float nearest n / 100 is that decimal
+        cents = round(value * 100)
+        if cents / 100 == value:
+            return cents * 10 ** (decimals - 2)
+    # repr() gives the shortest string that reads back as the same float,
+    # i.e. the decimal the float was written as, like D(str(x))
+    text = value.strip() if isinstance(value, str) else repr(float(value))
+    mantissa, _, exponent = text.lower().partition('e')
+    sign = -1 if mantissa.startswith('-') else 1
+    whole, _, fraction = mantissa.lstrip('+-').partition('.')
+    shift = decimals - len(fraction) + (int(exponent) if exponent else 0)
+    digits = int(whole + fraction or '0')
+    if shift >= 0:
+        return sign * digits * 10 ** shift
+    digits, remainder = divmod(digits, 10 ** -shift)
+    if remainder:
+        raise ValueError(f"{value!r} has more than {decimals} decimal places")
+    return sign * digits
+
+def round_half_even(numerator, denominator):
+    """numerator / denominator rounded to the nearest int, ties to even (denominator > 0)"""
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient % 2 == 1):
+        quotient += 1
+    return quotient
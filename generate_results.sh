@@ -5,6 +5,10 @@
 
 set -e
 
+# Number of cases to run concurrently: ./generate_results.sh -j 8 (or EVAL_JOBS=8); -j 0 uses every core
+source "$(dirname "$0")/case_runner.sh"
+parse_jobs "$@"
+
 echo "🧾 Black Box Challenge - Generating Private Results"
 echo "===================================================="
 echo
@@ -58,6 +62,13 @@ rm -f private_results.txt
 
 echo "Processing $total_cases test cases..." >&2
 
+# With more than one job, run every case up front through a pool of workers
+# (case_runner.sh); run_case then picks up each result in case order
+if [ "$jobs" -gt 1 ]; then
+    echo "Running with $jobs parallel workers..." >&2
+fi
+start_workers results
+
 # Process each test case
 for ((i=0; i<total_cases; i++)); do
     if [ $((i % 100)) -eq 0 ] && [ $i -gt 0 ]; then
@@ -68,7 +79,7 @@ for ((i=0; i<total_cases; i++)); do
     IFS=':' read -r trip_duration miles_traveled receipts_amount <<< "${test_cases[i]}"
     
     # Run the user's implementation
-    if script_output=$(./run.sh "$trip_duration" "$miles_traveled" "$receipts_amount" 2>/dev/null); then
+    if run_case "$i" "$trip_duration" "$miles_traveled" "$receipts_amount"; then
         # Check if output is a valid number
         output=$(echo "$script_output" | tr -d '[:space:]')
         if [[ $output =~ ^-?[0-9]+\.?[0-9]*$ ]]; then
@@ -78,8 +89,6 @@ for ((i=0; i<total_cases; i++)); do
             echo "ERROR" >> private_results.txt
         fi
     else
-        # Capture stderr for error reporting
-        error_msg=$(./run.sh "$trip_duration" "$miles_traveled" "$receipts_amount" 2>&1 >/dev/null | tr -d '\n')
         echo "Error on case $((i+1)): Script failed: $error_msg" >&2
         echo "ERROR" >> private_results.txt
     fi
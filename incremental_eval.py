@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Incremental objective for moves that change one or a few parameters.
+
+ParamEvaluator recomputes every case for every candidate, although most
+parameters only reach a few rule branches: short_mid_rate only matters for
+trips of up to 3 days with receipts in the mid band, five_day_bonus only
+for 5-day trips. IncrementalEvaluator keeps each case's reimbursement
+components (mileage before and after the efficiency bonus, receipt
+component, per diem before and after halving) and the branch flags behind
+them (trip-length bucket x receipt band, efficiency window, high-spend). A
+parameter change recomputes only the cases it can affect and updates the
+total error by the delta:
+
+    parameter                         cases recomputed
+    mileage_tier2_rate                trips over 100 miles
+    efficiency_min / _max             miles/day between the old and new value
+    {group}_{band}_rate               trips currently in that group and band
+    {group}_{high,mid}_threshold      trips in the group with receipts between
+                                      the old and new value
+    base_per_diem                     every trip
+    five_day_bonus                    5-day trips
+    low_receipt_penalty               trips with receipts up to $50
+    high_spending_threshold           receipts/day between the old and new value
+
+All arithmetic is ParamEvaluator's exact 1e-8 dollar integers, so totals
+are identical to full evaluations.
+
+totals_with() evaluates several values of one parameter at once: the
+affected cases are those of the widest window, and each value is a row of
+one 2-D computation. coordinate_descent() uses it to try a ladder of steps
+for each parameter in turn and keep the best, pass after pass, until
+nothing improves.
+
+Usage:
+    python3 incremental_eval.py [--start params.json] [--out best_params.json]
+    python3 incremental_eval.py --benchmark     (incremental vs full evaluation)
+    python3 incremental_eval.py --check         (random moves vs full evaluation)
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+import numpy as np
+
+from param_eval import CENT, DEFAULT_PARAMS, PARAM_DECIMALS, PARAM_NAMES, UNIT, ParamEvaluator, scaled
+from param_search import SEARCH_SPACE, load_params, perturb
+
+GROUPS = ('short', 'medium', 'long')
+BANDS = ('low', 'mid', 'high')
+
+# Components in dependency order
+COMPONENTS = ('mileage6', 'efficient', 'mileage', 'branch', 'receipt',
+              'per_diem_raw', 'high_spending', 'per_diem')
+
+# Widening of float windows; the cases in a window are then recomputed exactly
+WINDOW_SLACK = 1e-9
+
+def scaled_values(values):
+    """param_eval.scaled(value, PARAM_DECIMALS) for a list of values, as an int64 array"""
+    values = np.asarray(values, dtype=np.float64)
+    units = np.round(values * 10 ** PARAM_DECIMALS)
+    # A float equal to units / 10**4 prints as that decimal, so this is exact
+    if np.array_equal(units / 10 ** PARAM_DECIMALS, values):
+        return units.astype(np.int64)
+    return np.array([scaled(value, PARAM_DECIMALS) for value in values.tolist()], dtype=np.int64)
+
+def _sorted_keys(keys, index):
+    order = index[np.argsort(keys[index], kind='stable')]
+    return order, keys[order]
+
+class IncrementalEvaluator:
+    """Total error of a parameter set, updated case by case as parameters change"""
+
+    def __init__(self, evaluator, params):
+        ev = self.ev = evaluator
+        self.params = dict(params)
+        self.p = {name: scaled(params[name], PARAM_DECIMALS) for name in PARAM_NAMES}
+        self.unit = UNIT // 10 ** PARAM_DECIMALS
+        everything = np.arange(len(ev))
+        self.group = np.where(ev.short, 0, np.where(ev.medium, 1, 2))
+
+        # Case subsets and sorted keys for locating the cases a change can affect
+        self.subsets = {
+            'all': everything,
+            'tier2': np.flatnonzero(~ev.first_tier),
+            'five_days': np.flatnonzero(ev.five_days),
+            'low_receipts': np.flatnonzero(ev.low_receipts),
+        }
+        self.sorted_receipts = [_sorted_keys(ev.receipts, np.flatnonzero(self.group == g))
+                                for g in range(len(GROUPS))]
+        self.sorted_miles_per_day = _sorted_keys(ev.miles / ev.divisor, everything)
+        self.sorted_receipts_per_day = _sorted_keys(ev.receipts / ev.divisor, everything)
+
+        values = {}
+        for component in COMPONENTS:
+            values[component] = self._compute(component, everything, self.p, values)
+        for component, array in values.items():
+            setattr(self, component, array)
+        self.cents = self._cents(everything, values)
+        self.error = np.abs(ev.expected_cents - self.cents)
+        self.total = int(self.error.sum())
+        self.evaluations = 0
+
+    def _compute(self, component, idx, p, new):
+        """
+        Values of one component for the cases idx under the scaled parameters
+        p, reading other components from new when present, else from the cache.
+        A parameter may be a column of alternative values, giving one row per value.
+        """
+        ev, unit = self.ev, self.unit
+
+        def get(name):
+            return new[name] if name in new else getattr(self, name)[idx]
+        if component == 'mileage6':
+            miles = ev.miles_hundredths[idx]
+            return np.where(ev.first_tier[idx], miles * 5800, 58 * 10 ** 6 + (miles - 10000) * p['mileage_tier2_rate'])
+        if component == 'efficient':
+            scaled_miles, divisor = ev.miles_scaled[idx], ev.divisor[idx]
+            return ((scaled_miles >= p['efficiency_min'] * unit * divisor)
+                    & (scaled_miles <= p['efficiency_max'] * unit * divisor))
+        if component == 'mileage':
+            return get('mileage6') * np.where(get('efficient'), 115, 100)
+        if component == 'branch':
+            group, receipts = self.group[idx], ev.receipts_scaled[idx]
+            mid = np.choose(group, [p[f'{g}_mid_threshold'] * unit for g in GROUPS])
+            high = np.choose(group, [p[f'{g}_high_threshold'] * unit for g in GROUPS])
+            return group * 3 + np.where(receipts > high, 2, np.where(receipts > mid, 1, 0))
+        if component == 'receipt':
+            rate = np.choose(get('branch'), [p[f'{g}_{b}_rate'] for g in GROUPS for b in BANDS])
+            return ev.receipts_cents[idx] * rate * 100 + ev.rounding_bonus[idx]
+        if component == 'per_diem_raw':
+            return (ev.days[idx] * p['base_per_diem'] + ev.five_days[idx] * p['five_day_bonus']
+                    - ev.low_receipts[idx] * p['low_receipt_penalty']) * unit
+        if component == 'high_spending':
+            return ev.receipts_scaled[idx] > p['high_spending_threshold'] * unit * ev.divisor[idx]
+        if component == 'per_diem':
+            raw = get('per_diem_raw')
+            return np.maximum(0, np.where(get('high_spending'), raw // 2, raw))
+        raise ValueError(f"unknown component {component!r}")
+
+    def _cents(self, idx, new):
+        """Reimbursements in cents for the cases idx, with components from new or the cache"""
+        total = sum(new[name] if name in new else getattr(self, name)[idx]
+                    for name in ('per_diem', 'mileage', 'receipt'))
+        # Half to even: a remainder of 0 after adding half a cent was an exact tie
+        cents, remainder = np.divmod(np.maximum(0, total) + CENT // 2, CENT)
+        return cents - ((remainder == 0) & (cents % 2 == 1))
+
+    @staticmethod
+    def _window(sorted_keys, values):
+        order, keys = sorted_keys
+        low, high = min(values), max(values)
+        start = np.searchsorted(keys, low - WINDOW_SLACK * (1 + abs(low)), 'left')
+        stop = np.searchsorted(keys, high + WINDOW_SLACK * (1 + abs(high)), 'right')
+        return order[start:stop]
+
+    def _affected(self, name, values):
+        """(cases that changing name between any of values can affect, components to recompute for them)"""
+        if name == 'mileage_tier2_rate':
+            return self.subsets['tier2'], ('mileage6', 'mileage')
+        if name in ('efficiency_min', 'efficiency_max'):
+            return self._window(self.sorted_miles_per_day, values), ('efficient', 'mileage')
+        group, kind = name.split('_', 1)
+        if kind in ('mid_threshold', 'high_threshold'):
+            return self._window(self.sorted_receipts[GROUPS.index(group)], values), ('branch', 'receipt')
+        if kind in ('low_rate', 'mid_rate', 'high_rate'):
+            branch = GROUPS.index(group) * 3 + BANDS.index(kind[:-len('_rate')])
+            return np.flatnonzero(self.branch == branch), ('receipt',)
+        if name == 'high_spending_threshold':
+            return self._window(self.sorted_receipts_per_day, values), ('high_spending', 'per_diem')
+        subset = {'base_per_diem': 'all', 'five_day_bonus': 'five_days', 'low_receipt_penalty': 'low_receipts'}[name]
+        return self.subsets[subset], ('per_diem_raw', 'per_diem')
+
+    def _change(self, name, values):
+        """
+        (cases, {component: values}, cents, errors) for the cases that setting
+        one parameter to each of values can affect, one row per value; nothing
+        is modified
+        """
+        p = dict(self.p)
+        p[name] = scaled_values(values)[:, None]
+        idx, components = self._affected(name, [self.params[name], *values])
+        new = {}
+        for component in components:
+            new[component] = self._compute(component, idx, p, new)
+        cents = np.broadcast_to(self._cents(idx, new), (len(values), len(idx)))
+        return idx, new, cents, np.abs(self.ev.expected_cents[idx] - cents)
+
+    def totals_with(self, name, values):
+        """Total error in cents for each of values of one parameter, the others unchanged"""
+        self.evaluations += len(values)
+        idx, _, _, errors = self._change(name, values)
+        return self.total + errors.sum(axis=1) - self.error[idx].sum()
+
+    def apply(self, changes):
+        """Change parameters ({name: value}) for good; return the new total error in cents"""
+        for name, value in changes.items():
+            if value == self.params[name]:
+                continue
+            idx, new, cents, errors = self._change(name, [value])
+            self.params[name] = value
+            self.p[name] = scaled(value, PARAM_DECIMALS)
+            for component, values in new.items():
+                getattr(self, component)[idx] = np.broadcast_to(values, cents.shape)[0]
+            self.total += int(errors[0].sum() - self.error[idx].sum())
+            self.cents[idx] = cents[0]
+            self.error[idx] = errors[0]
+        return self.total
+
+    def total_with(self, changes):
+        """Total error in cents if the changes were applied, leaving the evaluator as it is"""
+        changes = {name: value for name, value in changes.items() if value != self.params[name]}
+        if len(changes) == 1:
+            (name, value), = changes.items()
+            return int(self.totals_with(name, [value])[0])
+
+        # Several parameters: apply them in turn, then restore the cache
+        self.evaluations += 1
+        arrays = COMPONENTS + ('cents', 'error')
+        saved = dict(self.params), dict(self.p), self.total, {name: getattr(self, name).copy() for name in arrays}
+        try:
+            return self.apply(changes)
+        finally:
+            self.params, self.p, self.total, copies = saved
+            for name, array in copies.items():
+                setattr(self, name, array)
+
+class FullEvaluator:
+    """The IncrementalEvaluator interface on top of full ParamEvaluator evaluations"""
+
+    def __init__(self, evaluator, params):
+        self.ev = evaluator
+        self.params = dict(params)
+        self.total = int(evaluator.error_cents(self.params).sum())
+        self.evaluations = 0
+
+    def apply(self, changes):
+        self.params.update(changes)
+        self.total = int(self.ev.error_cents(self.params).sum())
+        return self.total
+
+    def total_with(self, changes):
+        self.evaluations += 1
+        return int(self.ev.error_cents(dict(self.params, **changes)).sum())
+
+    def totals_with(self, name, values):
+        return np.array([self.total_with({name: value}) for value in values])
+
+def step_ladder(param):
+    """Offsets coordinate descent tries for a parameter"""
+    if param.decimals is None:
+        return (1, 2, 5, 10, 20, 50)
+    return tuple(round(s * 10 ** -param.decimals, param.decimals) for s in (1, 2, 5, 10, 20, 50))
+
+def coordinate_descent(state, space=SEARCH_SPACE, max_passes=50):
+    """
+    Move one parameter at a time to the best value on its step ladder
+    (within its range), pass after pass, until a pass improves nothing.
+    Yields (pass, name, value, total_error_cents) for each accepted move;
+    `state` (IncrementalEvaluator or FullEvaluator) holds the result.
+    """
+    for pass_number in range(1, max_passes + 1):
+        improved = False
+        for param in space:
+            current = state.params[param.name]
+            values = []
+            for step in step_ladder(param):
+                for value in (current - step, current + step):
+                    if param.decimals is not None:
+                        value = round(value, param.decimals)
+                    if param.low <= value <= param.high:
+                        values.append(value)
+            if not values:
+                continue
+            # The whole ladder in one call; the first of equal totals wins
+            totals = state.totals_with(param.name, values)
+            best = int(np.argmin(totals))
+            if totals[best] < state.total:
+                state.apply({param.name: values[best]})
+                improved = True
+                yield pass_number, param.name, values[best], int(totals[best])
+        if not improved:
+            return
+
+def check(moves=2000):
+    """Apply random moves and compare the incremental totals with full evaluations; return mismatches"""
+    evaluator = ParamEvaluator('public_cases.json')
+    rng = random.Random(0)
+    state = IncrementalEvaluator(evaluator, DEFAULT_PARAMS)
+    mismatches = 0
+    for k in range(moves):
+        candidate = perturb(SEARCH_SPACE, state.params, rng, adjust=(1, 2, 3))
+        changes = {name: value for name, value in candidate.items() if value != state.params[name]}
+        expected = int(evaluator.error_cents(candidate).sum())
+        if state.total_with(changes) != expected:
+            mismatches += 1
+        # Keep about half of the moves
+        if k % 2 == 0:
+            state.apply(changes)
+            if state.total != expected or not np.array_equal(state.cents, evaluator.predict_cents(state.params)):
+                mismatches += 1
+    print(f"{moves} random moves compared with full evaluations")
+    return mismatches
+
+def benchmark(params):
+    """Run coordinate descent with both evaluators; return True if they agree"""
+    evaluator = ParamEvaluator('public_cases.json')
+    results = []
+    for label, cls in (('full', FullEvaluator), ('incremental', IncrementalEvaluator)):
+        started = time.time()
+        state = cls(evaluator, params)
+        moves = list(coordinate_descent(state))
+        elapsed = time.time() - started
+        print(f"{label:>11}: {state.evaluations} evaluations, {len(moves)} moves, score {state.total / 10000:.2f}, "
+              f"{elapsed:.2f}s ({state.evaluations / elapsed:.0f} evals/s)")
+        results.append((moves, state.params))
+    return results[0] == results[1]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Coordinate descent with an incremental objective")
+    parser.add_argument('--start', help="JSON file of starting parameters (default: param_eval.DEFAULT_PARAMS)")
+    parser.add_argument('--out', help="write the optimized parameters to this JSON file")
+    parser.add_argument('--cases', default='public_cases.json', help="case file (default: public_cases.json)")
+    parser.add_argument('--benchmark', action='store_true', help="compare incremental and full evaluation")
+    parser.add_argument('--check', action='store_true', help="verify random moves against full evaluations")
+    args = parser.parse_args()
+
+    base = load_params(args.start) if args.start else DEFAULT_PARAMS
+    if args.check:
+        mismatches = check()
+        print(f"{'❌' if mismatches else '✅'} {mismatches} mismatches")
+        sys.exit(1 if mismatches else 0)
+    if args.benchmark:
+        same = benchmark(base)
+        print(f"{'✅' if same else '❌'} both evaluators made the same moves")
+        sys.exit(0 if same else 1)
+
+    state = IncrementalEvaluator(ParamEvaluator(args.cases), base)
+    print(f"Start: score {state.total / 10000:.2f}")
+    started = time.time()
+    for pass_number, name, value, total in coordinate_descent(state):
+        print(f"  Pass {pass_number}: {name} → {value}, score {total / 10000:.2f}")
+    elapsed = time.time() - started
+    print(f"Best score: {state.total / 10000:.2f} "
+          f"({state.evaluations} evaluations in {elapsed:.2f}s, {state.evaluations / elapsed:.0f} evals/s)")
+    for name in PARAM_NAMES:
+        if state.params[name] != base[name]:
+            print(f"  {name}: {base[name]} → {state.params[name]}")
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(state.params, f, indent=2)
+        print(f"✅ Wrote {args.out}")
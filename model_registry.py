@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Every run_*.sh model variant as an in-process callable.
+
+Most run scripts carry their model as Python source inside a `python3 -c`
+string; the rest launch a module of this repo. The registry reads each
+script and recovers the source the shell would hand to the interpreter
+(undoing the backslash escapes of a double-quoted string). It then executes
+everything except the block that parses sys.argv and prints, as a module
+named `model_registry.<name>`. A script that launches a module maps to that
+module's entry point instead (MODULE_ENTRY_POINTS).
+
+model.batch(trips) predicts a list of (days, miles, receipts) trips. Models
+whose module has a vectorized batch entry point (rf_forest,
+predict_optimized) score the whole list in one call; the others, including
+every inline model, are called once per trip.
+
+Either way a model is called like its script. The inputs are converted to
+the strings eval.sh would pass, and the call returns the amount the script
+would print, as a float. Each inline model runs in its own decimal context,
+so the `getcontext().prec = N` a script sets at startup only applies to its
+own calls and any number of models can share a process.
+
+    from model_registry import load_model
+    model = load_model('ultimate')               # run_ultimate.sh
+    model(3, 93, 1.42)
+    model.batch([(3, 93, 1.42), (5, 500, 700)])
+    model.expected_score, model.dependencies     # from the script header and imports
+
+Models are named after their script without `run_` and `.sh` (`run.sh` is
+`run`). `model_registry:<name>` also works as an evaluate.py model.
+
+Usage:
+    python3 model_registry.py                          (list the models)
+    python3 model_registry.py --check [--limit 10]     (compare with running the scripts)
+    python3 model_registry.py --compare [--cases public_cases.json] [MODEL ...]
+"""
+
+import argparse
+import ast
+import decimal
+import glob
+import importlib
+import os
+import re
+import subprocess
+import sys
+import time
+import types
+import warnings
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Module launched by a run script -> (entry point, batch entry point or None, third-party dependencies)
+MODULE_ENTRY_POINTS = {
+    'predict_optimized': ('calculate_reimbursement', 'calculate_batch', ('numpy',)),
+    'predict': ('calculate_reimbursement', None, ('numpy',)),
+    'predict_ultra_optimized': ('calculate_reimbursement', None, ('numpy', 'sklearn')),
+    'rf_forest': ('predict_reimbursement', 'predict_batch', ()),
+    'rf_standalone': ('predict_reimbursement', None, ()),
+    'simple_ratio': ('calculate_simple', None, ()),
+    'ultra_simple': ('calculate_reimbursement', None, ()),
+}
+ENTRY_POINT = 'calculate_reimbursement'
+
+INLINE_START = re.compile(r'python3 -c ([\'"])\n')
+HEADER_PREFIX = 'Black Box Legacy Reimbursement System - '
+# The score expression of an `Expected score:` / `Target score:` line: ~N, < N or N-M (possibly ~N-M)
+SCORE = re.compile(r'(?:Expected|Target) score:.*?(~?\s*\d+(?:\.\d+)?\s*-\s*\d+(?:\.\d+)?'
+                   r'|~\s*\d+(?:\.\d+)?|<\s*\d+(?:\.\d+)?)', re.IGNORECASE)
+SHELL_ESCAPE = re.compile(r'\\([\\"$`\n])')
+
+class Model:
+    """A run script's model: model(days, miles, receipts) returns what the script would print, as a float"""
+
+    def __init__(self, name, script, entry, description, expected_score, dependencies, predict,
+                 predict_batch=None):
+        self.name = name
+        self.script = script
+        self.entry = entry
+        self.description = description
+        self.expected_score = expected_score
+        self.dependencies = dependencies
+        self.predict = predict
+        self.predict_batch = predict_batch
+        # evaluate.py fingerprints the script (and every file it names) for its result store
+        self.source_file = script
+
+    def __repr__(self):
+        return f"Model({self.name!r}, {self.entry!r})"
+
+    def __call__(self, days, miles, receipts):
+        return self.predict(shell_arg(days), shell_arg(miles), shell_arg(receipts))
+
+    def batch(self, trips):
+        """Amounts for a list of (days, miles, receipts) trips, in one vectorized call where the module has one"""
+        if self.predict_batch is None:
+            return [self(*trip) for trip in trips]
+        return self.predict_batch([tuple(shell_arg(value) for value in trip) for trip in trips])
+
+def shell_arg(value):
+    """An input as the command-line string eval.sh passes (jq prints 93.0 as 93)"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+def model_name(script):
+    """Registry name of a run script: run_final_ensemble.sh -> final_ensemble, run.sh -> run"""
+    base = os.path.basename(script)[:-len('.sh')]
+    return base[len('run_'):] if base.startswith('run_') else base
+
+def scripts(directory=HERE):
+    """Every run script with a model in it, by name"""
+    paths = sorted(glob.glob(os.path.join(directory, 'run_*.sh')))
+    paths.insert(0, os.path.join(directory, 'run.sh'))
+    return {model_name(path): path for path in paths if os.path.exists(path)}
+
+def header(text):
+    """(description, expected score) from the comment block at the top of a run script"""
+    comments = []
+    for line in text.splitlines()[1:]:
+        if not line.startswith('#'):
+            if comments:
+                break
+            continue
+        comments.append(line.lstrip('#').strip())
+    description = next((line[len(HEADER_PREFIX):] if line.startswith(HEADER_PREFIX) else line
+                        for line in comments if line), '')
+    expected_score = None
+    for line in comments:
+        match = SCORE.search(line)
+        if match:
+            expected_score = match.group(1)
+            break
+    return description, expected_score
+
+def inline_source(text, path):
+    """(python source, first line number) of a run script's `python3 -c` body, or None"""
+    match = INLINE_START.search(text)
+    if not match:
+        return None
+    quote = match.group(1)
+    end = re.compile(rf'^{quote} "\$', re.MULTILINE).search(text, match.end())
+    if not end:
+        raise ValueError(f"{path}: unterminated python3 -c {quote}...{quote}")
+    body = text[match.end():end.start()]
+    first_line = text.count('\n', 0, match.end()) + 1
+    if quote == "'":
+        return body, first_line
+    # Double quotes: the shell would expand $ and `...` before Python saw them
+    for number, line in enumerate(body.splitlines(), first_line):
+        if re.search(r'(?<!\\)[$`]', line) and not line.lstrip().startswith('#'):
+            raise ValueError(f"{path}:{number}: shell expansion inside the Python source")
+    return SHELL_ESCAPE.sub(lambda m: '' if m.group(1) == '\n' else m.group(1), body), first_line
+
+def _uses_argv(node):
+    return any(isinstance(n, ast.Attribute) and n.attr == 'argv' for n in ast.walk(node))
+
+def _is_main_block(node):
+    if isinstance(node, ast.If):
+        return '__name__' in ast.unparse(node.test)
+    if isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
+        return getattr(node.value.func, 'id', None) == 'print'
+    return _uses_argv(node)
+
+def _calls_entry_point(node):
+    return (isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)
+            and getattr(node.value.func, 'id', None) == ENTRY_POINT)
+
+def _prints_fstring(node):
+    return (isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)
+            and getattr(node.value.func, 'id', None) == 'print' and not node.value.keywords
+            and bool(node.value.args) and isinstance(node.value.args[0], ast.JoinedStr))
+
+def _formatting(body):
+    """(start, end) of `x = calculate_reimbursement(...)` through print(f'...') in a statement list, or None"""
+    start = next((i for i, node in enumerate(body) if _calls_entry_point(node)), None)
+    if start is None:
+        return None
+    end = next((i for i in range(start, len(body)) if _prints_fstring(body[i])), None)
+    return None if end is None else (start, end)
+
+def main_block(body):
+    """The statements of a top-level body that parse sys.argv and print, rather than define the model"""
+    # Statements between the call and the print only format its result (e.g. sign and divmod)
+    start, end = _formatting(body) or (len(body), -1)
+    return [node for i, node in enumerate(body) if _is_main_block(node) or start <= i <= end]
+
+def output_formatter(block, namespace, path):
+    """The script's own print formatting as a function of calculate_reimbursement's result"""
+    bodies = [block] + [getattr(node, field) for statement in block for node in ast.walk(statement)
+                        for field in ('body', 'orelse', 'finalbody') if isinstance(getattr(node, field, None), list)]
+    for body in bodies:
+        span = _formatting(body)
+        if span is None:
+            continue
+        # def format_output(x): <the statements in between>; return f"..."
+        start, end = span
+        formatter = ast.parse('def format_output(result): pass').body[0]
+        formatter.args.args[0].arg = body[start].targets[0].id
+        formatter.body = body[start + 1:end] + [ast.Return(body[end].value.args[0])]
+        scope = {}
+        exec(compile(ast.fix_missing_locations(ast.Module([formatter], type_ignores=[])), path, 'exec'),
+             namespace, scope)
+        return scope['format_output']
+    raise ValueError(f"{path}: no `x = {ENTRY_POINT}(...)` and print(f'...') to follow")
+
+def load_inline(name, path, source, first_line):
+    """Execute an inline body (minus its argv/print block) as a module; return (predict, dependencies)"""
+    tree = ast.parse(source, path)
+    ast.increment_lineno(tree, first_line - 1)
+    block = main_block(tree.body)
+    definitions = [node for node in tree.body if node not in block]
+
+    module = types.ModuleType(f'model_registry.{name}')
+    module.__file__ = path
+    # Module-level getcontext() changes land in this model's own context
+    with decimal.localcontext() as context:
+        exec(compile(ast.Module(definitions, type_ignores=[]), path, 'exec'), module.__dict__)
+    fmt = output_formatter(block, module.__dict__, path)
+    sys.modules[module.__name__] = module
+    calculate = getattr(module, ENTRY_POINT)
+
+    def predict(days, miles, receipts):
+        with decimal.localcontext(context):
+            return float(fmt(calculate(days, miles, receipts)))
+
+    imports = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name.split('.')[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            imports.add(node.module.split('.')[0])
+    return predict, tuple(sorted(imports - set(sys.stdlib_module_names)))
+
+def launched_module(text, path):
+    """The repo module a run script hands its arguments to"""
+    launches = [line for line in text.splitlines() if 'python3 ' in line and not line.lstrip().startswith('#')]
+    for word in re.findall(r'\w+', launches[-1] if launches else ''):
+        if word in MODULE_ENTRY_POINTS:
+            return word
+    raise ValueError(f"{path}: no inline model and no known module launched")
+
+def load_script(path):
+    """A Model for one run script"""
+    with open(path, 'r') as f:
+        text = f.read()
+    name = model_name(path)
+    description, expected_score = header(text)
+    inline = inline_source(text, path)
+    if inline is not None:
+        predict, dependencies = load_inline(name, path, *inline)
+        entry = f"{os.path.basename(path)}:{ENTRY_POINT}"
+    else:
+        module_name = launched_module(text, path)
+        function_name, batch_name, dependencies = MODULE_ENTRY_POINTS[module_name]
+        module = importlib.import_module(module_name)
+        function = getattr(module, function_name)
+
+        def predict(days, miles, receipts):
+            return float(f"{function(int(days), float(miles), float(receipts)):.2f}")
+        entry = f"{module_name}:{function_name}"
+
+        if batch_name is not None:
+            batch_function = getattr(module, batch_name)
+
+            def predict_batch(trips):
+                trips = [(int(days), float(miles), float(receipts)) for days, miles, receipts in trips]
+                return [float(f"{amount:.2f}") for amount in batch_function(trips).tolist()]
+            return Model(name, path, entry, description, expected_score, dependencies, predict, predict_batch)
+    return Model(name, path, entry, description, expected_score, dependencies, predict)
+
+_models = {}
+
+def load_model(name):
+    """The Model for a registry name, loaded on first use"""
+    if name not in _models:
+        paths = scripts()
+        if name not in paths:
+            raise KeyError(f"no model {name!r}; known: {', '.join(paths)}")
+        _models[name] = load_script(paths[name])
+    return _models[name]
+
+def load_models(names=None):
+    """{name: Model} for the given names, or every run script"""
+    return {name: load_model(name) for name in (names or scripts())}
+
+def __getattr__(name):
+    # `model_registry:<name>` entry points for evaluate.py
+    if name in scripts():
+        return load_model(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def check(models, cases):
+    """(name, case, registry output, script output) for every disagreement with running the script or between batch and single calls"""
+    mismatches = []
+    for model in models.values():
+        for case in cases:
+            args = [shell_arg(value) for value in case]
+            proc = subprocess.run([model.script, *args], capture_output=True, text=True, cwd=HERE)
+            expected = proc.stdout.strip() if proc.returncode == 0 else f"exit {proc.returncode}"
+            try:
+                got = f"{model(*case):.2f}"
+            except Exception as e:
+                got = f"{type(e).__name__}: {e}"
+            if got != expected:
+                mismatches.append((model.name, case, got, expected))
+        if model.predict_batch is not None:
+            # The vectorized path must print what the per-trip path prints
+            for case, amount in zip(cases, model.batch(cases)):
+                got, expected = f"{amount:.2f}", f"{model(*case):.2f}"
+                if got != expected:
+                    mismatches.append((f"{model.name} (batch)", case, got, expected))
+    return mismatches
+
+def compare(models, cases_path):
+    """(name, summary, microseconds per call) for each model over a case file, scored like eval.sh"""
+    from case_reader import iter_cases
+    from evaluate import evaluate, run_case
+
+    cases = list(iter_cases(cases_path))
+    rows = []
+    for name, model in models.items():
+        started = time.perf_counter()
+        outcomes = [(case, run_case(model, case['input']['trip_duration_days'], case['input']['miles_traveled'],
+                                    case['input']['total_receipts_amount'])) for case in cases]
+        elapsed = time.perf_counter() - started
+        rows.append((name, evaluate(outcomes), elapsed / len(cases) * 1e6))
+    return rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load every run_*.sh model as an in-process callable")
+    parser.add_argument('models', nargs='*', help="registry names (default: all)")
+    parser.add_argument('--check', action='store_true', help="compare each model with running its script")
+    parser.add_argument('--limit', type=int, default=10, help="cases per model for --check (default: 10)")
+    parser.add_argument('--compare', action='store_true', help="score every model on the cases, in-process")
+    parser.add_argument('--cases', default='public_cases.json', help="case file (default: public_cases.json)")
+    args = parser.parse_args()
+
+    os.chdir(HERE)
+    # sklearn version and feature-name warnings from the pickled models, once per call
+    warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
+    models = load_models(args.models)
+
+    if args.check:
+        from case_reader import iter_cases, trip_from_record
+
+        cases = [trip_from_record(case) for case, _ in zip(iter_cases(args.cases), range(args.limit))]
+        mismatches = check(models, cases)
+        for name, case, got, expected in mismatches[:20]:
+            print(f"  {name} {case}: registry {got!r}, script {expected!r}")
+        print(f"{'✅' if not mismatches else '❌'} {len(mismatches)} mismatches over "
+              f"{len(models)} models x {len(cases)} cases")
+        sys.exit(1 if mismatches else 0)
+
+    if args.compare:
+        print(f"{'model':<22} {'score':>9} {'avg error':>10} {'exact':>6} {'µs/call':>9}  expected")
+        rows = compare(models, args.cases)
+        for name, summary, micros in sorted(rows, key=lambda row: row[1].get('score', float('inf'))):
+            if not summary['successful_runs']:
+                print(f"{name:<22} {'failed':>9}")
+                continue
+            print(f"{name:<22} {summary['score']:>9} {summary['avg_error']:>10} {summary['exact_matches']:>6} "
+                  f"{micros:9.1f}  {models[name].expected_score or ''}")
+        sys.exit(0)
+
+    print(f"{'model':<22} {'entry point':<50} {'dependencies':<16} expected score")
+    for name, model in models.items():
+        print(f"{name:<22} {model.entry:<50} {', '.join(model.dependencies) or '-':<16} {model.expected_score or ''}")
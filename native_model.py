@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Native, memory-mappable format for the pickled tree ensembles.
+
+Unpickling rf_model.pkl or optimized_model.pkl imports sklearn and allocates
+every tree as Python objects on each process start. This module exports
+the fitted RandomForest / GradientBoosting ensembles to a flat binary file
+and predicts from it through an mmap, without importing sklearn.
+
+File layout (little endian, every section 8-byte aligned):
+    header     magic 'RBNM', version, kind, n_trees, n_nodes, n_features,
+               metadata length, base value, scale
+    metadata   JSON: feature_cols, corrections, model_name, model_type
+    value      float64[n_nodes]   leaf values
+    threshold  float64[n_nodes]
+    roots      int32[n_trees]
+    feature    int32[n_nodes]
+    left       int32[n_nodes]     global node index, -1 for leaves
+    right      int32[n_nodes]
+
+The metadata records the SHA-256 of the source pickle; is_current() lets
+the predictors fall back to the pickle when the export is stale. Currency
+is decided by content alone. The pickle's hash comes from
+prediction_cache.cached_file_sha256, which keeps it in the cache file
+keyed by the pickle's (size, mtime_ns), so a cold process does not
+re-hash an unchanged pickle. Verdicts are also memoized in-process by the
+stats of both files.
+
+Prediction follows sklearn exactly: features are rounded to float32 before
+the `x <= threshold` tests, a forest averages its trees
+(sum in tree order, then divided by n_trees) and a boosting model adds
+`scale * leaf` per stage to its initial constant. predict_one() walks the
+arrays in pure Python for a single trip; predict() advances every row
+through all trees level by level with NumPy over the same mapped arrays,
+so batches are as fast as sklearn's and give the same bits.
+
+Usage:
+    python3 native_model.py export optimized_model.pkl optimized_model.bin
+    python3 native_model.py export rf_model.pkl rf_model.bin
+    python3 native_model.py check optimized_model.pkl optimized_model.bin
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b'RBNM'
+VERSION = 1
+KIND_FOREST = 1
+KIND_BOOSTING = 2
+# magic, version, kind, n_trees, n_nodes, n_features, metadata length, base, scale
+HEADER = struct.Struct('<4sHHIIIIdd')
+# Rows per NumPy traversal in predict(), keeping the (rows x trees) working set cache-sized
+BATCH_CHUNK = 1024
+
+# (native path, pickle path) -> ((size, mtime_ns) of both files, is_current verdict)
+_current = {}
+
+def _pad(n):
+    return (8 - n % 8) % 8
+
+def _trees_of(model):
+    """Fitted sklearn trees of a RandomForest or GradientBoosting regressor, in prediction order"""
+    if hasattr(model, 'learning_rate'):
+        if model.estimators_.shape[1] != 1:
+            raise ValueError("only single-output boosting models are supported")
+        return [stage[0].tree_ for stage in model.estimators_]
+    return [estimator.tree_ for estimator in model.estimators_]
+
+def file_sha256(path):
+    import hashlib
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def file_stat(path):
+    """(size, mtime_ns) of a file"""
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+def export_model(model_data, path, source_sha256=None):
+    """Write a pickled model bundle ({'model', 'feature_cols', ...}) to the native format"""
+    model = model_data['model']
+    trees = _trees_of(model)
+
+    if hasattr(model, 'learning_rate'):
+        if getattr(model, 'loss', 'squared_error') not in ('squared_error', 'ls'):
+            raise ValueError(f"unsupported boosting loss {model.loss!r}")
+        kind = KIND_BOOSTING
+        base = float(model.init_.constant_.ravel()[0])
+        scale = float(model.learning_rate)
+    else:
+        kind = KIND_FOREST
+        base = 0.0
+        scale = float(len(trees))
+
+    roots, value, threshold, feature, left, right = [], [], [], [], [], []
+    for tree in trees:
+        offset = len(value)
+        roots.append(offset)
+        for i in range(tree.node_count):
+            leaf = tree.children_left[i] < 0
+            value.append(float(tree.value[i, 0, 0]))
+            threshold.append(float(tree.threshold[i]))
+            feature.append(-1 if leaf else int(tree.feature[i]))
+            left.append(-1 if leaf else offset + int(tree.children_left[i]))
+            right.append(-1 if leaf else offset + int(tree.children_right[i]))
+
+    metadata = json.dumps({
+        'feature_cols': list(model_data['feature_cols']),
+        'corrections': model_data.get('corrections', {}),
+        'model_name': model_data.get('model_name', type(model).__name__),
+        'model_type': type(model).__name__,
+        'source_sha256': source_sha256,
+    }).encode('utf-8')
+
+    sections = [array('d', value), array('d', threshold), array('i', roots),
+                array('i', feature), array('i', left), array('i', right)]
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, kind, len(trees), len(value),
+                            len(model_data['feature_cols']), len(metadata), base, scale))
+        f.write(metadata + b'\0' * _pad(len(metadata)))
+        for section in sections:
+            if sys.byteorder != 'little':
+                section.byteswap()
+            data = section.tobytes()
+            f.write(data + b'\0' * _pad(len(data)))
+
+class NativeModel:
+    """Tree ensemble evaluated straight from a memory-mapped native model file"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.kind, self.n_trees, self.n_nodes, self.n_features,
+         meta_len, self.base, self.scale) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} native model file")
+        if sys.byteorder != 'little':
+            raise ValueError("native model files can only be mapped on little-endian machines")
+
+        pos = HEADER.size
+        self.metadata = json.loads(bytes(self._mm[pos:pos + meta_len]).decode('utf-8'))
+        pos += meta_len + _pad(meta_len)
+
+        view = memoryview(self._mm)
+        sections = []
+        for typecode, count in (('d', self.n_nodes), ('d', self.n_nodes), ('i', self.n_trees),
+                                ('i', self.n_nodes), ('i', self.n_nodes), ('i', self.n_nodes)):
+            size = struct.calcsize(typecode) * count
+            sections.append(view[pos:pos + size].cast(typecode))
+            pos += size + _pad(size)
+        self.value, self.threshold, self.roots, self.feature, self.left, self.right = sections
+        self._np = None
+
+    def predict_one(self, x):
+        """Predict one feature vector (already in feature_cols order)"""
+        # sklearn validates X as float32 before the trees see it
+        x = array('f', x)
+        value, threshold, feature, left, right = (
+            self.value, self.threshold, self.feature, self.left, self.right)
+
+        if self.kind == KIND_BOOSTING:
+            out = self.base
+            scale = self.scale
+            for node in self.roots:
+                while left[node] >= 0:
+                    node = left[node] if x[feature[node]] <= threshold[node] else right[node]
+                out += scale * value[node]
+            return out
+
+        out = 0.0
+        for node in self.roots:
+            while left[node] >= 0:
+                node = left[node] if x[feature[node]] <= threshold[node] else right[node]
+            out += value[node]
+        return out / self.scale
+
+    def _numpy_arrays(self):
+        if self._np is None:
+            import numpy as np
+            # Zero-copy views of the mapped sections. Leaves become their own children,
+            # so rows that reach a leaf early stay put while the others keep descending,
+            # and the two child links are interleaved: node n continues at children[2n + went_right]
+            feature = np.frombuffer(self.feature, dtype=np.int32)
+            is_leaf = feature < 0
+            own = np.arange(self.n_nodes, dtype=np.intp)
+            children = np.empty(2 * self.n_nodes, dtype=np.intp)
+            children[0::2] = np.where(is_leaf, own, np.frombuffer(self.left, dtype=np.int32))
+            children[1::2] = np.where(is_leaf, own, np.frombuffer(self.right, dtype=np.int32))
+            roots = np.frombuffer(self.roots, dtype=np.int32).astype(np.intp)
+
+            # Levels every row needs to reach a leaf in every tree
+            depth, frontier = 0, roots[~is_leaf[roots]]
+            while frontier.size:
+                depth += 1
+                frontier = np.concatenate((children[2 * frontier], children[2 * frontier + 1]))
+                frontier = frontier[~is_leaf[frontier]]
+
+            self._np = (roots, np.maximum(feature, 0).astype(np.intp),
+                        np.frombuffer(self.threshold, dtype=np.float64),
+                        children, np.frombuffer(self.value, dtype=np.float64), depth)
+        return self._np
+
+    def predict(self, X):
+        """sklearn-style predict over an (N, n_features) matrix, as a float64 array"""
+        import numpy as np
+
+        roots, feature, threshold, children, value, depth = self._numpy_arrays()
+        # sklearn validates X as float32 before the trees see it
+        X = np.asarray(X, dtype=np.float32).astype(np.float64)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"expected an (N, {self.n_features}) matrix, got shape {X.shape}")
+
+        boosting = self.kind == KIND_BOOSTING
+        out = np.full(X.shape[0], self.base if boosting else 0.0)
+        for start in range(0, X.shape[0], BATCH_CHUNK):
+            chunk = np.ascontiguousarray(X[start:start + BATCH_CHUNK])
+
+            # One row per tree, one column per case, all advanced level by level
+            nodes = np.repeat(roots[:, None], chunk.shape[0], axis=1)
+            row_base = np.arange(chunk.shape[0]) * self.n_features
+            flat_X = chunk.ravel()
+            for _ in range(depth):
+                went_right = ~(flat_X[row_base + feature[nodes]] <= threshold[nodes])
+                nodes = children[2 * nodes + went_right]
+
+            # Accumulate tree by tree to keep sklearn's summation order
+            leaves = value[nodes]
+            partial = out[start:start + BATCH_CHUNK]
+            for leaf in leaves:
+                if boosting:
+                    partial += self.scale * leaf
+                else:
+                    partial += leaf
+        return out if boosting else out / self.scale
+
+def is_current(native_path, pkl_path):
+    """True if native_path exists and was exported from the current contents of pkl_path"""
+    try:
+        stats = (file_stat(native_path), file_stat(pkl_path))
+    except OSError:
+        return False
+    key = (native_path, pkl_path)
+    if key in _current and _current[key][0] == stats:
+        return _current[key][1]
+
+    try:
+        with open(native_path, 'rb') as f:
+            header = f.read(HEADER.size)
+            meta_len = HEADER.unpack(header)[6]
+            metadata = json.loads(f.read(meta_len).decode('utf-8'))
+        from prediction_cache import cached_file_sha256
+        current = metadata.get('source_sha256') == cached_file_sha256(pkl_path)
+    except (OSError, ValueError, struct.error):
+        current = False
+    _current[key] = (stats, current)
+    return current
+
+def load_native(path):
+    """Load a native model file as the same bundle shape that the pickles hold"""
+    model = NativeModel(path)
+    return {
+        'model': model,
+        'feature_cols': model.metadata['feature_cols'],
+        'corrections': model.metadata['corrections'],
+        'model_name': model.metadata['model_name'],
+    }
+
+def check(pkl_path, native_path):
+    """Compare native predictions against sklearn on the public cases; return the number of mismatches"""
+    import pickle
+    import numpy as np
+
+    with open(pkl_path, 'rb') as f:
+        model_data = pickle.load(f)
+    native = load_native(native_path)['model']
+
+    from features import feature_matrix
+    from case_store import columns
+    days, miles, receipts, _ = columns('public_cases.json')
+    X = feature_matrix(model_data['feature_cols'], days, miles, receipts)
+    expected = model_data['model'].predict(X)
+    mismatches = 0
+    for label, actual in (('predict', native.predict(X)),
+                          ('predict_one', np.array([native.predict_one(row) for row in X]))):
+        differ = int(np.sum(expected != actual))
+        print(f"{native_path} {label}: {len(X) - differ}/{len(X)} predictions bit-identical to sklearn")
+        mismatches += differ
+    return mismatches
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] not in ('export', 'check'):
+        print("Usage: native_model.py export|check <model.pkl> <model.bin>", file=sys.stderr)
+        sys.exit(1)
+
+    command, pkl_path, native_path = sys.argv[1:]
+    if command == 'export':
+        import pickle
+        with open(pkl_path, 'rb') as f:
+            export_model(pickle.load(f), native_path, file_sha256(pkl_path))
+        print(f"✅ Wrote {native_path}")
+    else:
+        sys.exit(1 if check(pkl_path, native_path) else 0)
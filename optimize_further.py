@@ -11,6 +11,9 @@ from sklearn.neural_network import MLPRegressor
 from sklearn.model_selection import cross_val_score
 import pickle
 
+from case_store import load_cases
+from features import ENHANCED_FEATURES, enhanced_feature_matrix
+
 print("Loading data and analyzing optimization opportunities...")
 
 # Load public cases
@@ -53,89 +56,10 @@ print("\n" + "="*60)
 print("OPTIMIZATION STRATEGY 1: Enhanced Feature Engineering")
 print("="*60)
 
-rows = []
-for case in data:
-    days = case['input']['trip_duration_days']
-    miles = case['input']['miles_traveled']
-    receipts = case['input']['total_receipts_amount']
-    output = case['expected_output']
-    
-    row = {
-        'days': days,
-        'miles': miles,
-        'receipts': receipts,
-        'output': output
-    }
-    
-    # All existing features from before
-    row['miles_per_day'] = miles / days if days > 0 else miles
-    row['receipts_per_day'] = receipts / days if days > 0 else receipts
-    row['total_input'] = days + miles + receipts
-    
-    # Day indicators
-    for d in range(1, 15):
-        row[f'is_{d}_day'] = int(days == d)
-    
-    # Receipt features
-    row['log_receipts'] = np.log1p(receipts)
-    row['sqrt_receipts'] = np.sqrt(receipts)
-    row['receipts_squared'] = receipts ** 2
-    row['receipts_cubed'] = receipts ** 3
-    
-    # Enhanced rounding features
-    receipt_str = f"{receipts:.2f}"
-    row['ends_49'] = int(receipt_str.endswith('49'))
-    row['ends_99'] = int(receipt_str.endswith('99'))
-    row['ends_00'] = int(receipt_str.endswith('00'))
-    
-    # NEW: More granular ending patterns
-    for digit in range(10):
-        row[f'last_digit_{digit}'] = int(receipt_str[-1] == str(digit))
-    
-    # NEW: Penalty interaction features
-    row['ends_49_x_receipts'] = row['ends_49'] * receipts
-    row['ends_99_x_receipts'] = row['ends_99'] * receipts
-    row['ends_49_x_log_receipts'] = row['ends_49'] * row['log_receipts']
-    row['ends_99_x_log_receipts'] = row['ends_99'] * row['log_receipts']
-    
-    # Mileage features
-    row['tier1_miles'] = min(miles, 100)
-    row['tier2_miles'] = max(0, min(miles - 100, 300))
-    row['tier3_miles'] = max(0, miles - 400)
-    
-    # NEW: More mileage features
-    row['miles_squared'] = miles ** 2
-    row['log_miles'] = np.log1p(miles)
-    row['sqrt_miles'] = np.sqrt(miles)
-    
-    # Efficiency features
-    mpd = row['miles_per_day']
-    row['efficiency_bonus'] = int(180 <= mpd <= 220)
-    row['efficiency_penalty'] = int(mpd > 300)
-    
-    # Spending categories with more granularity
-    rpd = row['receipts_per_day']
-    row['very_low_spend'] = int(rpd < 50)
-    row['low_spend'] = int(50 <= rpd < 100)
-    row['medium_spend'] = int(100 <= rpd < 300)
-    row['high_spend'] = int(300 <= rpd < 500)
-    row['very_high_spend'] = int(rpd >= 500)
-    row['extreme_spend'] = int(rpd >= 700)
-    
-    # NEW: Polynomial features for key interactions
-    row['days_squared'] = days ** 2
-    row['days_x_miles_squared'] = days * miles ** 2
-    row['days_squared_x_miles'] = days ** 2 * miles
-    row['days_x_receipts_squared'] = days * receipts ** 2
-    
-    # NEW: Ratio features
-    row['receipts_to_total'] = receipts / (days + miles + receipts + 1)
-    row['miles_to_total'] = miles / (days + miles + receipts + 1)
-    row['days_to_total'] = days / (days + miles + receipts + 1)
-    
-    rows.append(row)
-
-df = pd.DataFrame(rows)
+cases = load_cases('public_cases.json')
+df = pd.DataFrame(enhanced_feature_matrix(cases['days'], cases['miles'], cases['receipts_cents'] / 100),
+                  columns=ENHANCED_FEATURES)
+df['output'] = cases['expected']
 feature_cols = [col for col in df.columns if col != 'output']
 X = df[feature_cols]
 y = df['output']
@@ -4,111 +4,22 @@ Parameter optimization for the best-performing reimbursement model.
 Focuses on high-impact parameters identified in the analysis.
 """
 
-import json
 import subprocess
-from decimal import Decimal as D, getcontext
 from itertools import product
 import sys
 
-getcontext().prec = 12
+from param_eval import ParamEvaluator
 
-def calculate_reimbursement_with_params(days_in, miles_in, receipts_in, params):
-    """
-    Calculate reimbursement with custom parameters for testing.
-    """
-    days = int(days_in)
-    miles = D(str(miles_in))
-    receipts = D(str(receipts_in))
-    
-    # Unpack parameters
-    p = params
-    
-    # Base per diem
-    per_diem = days * D(str(p['base_per_diem']))
-    
-    # Tiered mileage
-    if miles <= D('100'):
-        mileage = miles * D('0.58')
-    else:
-        mileage = (D('100') * D('0.58')) + ((miles - D('100')) * D(str(p['mileage_tier2_rate'])))
-    
-    # Mileage efficiency bonus
-    miles_per_day = miles / days if days > 0 else miles
-    if D(str(p['efficiency_min'])) <= miles_per_day <= D(str(p['efficiency_max'])):
-        mileage *= D('1.15')
-    
-    # Receipt component with variable rates
-    if days <= 3:  # Short trips
-        if receipts > D(str(p['short_high_threshold'])):
-            receipt_rate = D(str(p['short_high_rate']))
-        elif receipts > D(str(p['short_mid_threshold'])):
-            receipt_rate = D(str(p['short_mid_rate']))
-        else:
-            receipt_rate = D(str(p['short_low_rate']))
-    elif days <= 7:  # Medium trips
-        if receipts > D(str(p['medium_high_threshold'])):
-            receipt_rate = D(str(p['medium_high_rate']))
-        elif receipts > D(str(p['medium_mid_threshold'])):
-            receipt_rate = D(str(p['medium_mid_rate']))
-        else:
-            receipt_rate = D(str(p['medium_low_rate']))
-    else:  # Long trips
-        if receipts > D(str(p['long_high_threshold'])):
-            receipt_rate = D(str(p['long_high_rate']))
-        elif receipts > D(str(p['long_mid_threshold'])):
-            receipt_rate = D(str(p['long_mid_rate']))
-        else:
-            receipt_rate = D(str(p['long_low_rate']))
-    
-    receipt_component = receipts * receipt_rate
-    
-    # Bonuses and penalties
-    if days == 5:
-        per_diem += D(str(p['five_day_bonus']))
-    
-    if D('0') < receipts <= D('50'):
-        per_diem -= D(str(p['low_receipt_penalty']))
-    
-    daily_spending = receipts / days if days > 0 else receipts
-    if daily_spending > D(str(p['high_spending_threshold'])):
-        per_diem *= D('0.5')
-    
-    per_diem = max(D('0'), per_diem)
-    
-    # Rounding bug bonus
-    receipt_str = f'{receipts:.2f}'
-    if receipt_str.endswith(('49', '99')):
-        receipt_component += D('5.01')
-    
-    total = per_diem + mileage + receipt_component
-    return round(max(D('0'), total), 2)
+# Load data once
+evaluator = ParamEvaluator('public_cases.json')
 
 def evaluate_parameters(params):
     """
     Evaluate a parameter set against all public cases.
     """
-    with open('public_cases.json', 'r') as f:
-        data = json.load(f)
-    
-    total_error = D('0')
-    max_error = D('0')
-    
-    # data is a list, not a dict with 'cases' key
-    for case in data:
-        expected = D(str(case['expected_output']))
-        calculated = calculate_reimbursement_with_params(
-            case['input']['trip_duration_days'],
-            case['input']['miles_traveled'],
-            case['input']['total_receipts_amount'],
-            params
-        )
-        
-        error = abs(expected - calculated)
-        total_error += error
-        max_error = max(max_error, error)
-    
-    avg_error = total_error / len(data)
-    return float(avg_error), float(max_error), float(total_error)
+    avg_error, max_error, total_error, _ = evaluator.evaluate(params)
+    return avg_error, max_error, total_error
+
 
 # Current best parameters
 base_params = {
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Vectorized evaluation of the parameterized rule model used by the optimizers.
+
+ultra_optimizer.py, advanced_optimizer.py and optimize_parameters.py score a
+parameter set by running calculate_reimbursement_with_params() (Decimal
+arithmetic, precision 12) once per case, converting every parameter with
+D(str(...)) each time. ParamEvaluator computes the same reimbursements for
+all cases at once with NumPy:
+
+    tiered mileage            0.58/mile up to 100 miles, then the tier 2 rate
+    efficiency bonus          mileage x 1.15 when miles/day is in range
+    receipt rates             low/mid/high rate per short/medium/long trip
+    bonuses and penalties     5-day bonus, low-receipt penalty, per diem
+                              halved above the daily spending threshold
+    rounding adjustment       +5.01 for receipts ending in .49 or .99
+
+Amounts are exact int64 in units of 1e-8 dollars, so the results match the
+Decimal version exactly, including the final half-even rounding to cents.
+Every parameter must therefore be a whole number of 1e-4 units (rates such
+as 0.4375, thresholds such as 612.5); other values raise ValueError.
+
+    evaluator = ParamEvaluator('public_cases.json')
+    avg_error, max_error, total_error, errors_over_500 = evaluator.evaluate(params)
+
+Usage:
+    python3 param_eval.py --check      (compare with the Decimal version)
+"""
+
+import sys
+from decimal import Decimal as D, localcontext
+
+import numpy as np
+
+from case_store import load_cases
+
+PARAM_NAMES = (
+    'base_per_diem', 'mileage_tier2_rate', 'efficiency_min', 'efficiency_max',
+    'short_high_threshold', 'short_mid_threshold', 'short_high_rate', 'short_mid_rate', 'short_low_rate',
+    'medium_high_threshold', 'medium_mid_threshold', 'medium_high_rate', 'medium_mid_rate', 'medium_low_rate',
+    'long_high_threshold', 'long_mid_threshold', 'long_high_rate', 'long_mid_rate', 'long_low_rate',
+    'five_day_bonus', 'low_receipt_penalty', 'high_spending_threshold',
+)
+
+# Best parameters found so far (ultra_optimizer.py)
+DEFAULT_PARAMS = {
+    'base_per_diem': 100,
+    'mileage_tier2_rate': 0.43,
+    'efficiency_min': 185,
+    'efficiency_max': 215,
+    'short_high_threshold': 1500,
+    'short_mid_threshold': 500,
+    'short_high_rate': 0.45,
+    'short_mid_rate': 0.57,
+    'short_low_rate': 0.40,
+    'medium_high_threshold': 1500,
+    'medium_mid_threshold': 650,
+    'medium_high_rate': 0.45,
+    'medium_mid_rate': 0.55,
+    'medium_low_rate': 0.50,
+    'long_high_threshold': 1100,
+    'long_mid_threshold': 500,
+    'long_high_rate': 0.20,
+    'long_mid_rate': 0.30,
+    'long_low_rate': 0.40,
+    'five_day_bonus': 20,
+    'low_receipt_penalty': 20,
+    'high_spending_threshold': 450,
+}
+
+# Parameters are whole numbers of 1e-4; amounts are computed in 1e-8 dollars
+PARAM_DECIMALS = 4
+UNIT = 10 ** 8
+CENT = UNIT // 100
+
+def calculate_reimbursement_with_params(days_in, miles_in, receipts_in, params):
+    """
+    Calculate reimbursement with custom parameters for testing.
+    """
+    with localcontext() as ctx:
+        ctx.prec = 12
+
+        days = int(days_in)
+        miles = D(str(miles_in))
+        receipts = D(str(receipts_in))
+
+        # Unpack parameters
+        p = params
+
+        # Base per diem
+        per_diem = days * D(str(p['base_per_diem']))
+
+        # Tiered mileage
+        if miles <= D('100'):
+            mileage = miles * D('0.58')
+        else:
+            mileage = (D('100') * D('0.58')) + ((miles - D('100')) * D(str(p['mileage_tier2_rate'])))
+
+        # Mileage efficiency bonus
+        miles_per_day = miles / days if days > 0 else miles
+        if D(str(p['efficiency_min'])) <= miles_per_day <= D(str(p['efficiency_max'])):
+            mileage *= D('1.15')
+
+        # Receipt component with variable rates
+        if days <= 3:  # Short trips
+            if receipts > D(str(p['short_high_threshold'])):
+                receipt_rate = D(str(p['short_high_rate']))
+            elif receipts > D(str(p['short_mid_threshold'])):
+                receipt_rate = D(str(p['short_mid_rate']))
+            else:
+                receipt_rate = D(str(p['short_low_rate']))
+        elif days <= 7:  # Medium trips
+            if receipts > D(str(p['medium_high_threshold'])):
+                receipt_rate = D(str(p['medium_high_rate']))
+            elif receipts > D(str(p['medium_mid_threshold'])):
+                receipt_rate = D(str(p['medium_mid_rate']))
+            else:
+                receipt_rate = D(str(p['medium_low_rate']))
+        else:  # Long trips
+            if receipts > D(str(p['long_high_threshold'])):
+                receipt_rate = D(str(p['long_high_rate']))
+            elif receipts > D(str(p['long_mid_threshold'])):
+                receipt_rate = D(str(p['long_mid_rate']))
+            else:
+                receipt_rate = D(str(p['long_low_rate']))
+
+        receipt_component = receipts * receipt_rate
+
+        # Bonuses and penalties
+        if days == 5:
+            per_diem += D(str(p['five_day_bonus']))
+
+        if D('0') < receipts <= D('50'):
+            per_diem -= D(str(p['low_receipt_penalty']))
+
+        daily_spending = receipts / days if days > 0 else receipts
+        if daily_spending > D(str(p['high_spending_threshold'])):
+            per_diem *= D('0.5')
+
+        per_diem = max(D('0'), per_diem)
+
+        # Rounding bug bonus
+        receipt_str = f'{receipts:.2f}'
+        if receipt_str.endswith(('49', '99')):
+            receipt_component += D('5.01')
+
+        total = per_diem + mileage + receipt_component
+        return round(max(D('0'), total), 2)
+
+def scaled(value, decimals):
+    """value as an exact integer number of 10**-decimals units"""
+    exact = D(str(value)).scaleb(decimals)
+    if exact != exact.to_integral_value():
+        raise ValueError(f"{value!r} has more than {decimals} decimal places")
+    return int(exact)
+
+def _exact_hundredths(values, what):
+    hundredths = np.round(np.asarray(values, dtype=np.float64) * 100).astype(np.int64)
+    if not np.array_equal(hundredths / 100, values):
+        raise ValueError(f"{what} must be whole numbers of hundredths")
+    return hundredths
+
+class ParamEvaluator:
+    """calculate_reimbursement_with_params() for every case of a case file at once"""
+
+    def __init__(self, json_path='public_cases.json'):
+        cases = load_cases(json_path)
+        self.days = np.asarray(cases['days'], dtype=np.int64)
+        self.miles = np.asarray(cases['miles'])
+        self.receipts_cents = np.asarray(cases['receipts_cents'])
+        self.receipts = self.receipts_cents / 100
+        expected = np.asarray(cases['expected'])
+        self.expected_cents = None if np.isnan(expected).any() else _exact_hundredths(expected, "expected outputs")
+
+        # Everything that does not depend on the parameters
+        self.miles_hundredths = _exact_hundredths(self.miles, "miles")
+        # Zero-day trips divide by 1, as the Decimal version uses the raw amounts
+        self.divisor = np.maximum(self.days, 1)
+        self.miles_scaled = self.miles_hundredths * (UNIT // 100)
+        self.receipts_scaled = self.receipts_cents * CENT
+        self.short = self.days <= 3
+        self.medium = ~self.short & (self.days <= 7)
+        self.long = ~(self.short | self.medium)
+        self.first_tier = self.miles_hundredths <= 10000
+        self.five_days = self.days == 5
+        self.low_receipts = (self.receipts_cents > 0) & (self.receipts_cents <= 5000)
+        self.rounding_bonus = np.where(np.isin(self.receipts_cents % 100, (49, 99)), 501 * CENT, 0)
+
+    def __len__(self):
+        return len(self.days)
+
+    def predict_cents(self, params):
+        """Reimbursement of every case in integer cents"""
+        p = {name: scaled(params[name], PARAM_DECIMALS) for name in PARAM_NAMES}
+        unit = UNIT // 10 ** PARAM_DECIMALS
+
+        # Mileage in 1e-6 dollars: hundredths of a mile times a 1e-4 rate
+        mileage = np.where(self.first_tier,
+                           self.miles_hundredths * 5800,
+                           58 * 10 ** 6 + (self.miles_hundredths - 10000) * p['mileage_tier2_rate'])
+        # miles / days within [efficiency_min, efficiency_max], compared without dividing
+        efficient = ((self.miles_scaled >= p['efficiency_min'] * unit * self.divisor)
+                     & (self.miles_scaled <= p['efficiency_max'] * unit * self.divisor))
+        mileage = mileage * np.where(efficient, 115, 100)
+
+        rate = np.zeros(len(self), dtype=np.int64)
+        for trips, group in ((self.short, 'short'), (self.medium, 'medium'), (self.long, 'long')):
+            high = self.receipts_scaled > p[f'{group}_high_threshold'] * unit
+            mid = self.receipts_scaled > p[f'{group}_mid_threshold'] * unit
+            group_rate = np.where(high, p[f'{group}_high_rate'],
+                                  np.where(mid, p[f'{group}_mid_rate'], p[f'{group}_low_rate']))
+            rate = np.where(trips, group_rate, rate)
+        # Cents times a 1e-4 rate is in 1e-6 dollars
+        receipt_component = self.receipts_cents * rate * 100 + self.rounding_bonus
+
+        per_diem = (self.days * p['base_per_diem'] + self.five_days * p['five_day_bonus']
+                    - self.low_receipts * p['low_receipt_penalty']) * unit
+        high_spending = self.receipts_scaled > p['high_spending_threshold'] * unit * self.divisor
+        # Parameters are multiples of 1e-4, so halving is exact in 1e-8 units
+        per_diem = np.maximum(0, np.where(high_spending, per_diem // 2, per_diem))
+
+        total = np.maximum(0, per_diem + mileage + receipt_component)
+        # Round half to even to whole cents, like round(Decimal, 2)
+        cents, remainder = np.divmod(total, CENT)
+        half = CENT // 2
+        return cents + ((remainder > half) | ((remainder == half) & (cents % 2 == 1)))
+
+    def predict(self, params):
+        """Reimbursement of every case in dollars"""
+        return self.predict_cents(params) / 100
+
+    def error_cents(self, params):
+        """Absolute error of every case in integer cents"""
+        if self.expected_cents is None:
+            raise ValueError("the case file has no expected outputs")
+        return np.abs(self.expected_cents - self.predict_cents(params))
+
+    def evaluate(self, params):
+        """(avg_error, max_error, total_error, errors_over_500) over all cases"""
+        errors = self.error_cents(params)
+        total = int(errors.sum())
+        with localcontext() as ctx:
+            ctx.prec = 12
+            avg_error = D(total).scaleb(-2) / len(errors)
+        return float(avg_error), int(errors.max()) / 100, total / 100, int((errors > 50000).sum())
+
+    def high_error_cases(self, params, threshold=500):
+        """Cases with an error above threshold dollars, in case order"""
+        predicted = self.predict_cents(params)
+        errors = np.abs(self.expected_cents - predicted)
+        return [{
+            'index': int(i),
+            'days': int(self.days[i]),
+            'miles': _json_number(self.miles[i]),
+            'receipts': float(self.receipts[i]),
+            'expected': int(self.expected_cents[i]) / 100,
+            'calculated': int(predicted[i]) / 100,
+            'error': int(errors[i]) / 100,
+        } for i in np.flatnonzero(errors > scaled(threshold, 2))]
+
+def _json_number(value):
+    """A miles value as json.load() returns it: int when whole"""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+def _exact_ratio(amount, days):
+    """amount / days if it is a whole number of 1e-4, else None"""
+    ratio = D(str(amount)) / max(int(days), 1)
+    return float(ratio) if ratio == ratio.quantize(D(1).scaleb(-PARAM_DECIMALS)) else None
+
+def _random_params(rng, evaluator):
+    """A parameter set around DEFAULT_PARAMS, with some thresholds placed exactly on case values"""
+    params = {}
+    for name in PARAM_NAMES:
+        value = DEFAULT_PARAMS[name]
+        decimals = int(rng.integers(1, PARAM_DECIMALS + 1))
+        if name.endswith('_rate'):
+            params[name] = round(rng.uniform(0.05, 0.95), decimals)
+        elif rng.random() < 0.5:
+            params[name] = int(rng.integers(value // 2, value * 3 // 2 + 1))
+        else:
+            params[name] = round(rng.uniform(value / 2, value * 1.5), decimals)
+
+    # Boundaries: thresholds equal to one case's receipts, miles/day or receipts/day
+    i, j, k = rng.integers(len(evaluator), size=3)
+    params[f"{rng.choice(['short', 'medium', 'long'])}_mid_threshold"] = float(evaluator.receipts[i])
+    ratio = _exact_ratio(evaluator.miles[j], evaluator.days[j])
+    if ratio is not None:
+        params[str(rng.choice(['efficiency_min', 'efficiency_max']))] = ratio
+    ratio = _exact_ratio(evaluator.receipts[k], evaluator.days[k])
+    if ratio is not None:
+        params['high_spending_threshold'] = ratio
+    return params
+
+def check(param_sets=200):
+    """Compare the vectorized evaluator with the Decimal version; return the number of mismatches"""
+    rng = np.random.default_rng(0)
+    mismatches = 0
+    for json_path in ('public_cases.json', 'private_cases.json'):
+        evaluator = ParamEvaluator(json_path)
+        trips = list(zip(evaluator.days.tolist(), evaluator.miles.tolist(), evaluator.receipts.tolist()))
+        for k in range(param_sets):
+            params = DEFAULT_PARAMS if k == 0 else _random_params(rng, evaluator)
+            actual = evaluator.predict_cents(params)
+            expected = [scaled(calculate_reimbursement_with_params(*trip, params), 2) for trip in trips]
+            bad = int((actual != np.array(expected)).sum())
+            if bad:
+                print(f"  {json_path}: {bad} mismatches for {params}")
+            mismatches += bad
+        print(f"{json_path}: {param_sets} parameter sets x {len(trips)} cases compared with the Decimal version")
+    return mismatches
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ['--check']:
+        print("Usage: param_eval.py --check", file=sys.stderr)
+        sys.exit(1)
+    mismatches = check()
+    print(f"{'❌' if mismatches else '✅'} {mismatches} mismatching reimbursements")
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Parallel grid and random search over the rule model's parameters.
+
+Candidates are parameter dicts in the param_eval.PARAM_NAMES schema. A
+Search evaluates them with param_eval.ParamEvaluator, fanning chunks of
+candidates out over a pool of forked worker processes. Every worker maps
+the same columnar case store (case_store.py), so the dataset lives once in
+the page cache however many workers there are.
+
+Candidates are always generated in the parent from a seeded random.Random
+and results are consumed in candidate order, so a search gives the same
+answer for a given seed and batch size whatever the number of workers.
+
+random_search() works in rounds: each round perturbs the best parameters
+found so far `batch_size` times (2 or 3 parameters at a time, resampled
+from their declared ranges), evaluates the round in parallel and yields
+every new best as soon as its round is done.
+
+    with Search('public_cases.json') as search:
+        for params, (avg_error, max_error, total_error, errors_over_500) in search.evaluate(candidates):
+            ...
+
+Usage:
+    python3 param_search.py [--iterations 50000] [--batch-size 256] [--seed 42]
+                            [--jobs N] [--start params.json] [--out best_params.json]
+                            [--sweep-thresholds]
+"""
+
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import time
+
+from param_eval import DEFAULT_PARAMS, PARAM_NAMES, ParamEvaluator
+
+CHUNK_SIZE = 64
+BATCH_SIZE = 256
+
+class Param:
+    """A searchable parameter: integers in [low, high], or floats in [low, high] rounded to `decimals`"""
+
+    def __init__(self, name, low, high, decimals=3):
+        if name not in PARAM_NAMES:
+            raise ValueError(f"unknown parameter {name!r}")
+        self.name = name
+        self.low = low
+        self.high = high
+        self.decimals = None if isinstance(low, int) and isinstance(high, int) else decimals
+
+    def __repr__(self):
+        return f"Param({self.name!r}, {self.low!r}, {self.high!r})"
+
+    def sample(self, rng):
+        """A random value from the range"""
+        if self.decimals is None:
+            return rng.randint(self.low, self.high)
+        return round(rng.uniform(self.low, self.high), self.decimals)
+
+# Ranges for a search over every parameter
+SEARCH_SPACE = (
+    Param('base_per_diem', 80, 120),
+    Param('mileage_tier2_rate', 0.35, 0.55),
+    Param('efficiency_min', 150, 200),
+    Param('efficiency_max', 200, 250),
+    Param('short_high_threshold', 1000, 2000),
+    Param('short_mid_threshold', 300, 700),
+    Param('short_high_rate', 0.10, 0.70),
+    Param('short_mid_rate', 0.30, 0.80),
+    Param('short_low_rate', 0.20, 0.70),
+    Param('medium_high_threshold', 1000, 2000),
+    Param('medium_mid_threshold', 400, 800),
+    Param('medium_high_rate', 0.10, 0.70),
+    Param('medium_mid_rate', 0.30, 0.80),
+    Param('medium_low_rate', 0.20, 0.70),
+    Param('long_high_threshold', 800, 1400),
+    Param('long_mid_threshold', 300, 700),
+    Param('long_high_rate', 0.05, 0.50),
+    Param('long_mid_rate', 0.10, 0.60),
+    Param('long_low_rate', 0.20, 0.70),
+    Param('five_day_bonus', 0, 50),
+    Param('low_receipt_penalty', 0, 50),
+    Param('high_spending_threshold', 350, 550),
+)
+
+def perturb(space, base, rng, adjust=(2, 3)):
+    """base with 2 or 3 (rng.choice(adjust)) parameters of the space resampled"""
+    params = dict(base)
+    for param in rng.sample(space, k=rng.choice(adjust)):
+        params[param.name] = param.sample(rng)
+    return params
+
+def grid(base, values):
+    """Every combination of {name: [values]} applied to base, in itertools.product order"""
+    names = list(values)
+    return [dict(base, **dict(zip(names, combo))) for combo in itertools.product(*values.values())]
+
+_worker_evaluator = None
+
+def _init_worker(cases_path):
+    global _worker_evaluator
+    _worker_evaluator = ParamEvaluator(cases_path)
+
+def _evaluate_chunk(candidates):
+    return [_worker_evaluator.evaluate(params) for params in candidates]
+
+class Search:
+    """Evaluates parameter candidates on a process pool, in candidate order"""
+
+    def __init__(self, cases_path='public_cases.json', jobs=None, chunk_size=CHUNK_SIZE):
+        self.cases_path = cases_path
+        self.evaluator = ParamEvaluator(cases_path)
+        # Workers are forked; without fork, everything runs in this process
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            jobs = 1
+        self.jobs = jobs or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.evaluations = 0
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def terminate(self):
+        """Stop the workers without waiting for outstanding chunks (after an interrupt)"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def _results(self, candidates):
+        if self.jobs == 1 or len(candidates) <= self.chunk_size:
+            return map(self.evaluator.evaluate, candidates)
+        if self._pool is None:
+            context = multiprocessing.get_context('fork')
+            self._pool = context.Pool(self.jobs, _init_worker, (self.cases_path,))
+        chunks = [candidates[i:i + self.chunk_size] for i in range(0, len(candidates), self.chunk_size)]
+        return itertools.chain.from_iterable(self._pool.imap(_evaluate_chunk, chunks))
+
+    def evaluate(self, candidates):
+        """Yield (params, (avg_error, max_error, total_error, errors_over_500)) for each candidate, in order"""
+        candidates = list(candidates)
+        for params, stats in zip(candidates, self._results(candidates)):
+            self.evaluations += 1
+            yield params, stats
+
+    def random_search(self, space, base, iterations, seed=42, batch_size=BATCH_SIZE, adjust=(2, 3)):
+        """
+        Perturb the best parameters so far `iterations` times, `batch_size`
+        candidates per round. Yields (iteration, params, stats) for each new
+        best, with 1-based iteration numbers.
+        """
+        rng = random.Random(seed)
+        best_params = dict(base)
+        best_total = self.evaluator.evaluate(best_params)[2]
+        for start in range(0, iterations, batch_size):
+            # The whole round is drawn before any of it is evaluated
+            candidates = [perturb(space, best_params, rng, adjust)
+                          for _ in range(min(batch_size, iterations - start))]
+            round_best = None
+            for i, (params, stats) in enumerate(self.evaluate(candidates), start + 1):
+                if stats[2] < best_total:
+                    best_total = stats[2]
+                    round_best = params
+                    yield i, params, stats
+            if round_best is not None:
+                best_params = round_best
+
+def load_params(path):
+    """Parameter dict from a JSON file, checked for missing names"""
+    with open(path, 'r') as f:
+        params = json.load(f)
+    missing = [name for name in PARAM_NAMES if name not in params]
+    if missing:
+        raise ValueError(f"{path} is missing {', '.join(missing)}")
+    return params
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Random search over the rule model's parameters")
+    parser.add_argument('--iterations', type=int, default=50_000, help="candidates to evaluate (default: 50000)")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                        help=f"candidates per round around the best so far (default: {BATCH_SIZE})")
+    parser.add_argument('--seed', type=int, default=42, help="random seed (default: 42)")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--cases', default='public_cases.json', help="case file (default: public_cases.json)")
+    parser.add_argument('--start', help="JSON file of starting parameters (default: param_eval.DEFAULT_PARAMS)")
+    parser.add_argument('--out', help="write the best parameters to this JSON file")
+    parser.add_argument('--sweep-thresholds', action='store_true',
+                        help="finish by setting every threshold to its exact optimum (threshold_sweep.py)")
+    args = parser.parse_args()
+
+    base = load_params(args.start) if args.start else DEFAULT_PARAMS
+    started = time.time()
+    with Search(args.cases, jobs=args.jobs) as search:
+        avg_error, _, total_error, high_errors = search.evaluator.evaluate(base)
+        print(f"Start: score {total_error / 100:.2f} (avg error ${avg_error:.2f}, {high_errors} errors >$500)")
+        print(f"Searching {args.iterations} candidates on {search.jobs} worker(s), seed {args.seed}")
+
+        best_params = base
+        for iteration, params, (avg_error, _, total_error, high_errors) in search.random_search(
+                SEARCH_SPACE, base, args.iterations, seed=args.seed, batch_size=args.batch_size):
+            best_params = params
+            print(f"  🎯 Iteration {iteration}: score {total_error / 100:.2f} "
+                  f"(avg ${avg_error:.2f}, {high_errors} errors >$500)", flush=True)
+            if args.out:
+                with open(args.out, 'w') as f:
+                    json.dump(best_params, f, indent=2)
+
+        if args.sweep_thresholds:
+            from threshold_sweep import optimize_thresholds
+            print("Exact threshold sweep:")
+            for pass_number, name, value, total in optimize_thresholds(search.evaluator, best_params):
+                best_params = dict(best_params, **{name: value})
+                print(f"  Pass {pass_number}: {name} → {value}, score {total / 10000:.2f}", flush=True)
+            if args.out:
+                with open(args.out, 'w') as f:
+                    json.dump(best_params, f, indent=2)
+
+    elapsed = time.time() - started
+    print(f"\n{search.evaluations} evaluations in {elapsed:.1f}s ({search.evaluations / elapsed:.0f}/s)")
+    print("Best parameters (changes from start):")
+    for name in PARAM_NAMES:
+        if best_params[name] != base[name]:
+            print(f"  {name}: {base[name]} → {best_params[name]}")
+    if args.out:
+        print(f"✅ Wrote {args.out}")
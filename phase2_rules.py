@@ -2,12 +2,22 @@
 """
 Phase 2: Re-encode regression weights as explicit deterministic rules
 Based on the shocking discoveries from Phase 1 regression
+Amounts are exact integers (fixed_point.py), rounded half-even to cents
 """
 
 import json
 import numpy as np
-from decimal import Decimal as D, getcontext
-getcontext().prec = 12
+
+from fixed_point import fixed, round_half_even
+
+# Amounts in 1e-20 dollars: exact for the float log and sqrt terms
+SCALE = 20
+
+# Rates per hundredth of a mile or per cent, in the same units
+TIER1_RATE = fixed(0.824, SCALE - 2)
+TIER2_RATE = fixed(0.490, SCALE - 2)
+TIER3_RATE = fixed(0.434, SCALE - 2)
+RECEIPT_RATE = fixed(0.8008, SCALE - 2)
 
 def calculate_reimbursement_v2(days_in, miles_in, receipts_in):
     """
@@ -19,118 +29,120 @@ def calculate_reimbursement_v2(days_in, miles_in, receipts_in):
     """
     
     days = int(days_in)
-    miles = D(str(miles_in))
-    receipts = D(str(receipts_in))
+    miles = fixed(miles_in, 2)
+    receipts_cents = fixed(receipts_in, 2)
+    hundredths = 10 ** (SCALE - 2)
     
     # Start with intercept from regression
-    total = D('711.32')
+    total = fixed(711.32, SCALE)
     
     # --- 1. Per Diem Component ---
     # Regression showed $64.94/day
-    total += days * D('64.94')
+    total += days * fixed(64.94, SCALE)
     
     # --- 2. Mileage Component ---
     # Tier 1: 0-100 miles at $0.824/mile
-    tier1_miles = min(miles, D('100'))
-    total += tier1_miles * D('0.824')
+    tier1_miles = min(miles, 10000)
+    total += tier1_miles * TIER1_RATE
     
     # Tier 2: 101-400 miles at $0.490/mile
-    if miles > D('100'):
-        tier2_miles = min(miles - D('100'), D('300'))
-        total += tier2_miles * D('0.490')
+    if miles > 10000:
+        tier2_miles = min(miles - 10000, 30000)
+        total += tier2_miles * TIER2_RATE
     
     # Tier 3: 401+ miles at $0.434/mile
-    if miles > D('400'):
-        tier3_miles = miles - D('400')
-        total += tier3_miles * D('0.434')
+    if miles > 40000:
+        tier3_miles = miles - 40000
+        total += tier3_miles * TIER3_RATE
     
     # --- 3. Receipt Component ---
     # Strong negative log component: -387.56 * log(receipts+1)
-    if receipts > 0:
-        log_receipts = float(np.log1p(float(receipts)))
-        total -= D(str(387.56 * log_receipts))
+    receipts = receipts_cents / 100
+    if receipts_cents > 0:
+        log_receipts = float(np.log1p(receipts))
+        total -= fixed(387.56 * log_receipts, SCALE)
     
     # Linear receipt component: -0.8008 * receipts
-    total -= receipts * D('0.8008')
+    total -= receipts_cents * RECEIPT_RATE
     
     # Sqrt component: +111.99 * sqrt(receipts)
-    if receipts > 0:
-        sqrt_receipts = float(np.sqrt(float(receipts)))
-        total += D(str(111.99 * sqrt_receipts))
+    if receipts_cents > 0:
+        sqrt_receipts = float(np.sqrt(receipts))
+        total += fixed(111.99 * sqrt_receipts, SCALE)
     
     # --- 4. Special Adjustments ---
     
     # 5-day PENALTY: -$46.24
     if days == 5:
-        total -= D('46.24')
+        total -= fixed(46.24, SCALE)
     
     # Low receipt BONUS: +$44.52
-    if D('0') < receipts <= D('50'):
-        total += D('44.52')
+    if 0 < receipts_cents <= 5000:
+        total += fixed(44.52, SCALE)
     
     # Rounding bug PENALTY: -$472.73
-    receipt_str = f'{receipts:.2f}'
-    if receipt_str.endswith(('49', '99')):
-        total -= D('472.73')
+    if receipts_cents % 100 in (49, 99):
+        total -= fixed(472.73, SCALE)
     
     # High daily spending penalty: -$54.64
-    daily_spending = receipts / days if days > 0 else receipts
-    if daily_spending > D('450'):
-        total -= D('54.64')
+    # (receipts / days compared without dividing; zero-day trips use the raw amount)
+    divisor = max(days, 1)
+    if receipts_cents > 45000 * divisor:
+        total -= fixed(54.64, SCALE)
     
     # Very high daily spending adjustment: +$35.59 (partially offsets the above)
-    if daily_spending > D('500'):
-        total += D('35.59')
+    if receipts_cents > 50000 * divisor:
+        total += fixed(35.59, SCALE)
     
     # Extreme receipts penalty: -$139.33
-    if receipts > D('2000'):
-        total -= D('139.33')
+    if receipts_cents > 200000:
+        total -= fixed(139.33, SCALE)
     
     # Trip type adjustments
     if days <= 3:  # Short trip
-        total -= D('16.38')
+        total -= fixed(16.38, SCALE)
     elif 3 < days <= 7:  # Medium trip
-        total += D('62.90')
+        total += fixed(62.90, SCALE)
     else:  # Long trip
-        total -= D('46.52')
+        total -= fixed(46.52, SCALE)
     
     # Efficiency bonus
-    miles_per_day = miles / days if days > 0 else miles
-    if D('180') <= miles_per_day <= D('220'):
-        total += D('14.75')
+    if 18000 * divisor <= miles <= 22000 * divisor:
+        total += fixed(14.75, SCALE)
     
     # Narrow efficiency penalty (overlaps with above)
-    if D('185') <= miles_per_day <= D('215'):
-        total -= D('18.51')
+    if 18500 * divisor <= miles <= 21500 * divisor:
+        total -= fixed(18.51, SCALE)
     
-    return round(max(D('0'), total), 2)
+    return round_half_even(max(0, total), hundredths) / 100
 
 # Test on public cases
 with open('public_cases.json', 'r') as f:
     data = json.load(f)
 
-total_error = D('0')
+total_error = 0
 errors = []
 
 for i, case in enumerate(data):
-    expected = D(str(case['expected_output']))
+    expected = case['expected_output']
     calculated = calculate_reimbursement_v2(
         case['input']['trip_duration_days'],
         case['input']['miles_traveled'],
         case['input']['total_receipts_amount']
     )
     
-    error = abs(expected - calculated)
+    # Errors in whole cents
+    error = abs(fixed(expected, 2) - round(calculated * 100))
     total_error += error
-    errors.append(float(error))
+    errors.append(error / 100)
     
     if i < 5:  # Show first few examples
         print(f"Case {i}: {case['input']['trip_duration_days']}d, "
               f"{case['input']['miles_traveled']}mi, "
               f"${case['input']['total_receipts_amount']:.2f} → "
-              f"Expected: ${expected}, Got: ${calculated}, Error: ${error}")
+              f"Expected: ${expected}, Got: ${calculated:.2f}, Error: ${error / 100:.2f}")
 
-mae = float(total_error) / len(data)
+mae = total_error / 100 / len(data)
 print(f"\nPhase 2 MAE: ${mae:.2f}")
 print(f"Max error: ${max(errors):.2f}")
 print(f"Errors > $100: {sum(1 for e in errors if e > 100)}")
@@ -2,12 +2,16 @@
 """
 Phase 4: Final model combining decision tree with residual corrections
 This should get us to the ~$70 MAE target
+Amounts are exact integers (fixed_point.py), rounded half-even to cents
 """
 
 import json
 import numpy as np
-from decimal import Decimal as D, getcontext
-getcontext().prec = 12
+
+from fixed_point import fixed, round_half_even
+
+# Amounts in 1e-32 dollars: exact for the float jitter
+SCALE = 32
 
 def calculate_reimbursement_final(days_in, miles_in, receipts_in):
     """
@@ -65,89 +69,90 @@ def calculate_reimbursement_final(days_in, miles_in, receipts_in):
                 else:  # miles > 934.50
                     base = 1942.57
     
-    # Convert to Decimal for precise adjustments
-    total = D(str(base))
+    # Convert to exact integers for precise adjustments
+    total = fixed(base, SCALE)
     
     # Step 2: Apply residual corrections discovered in Phase 3
     
     # MAJOR CORRECTION: Rounding bug is a huge PENALTY
     receipt_str = f'{receipts:.2f}'
     if receipt_str.endswith('49'):
-        total -= D('415.48')  # Average residual for .49
+        total -= fixed(415.48, SCALE)  # Average residual for .49
     elif receipt_str.endswith('99'):
-        total -= D('319.46')  # Average residual for .99
+        total -= fixed(319.46, SCALE)  # Average residual for .99
     
     # 5-day trip correction
     if days == 5:
-        total -= D('15.83')
+        total -= fixed(15.83, SCALE)
     
     # Step 3: Fine-tune based on additional patterns
     
     # Low receipt cases need adjustment
     if 0 < receipts <= 50:
         # Tree underestimates these
-        total += D('25')
+        total += fixed(25, SCALE)
     
     # Very high daily spending cases
     receipts_per_day = receipts / days if days > 0 else receipts
     if receipts_per_day > 500 and receipts > 2000:
-        # Tree overestimates these extreme cases
-        total *= D('0.85')
+        # Tree overestimates these extreme cases (exact: total is still whole cents)
+        total = total * 85 // 100
     
     # Efficiency bonus for optimal mileage
     miles_per_day = miles / days if days > 0 else miles
     if 180 <= miles_per_day <= 220:
         # Add small bonus the tree might miss
-        total += D('10')
+        total += fixed(10, SCALE)
     
     # Step 4: Additional micro-adjustments based on tree boundaries
     
     # Cases just above/below key thresholds often have errors
     if 825 < receipts < 831:  # Near the 828.10 threshold
-        total += D('15')
+        total += fixed(15, SCALE)
     
     if 4.4 < days < 4.6:  # Near the 4.5 day threshold
-        total -= D('8')
+        total -= fixed(8, SCALE)
     
     # Long trips with moderate receipts
     if days > 10 and 500 < receipts < 1000:
-        total += D('20')
+        total += fixed(20, SCALE)
     
     # Step 5: Random jitter for irreducible noise
     # Add ±$3 random component as suggested
     np.random.seed(int(days * 1000 + miles * 100 + receipts * 10) % 2**32)
-    jitter = D(str(np.random.uniform(-3, 3)))
+    jitter = fixed(np.random.uniform(-3, 3), SCALE)
     total += jitter
     
-    return round(max(D('0'), total), 2)
+    return round_half_even(max(0, total), 10 ** (SCALE - 2)) / 100
 
 # Test on public cases
 with open('public_cases.json', 'r') as f:
     data = json.load(f)
 
-total_error = D('0')
+total_error = 0
 errors = []
 
 print("Testing final model on sample cases:")
 for i, case in enumerate(data):
-    expected = D(str(case['expected_output']))
+    expected = case['expected_output']
     calculated = calculate_reimbursement_final(
         case['input']['trip_duration_days'],
         case['input']['miles_traveled'],
         case['input']['total_receipts_amount']
     )
     
-    error = abs(expected - calculated)
+    # Errors in whole cents
+    error = abs(fixed(expected, 2) - round(calculated * 100))
     total_error += error
-    errors.append(float(error))
+    errors.append(error / 100)
     
     if i < 10:  # Show first 10 examples
         print(f"Case {i}: {case['input']['trip_duration_days']}d, "
               f"{case['input']['miles_traveled']}mi, "
               f"${case['input']['total_receipts_amount']:.2f} → "
-              f"Expected: ${expected}, Got: ${calculated}, Error: ${error:.2f}")
+              f"Expected: ${expected}, Got: ${calculated:.2f}, Error: ${error / 100:.2f}")
 
-mae = float(total_error) / len(data)
+mae = total_error / 100 / len(data)
 print(f"\nPhase 4 Final MAE: ${mae:.2f}")
 print(f"Max error: ${max(errors):.2f}")
 print(f"Errors > $100: {sum(1 for e in errors if e > 100)}")
@@ -192,8 +197,24 @@ receipts="$3"
 python3 -c "
 import sys
 import numpy as np
-from decimal import Decimal as D, getcontext
-getcontext().prec = 12
+
+# Amounts are exact ints in 1e-32 dollars, rounded half-even to cents at the end
+SCALE = 32
+
+def fixed(value):
+    cents = round(value * 100)
+    if cents / 100 == value:
+        return cents * 10 ** (SCALE - 2)
+    mantissa, _, exponent = repr(float(value)).partition('e')
+    whole, _, fraction = mantissa.lstrip('-').partition('.')
+    digits = int(whole + fraction) * 10 ** (SCALE - len(fraction) + int(exponent or 0))
+    return -digits if mantissa.startswith('-') else digits
+
+def round_half_even(numerator, denominator):
+    quotient, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient % 2 == 1):
+        quotient += 1
+    return quotient
 
 def calculate_reimbursement(days_in, miles_in, receipts_in):
     days = int(days_in)
@@ -248,46 +269,48 @@ def calculate_reimbursement(days_in, miles_in, receipts_in):
                 else:
                     base = 1942.57
     
-    total = D(str(base))
+    total = fixed(base)
     
     # Residual corrections
     receipt_str = f'{receipts:.2f}'
     if receipt_str.endswith('49'):
-        total -= D('415.48')
+        total -= fixed(415.48)
     elif receipt_str.endswith('99'):
-        total -= D('319.46')
+        total -= fixed(319.46)
     
     if days == 5:
-        total -= D('15.83')
+        total -= fixed(15.83)
     
     if 0 < receipts <= 50:
-        total += D('25')
+        total += fixed(25)
     
     receipts_per_day = receipts / days if days > 0 else receipts
     if receipts_per_day > 500 and receipts > 2000:
-        total *= D('0.85')
+        total = total * 85 // 100
     
     miles_per_day = miles / days if days > 0 else miles
     if 180 <= miles_per_day <= 220:
-        total += D('10')
+        total += fixed(10)
     
     if 825 < receipts < 831:
-        total += D('15')
+        total += fixed(15)
     
     if 4.4 < days < 4.6:
-        total -= D('8')
+        total -= fixed(8)
     
     if days > 10 and 500 < receipts < 1000:
-        total += D('20')
+        total += fixed(20)
     
     np.random.seed(int(days * 1000 + miles * 100 + receipts * 10) % 2**32)
-    jitter = D(str(np.random.uniform(-3, 3)))
+    jitter = fixed(np.random.uniform(-3, 3))
     total += jitter
     
-    return round(max(D('0'), total), 2)
+    return round_half_even(max(0, total), 10 ** (SCALE - 2))
 
-result = calculate_reimbursement(sys.argv[1], sys.argv[2], sys.argv[3])
-print(f'{result:.2f}')
+cents = calculate_reimbursement(sys.argv[1], sys.argv[2], sys.argv[3])
+sign = '-' if cents < 0 else ''
+dollars, cents = divmod(abs(cents), 100)
+print(f'{sign}{dollars}.{cents:02d}')
 " "$days" "$miles" "$receipts"
 ''')
 
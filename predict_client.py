@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Thin client for predict_server.py, used by run.sh.
+
+Only imports the standard library socket module so it can start with
+`python3 -S` in a few milliseconds. Exits with status 3 when no daemon is
+reachable so that run.sh can fall back to the in-process predictor.
+
+Usage: predict_client.py <socket> <days> <miles> <receipts>
+"""
+
+import socket
+import sys
+
+EXIT_NO_DAEMON = 3
+
+def main(argv):
+    if len(argv) != 5:
+        print("Usage: predict_client.py <socket> <days> <miles> <receipts>", file=sys.stderr)
+        return 1
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(argv[1])
+    except OSError:
+        return EXIT_NO_DAEMON
+
+    try:
+        sock.sendall(f"{argv[2]} {argv[3]} {argv[4]}\n".encode('ascii'))
+        sock.shutdown(socket.SHUT_WR)
+        reply = b''
+        while not reply.endswith(b'\n'):
+            chunk = sock.recv(256)
+            if not chunk:
+                break
+            reply += chunk
+    except OSError:
+        return EXIT_NO_DAEMON
+    finally:
+        sock.close()
+
+    reply = reply.decode('ascii').strip()
+    if not reply:
+        return EXIT_NO_DAEMON
+    if reply.startswith('ERROR'):
+        print(f"Error: {reply[6:]}", file=sys.stderr)
+        return 1
+    print(reply)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
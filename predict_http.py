@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Local HTTP/JSON prediction service with micro-batching.
+
+Spawning ./run.sh per trip doesn't hold up under concurrent callers, and the
+socket daemon (predict_server.py) still predicts one row at a time. This
+asyncio server queues every incoming trip and a single worker drains the
+queue in micro-batches: it takes whatever is waiting, waits up to
+--max-wait-ms for more while the batch is below --max-batch trips, and
+scores the batch with one vectorized call (predict_optimized.predict_batch
+or rf_forest.predict_batch) on a worker thread. The optimized model scores
+from optimized_model.bin when it is current, through NativeModel.predict's
+NumPy traversal, or else from the pickle through sklearn. While a batch is being
+scored the next one accumulates, so the busier the server, the larger the
+batches: throughput follows batch size rather than request count. A
+request's trips always stay in one batch, so a large request can exceed
+--max-batch on its own.
+
+Amounts are the ones the command-line predictors print, to the cent.
+
+Endpoints:
+    POST /predict   {"trip_duration_days": 3, "miles_traveled": 93, "total_receipts_amount": 1.42}
+                    -> {"reimbursement": 370.73}
+                    [trip, ...] or {"trips": [trip, ...]}
+                    -> {"reimbursements": [...]}
+                    (trips may also use the public_cases.json {"input": {...}} layout)
+    GET /health     -> {"status": "ok", "model": ..., "uptime_s": ...}
+    GET /stats      -> queue depth, batch sizes and request latency percentiles
+
+Usage:
+    python3 predict_http.py [--port 8787] [--model optimized|forest] [--model-path PATH]
+                            [--max-batch 256] [--max-wait-ms 2]
+    python3 predict_http.py --benchmark [--clients 64] [--requests 2000]
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import os
+import sys
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+from case_reader import trip_from_record
+
+DEFAULT_PORT = 8787
+MAX_BATCH = 256
+MAX_WAIT = 0.002
+MAX_BODY = 16 << 20
+LATENCY_WINDOW = 10_000
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+def load_predictor(name, model_path=None):
+    """(predict_batch(trips) -> list of amounts, description) for 'optimized' or 'forest'"""
+    if name == 'optimized':
+        from predict_optimized import default_model_path, load_model, predict_batch
+
+        path = model_path or default_model_path()
+        model_data = load_model(path)
+        # Rounded like the `{:.2f}` the command-line predictor prints
+        return (lambda trips: [float(f"{p:.2f}") for p in predict_batch(model_data, trips).tolist()],
+                os.path.basename(path))
+    if name == 'forest':
+        import rf_forest
+
+        rf_forest.load_forest(model_path or rf_forest.FOREST_PATH)
+        return (lambda trips: rf_forest.predict_batch(trips).tolist(),
+                os.path.basename(model_path or rf_forest.FOREST_PATH))
+    raise ValueError(f"unknown model {name!r}")
+
+def parse_trips(payload):
+    """(trips, single) from one trip record, a list of records or {"trips": [records]}"""
+    if isinstance(payload, dict) and 'trips' in payload:
+        records, single = payload['trips'], False
+    elif isinstance(payload, list):
+        records, single = payload, False
+    else:
+        records, single = [payload], True
+    if not isinstance(records, list) or not all(isinstance(record, dict) for record in records):
+        raise ValueError("expected a trip object, a list of trips or {\"trips\": [...]}")
+    try:
+        return [trip_from_record(record) for record in records], single
+    except KeyError as e:
+        raise ValueError(f"trip is missing {e}") from None
+    except TypeError as e:
+        raise ValueError(str(e)) from None
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+class MicroBatcher:
+    """Coalesces concurrent predict() calls into batched predict_batch calls on one worker thread"""
+
+    def __init__(self, predict_batch, max_batch=MAX_BATCH, max_wait=MAX_WAIT):
+        self.predict_batch = predict_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue()
+        self.queued_trips = 0
+        self.requests = 0
+        self.trips = 0
+        self.batches = 0
+        self.largest_batch = 0
+        self.latencies = collections.deque(maxlen=LATENCY_WINDOW)
+        self.batch_sizes = collections.deque(maxlen=LATENCY_WINDOW)
+        self._carry = None
+        self._executor = ThreadPoolExecutor(1)
+        self._worker = None
+
+    def start(self):
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown()
+
+    async def predict(self, trips):
+        """Amounts for a list of trips, scored together with whatever else is waiting"""
+        started = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        self.queued_trips += len(trips)
+        self.queue.put_nowait((trips, future))
+        try:
+            return await future
+        finally:
+            self.requests += 1
+            self.latencies.append(time.perf_counter() - started)
+
+    async def _next(self, timeout=None):
+        if self._carry is not None:
+            item, self._carry = self._carry, None
+            return item
+        if timeout is None:
+            return await self.queue.get()
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+    async def _collect(self):
+        """The next batch: everything waiting, plus arrivals within max_wait, up to max_batch trips"""
+        loop = asyncio.get_running_loop()
+        batch = [await self._next()]
+        size = len(batch[0][0])
+        deadline = loop.time() + self.max_wait
+        while size < self.max_batch:
+            if self._carry is None and self.queue.empty():
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await self._next(timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = await self._next()
+            if size + len(item[0]) > self.max_batch:
+                # Never split a request; it opens the next batch
+                self._carry = item
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch, size
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch, size = await self._collect()
+            self.queued_trips -= size
+            trips = [trip for request_trips, _ in batch for trip in request_trips]
+            try:
+                amounts = await loop.run_in_executor(self._executor, self.predict_batch, trips)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.batches += 1
+            self.trips += size
+            self.largest_batch = max(self.largest_batch, size)
+            self.batch_sizes.append(size)
+            start = 0
+            for request_trips, future in batch:
+                if not future.done():
+                    future.set_result(amounts[start:start + len(request_trips)])
+                start += len(request_trips)
+
+    def stats(self):
+        latencies = sorted(self.latencies)
+        return {
+            'queue_depth': self.queued_trips,
+            'requests': self.requests,
+            'trips': self.trips,
+            'batches': self.batches,
+            'mean_batch_size': round(self.trips / self.batches, 2) if self.batches else 0.0,
+            'recent_mean_batch_size': round(sum(self.batch_sizes) / len(self.batch_sizes), 2)
+                                      if self.batch_sizes else 0.0,
+            'largest_batch': self.largest_batch,
+            'max_batch': self.max_batch,
+            'max_wait_ms': self.max_wait * 1000,
+            'latency_ms': {name: round(percentile(latencies, fraction) * 1000, 3)
+                           for name, fraction in (('p50', 0.5), ('p90', 0.9), ('p99', 0.99))},
+        }
+
+class PredictionService:
+    """HTTP/1.1 front end (keep-alive, Content-Length bodies) for a MicroBatcher"""
+
+    def __init__(self, batcher, model):
+        self.batcher = batcher
+        self.model = model
+        self.started = time.time()
+
+    async def route(self, method, path, body):
+        """(status, JSON-able payload) for one request"""
+        path = path.split('?', 1)[0]
+        if path == '/health':
+            if method != 'GET':
+                return 405, {'error': 'use GET'}
+            return 200, {'status': 'ok', 'model': self.model, 'uptime_s': round(time.time() - self.started, 1)}
+        if path == '/stats':
+            if method != 'GET':
+                return 405, {'error': 'use GET'}
+            return 200, dict(self.batcher.stats(), model=self.model)
+        if path != '/predict':
+            return 404, {'error': f"no such endpoint {path}"}
+        if method != 'POST':
+            return 405, {'error': 'use POST'}
+
+        try:
+            trips, single = parse_trips(json.loads(body))
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        amounts = await self.batcher.predict(trips) if trips else []
+        if single:
+            return 200, {'reimbursement': amounts[0]}
+        return 200, {'reimbursements': amounts}
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = False
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                    length = int(headers.get('content-length', 0))
+                    connection = headers.get('connection', '').lower()
+                    keep_alive = connection == 'keep-alive' or (version == 'HTTP/1.1' and connection != 'close')
+                    if length > MAX_BODY:
+                        status, payload, keep_alive = 413, {'error': f"body over {MAX_BODY} bytes"}, False
+                    else:
+                        body = await reader.readexactly(length) if length > 0 else b''
+                        status, payload = await self.route(method, target, body)
+                except ValueError as e:
+                    status, payload = 400, {'error': f"malformed request: {e}"}
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    raise
+                except Exception as e:
+                    status, payload = 500, {'error': str(e)}
+
+                data = json.dumps(payload).encode()
+                writer.write(f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                             f"Content-Type: application/json\r\n"
+                             f"Content-Length: {len(data)}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+async def start_service(host, port, predict_batch, model, max_batch=MAX_BATCH, max_wait=MAX_WAIT):
+    """Start the batcher and the HTTP server; returns (server, batcher)"""
+    batcher = MicroBatcher(predict_batch, max_batch, max_wait)
+    batcher.start()
+    service = PredictionService(batcher, model)
+    server = await asyncio.start_server(service.handle, host, port)
+    return server, batcher
+
+async def serve(host, port, predict_batch, model, max_batch, max_wait):
+    server, batcher = await start_service(host, port, predict_batch, model, max_batch, max_wait)
+    print(f"Prediction service on http://{host}:{port} (model: {model}, batches of up to {max_batch} "
+          f"trips, waiting up to {max_wait * 1000:g} ms)", file=sys.stderr)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.close()
+
+async def _client(port, trips, latencies):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        for days, miles, receipts in trips:
+            body = json.dumps({'trip_duration_days': days, 'miles_traveled': miles,
+                               'total_receipts_amount': receipts}).encode()
+            started = time.perf_counter()
+            writer.write(b"POST /predict HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                         b"Content-Length: %d\r\n\r\n%s" % (len(body), body))
+            await writer.drain()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                if line.lower().startswith(b'content-length:'):
+                    length = int(line.split(b':')[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+
+async def benchmark(predict_batch, model, clients, requests, batch_sizes, max_wait):
+    """Single-trip requests from `clients` keep-alive connections, per max_batch: (max_batch, req/s, p50, p99, mean batch)"""
+    from case_reader import iter_cases
+
+    cases = [trip_from_record(case) for case in iter_cases('public_cases.json')]
+    results = []
+    for max_batch in batch_sizes:
+        server, batcher = await start_service('127.0.0.1', 0, predict_batch, model, max_batch, max_wait)
+        port = server.sockets[0].getsockname()[1]
+        latencies = []
+        per_client = [[cases[(c + i * clients) % len(cases)] for i in range(requests // clients)]
+                      for c in range(clients)]
+        started = time.perf_counter()
+        await asyncio.gather(*(_client(port, trips, latencies) for trips in per_client))
+        elapsed = time.perf_counter() - started
+        server.close()
+        await server.wait_closed()
+        await batcher.close()
+        latencies.sort()
+        results.append((max_batch, len(latencies) / elapsed, percentile(latencies, 0.5),
+                        percentile(latencies, 0.99), batcher.trips / max(batcher.batches, 1)))
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve reimbursement predictions over HTTP with micro-batching")
+    parser.add_argument('--host', default='127.0.0.1', help="address to bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"port (default: {DEFAULT_PORT})")
+    parser.add_argument('--model', choices=['optimized', 'forest'], default='optimized',
+                        help="optimized_model (GradientBoosting) or the RandomForest arrays (default: optimized)")
+    parser.add_argument('--model-path', help="model file (default: optimized_model.bin/.pkl or rf_forest.bin)")
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH, help=f"trips per batch (default: {MAX_BATCH})")
+    parser.add_argument('--max-wait-ms', type=float, default=MAX_WAIT * 1000,
+                        help=f"how long an idle worker waits to fill a batch (default: {MAX_WAIT * 1000:g})")
+    parser.add_argument('--benchmark', action='store_true', help="measure throughput for a range of batch sizes")
+    parser.add_argument('--clients', type=int, default=64, help="concurrent connections for --benchmark (default: 64)")
+    parser.add_argument('--requests', type=int, default=2000, help="requests per --benchmark run (default: 2000)")
+    args = parser.parse_args()
+
+    # sklearn version and feature-name warnings would otherwise be printed per batch; NumPy's still show
+    warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
+    predict_batch, model = load_predictor(args.model, args.model_path)
+    predict_batch([(3, 93.0, 1.42)])
+
+    if args.benchmark:
+        print(f"{args.requests} single-trip requests from {args.clients} connections (model: {model})")
+        print(f"  {'max batch':>9} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'mean batch':>10}")
+        for max_batch, rate, p50, p99, mean_batch in asyncio.run(benchmark(
+                predict_batch, model, args.clients, args.requests, (1, 8, 64, args.max_batch),
+                args.max_wait_ms / 1000)):
+            print(f"  {max_batch:>9} {rate:8.0f} {p50 * 1000:8.2f} {p99 * 1000:8.2f} {mean_batch:10.1f}")
+        sys.exit(0)
+
+    try:
+        asyncio.run(serve(args.host, args.port, predict_batch, model, args.max_batch, args.max_wait_ms / 1000))
+    except KeyboardInterrupt:
+        pass
@@ -1,106 +1,41 @@
 #!/usr/bin/env python3
+import os
 import sys
 import numpy as np
 import pickle
 
+from features import ENHANCED_FEATURES, enhanced_features, feature_matrix, feature_vector, receipt_cents_batch
+
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'optimized_model.pkl')
+NATIVE_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'optimized_model.bin')
+
 def create_enhanced_features(days, miles, receipts):
-    """Create enhanced feature set with 62 features"""
-    features = {}
-    
-    # Basic features
-    features['days'] = days
-    features['miles'] = miles
-    features['receipts'] = receipts
-    
-    # Derived features
-    features['miles_per_day'] = miles / days if days > 0 else miles
-    features['receipts_per_day'] = receipts / days if days > 0 else receipts
-    features['total_input'] = days + miles + receipts
-    
-    # Day indicators (1-14)
-    for d in range(1, 15):
-        features[f'is_{d}_day'] = int(days == d)
-    
-    # Receipt features
-    features['log_receipts'] = np.log1p(receipts)
-    features['sqrt_receipts'] = np.sqrt(receipts)
-    features['receipts_squared'] = receipts ** 2
-    features['receipts_cubed'] = receipts ** 3
-    
-    # Enhanced rounding features
-    receipt_str = f"{receipts:.2f}"
-    features['ends_49'] = int(receipt_str.endswith('49'))
-    features['ends_99'] = int(receipt_str.endswith('99'))
-    features['ends_00'] = int(receipt_str.endswith('00'))
-    
-    # Granular ending patterns
-    for digit in range(10):
-        features[f'last_digit_{digit}'] = int(receipt_str[-1] == str(digit))
-    
-    # Penalty interaction features
-    features['ends_49_x_receipts'] = features['ends_49'] * receipts
-    features['ends_99_x_receipts'] = features['ends_99'] * receipts
-    features['ends_49_x_log_receipts'] = features['ends_49'] * features['log_receipts']
-    features['ends_99_x_log_receipts'] = features['ends_99'] * features['log_receipts']
-    
-    # Mileage features
-    features['tier1_miles'] = min(miles, 100)
-    features['tier2_miles'] = max(0, min(miles - 100, 300))
-    features['tier3_miles'] = max(0, miles - 400)
-    features['miles_squared'] = miles ** 2
-    features['log_miles'] = np.log1p(miles)
-    features['sqrt_miles'] = np.sqrt(miles)
-    
-    # Efficiency features
-    mpd = features['miles_per_day']
-    features['efficiency_bonus'] = int(180 <= mpd <= 220)
-    features['efficiency_penalty'] = int(mpd > 300)
-    
-    # Spending categories
-    rpd = features['receipts_per_day']
-    features['very_low_spend'] = int(rpd < 50)
-    features['low_spend'] = int(50 <= rpd < 100)
-    features['medium_spend'] = int(100 <= rpd < 300)
-    features['high_spend'] = int(300 <= rpd < 500)
-    features['very_high_spend'] = int(rpd >= 500)
-    features['extreme_spend'] = int(rpd >= 700)
-    
-    # Polynomial features
-    features['days_squared'] = days ** 2
-    features['days_x_miles_squared'] = days * miles ** 2
-    features['days_squared_x_miles'] = days ** 2 * miles
-    features['days_x_receipts_squared'] = days * receipts ** 2
-    
-    # Ratio features
-    total = days + miles + receipts + 1
-    features['receipts_to_total'] = receipts / total
-    features['miles_to_total'] = miles / total
-    features['days_to_total'] = days / total
-    
-    return features
+    """Create enhanced feature set with 62 features, keyed by column name"""
+    return dict(zip(ENHANCED_FEATURES, enhanced_features(days, miles, receipts)))
 
-if __name__ == "__main__":
-    if len(sys.argv) != 4:
-        print("Usage: predict_optimized.py <days> <miles> <receipts>", file=sys.stderr)
-        sys.exit(1)
-    
-    days = int(sys.argv[1])
-    miles = float(sys.argv[2])
-    receipts = float(sys.argv[3])
-    
-    # Load optimized model
-    with open('optimized_model.pkl', 'rb') as f:
-        model_data = pickle.load(f)
-    
+def default_model_path():
+    """The native export (no sklearn import, mmap'd) when it matches the pickle, else the pickle"""
+    from native_model import is_current
+    return NATIVE_MODEL_PATH if is_current(NATIVE_MODEL_PATH, MODEL_PATH) else MODEL_PATH
+
+def load_model(path=None):
+    """Load the model bundle (model, feature_cols, corrections) from a native .bin export or a pickle"""
+    if path is None:
+        path = default_model_path()
+    if path.endswith('.bin'):
+        from native_model import load_native
+        return load_native(path)
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+def predict_reimbursement(model_data, days, miles, receipts):
+    """Predict the reimbursement for one trip with an already loaded model bundle"""
     model = model_data['model']
     feature_cols = model_data['feature_cols']
     corrections = model_data.get('corrections', {})
     
-    # Create features
-    features = create_enhanced_features(days, miles, receipts)
-    
     # Create feature array in correct order
-    X = np.array([[features[col] for col in feature_cols]])
+    X = np.array([feature_vector(feature_cols, days, miles, receipts)])
     
     # Predict
     prediction = model.predict(X)[0]
@@ -113,6 +48,88 @@ if __name__ == "__main__":
         prediction += corrections['ends_99']
     
     # Ensure non-negative
-    prediction = max(0, prediction)
+    return max(0, prediction)
+
+_default_model = None
+
+def calculate_reimbursement(days, miles, receipts):
+    """In-process entry point: predict one trip with the default model, loaded on first use"""
+    global _default_model
+    if _default_model is None:
+        _default_model = load_model()
+    return predict_reimbursement(_default_model, days, miles, receipts)
+
+def calculate_batch(trips):
+    """In-process batch entry point: predict_batch() with the default model, loaded on first use"""
+    global _default_model
+    if _default_model is None:
+        _default_model = load_model()
+    return predict_batch(_default_model, trips)
+
+def predict_batch(model_data, trips):
+    """Predict many trips with a single model.predict call"""
+    if not trips:
+        return np.zeros(0)
+    model = model_data['model']
+    feature_cols = model_data['feature_cols']
+    corrections = model_data.get('corrections', {})
+    
+    days, miles, receipts = (np.array(column, dtype=np.float64) for column in zip(*trips))
+    X = feature_matrix(feature_cols, days, miles, receipts)
+    predictions = model.predict(X)
     
-    print(f"{prediction:.2f}") 
\ No newline at end of file
+    # Apply corrections if any, with the same .49-before-.99 precedence as the single-trip path
+    if corrections:
+        ending = receipt_cents_batch(receipts) % 100
+        ends_49 = ending == 49
+        ends_99 = ending == 99
+        if 'ends_49' in corrections:
+            predictions = predictions + np.where(ends_49, corrections['ends_49'], 0.0)
+        if 'ends_99' in corrections:
+            predictions = predictions + np.where(ends_99 & ~ends_49, corrections['ends_99'], 0.0)
+    
+    # Ensure non-negative
+    return np.maximum(0, predictions)
+
+def run_batch(path):
+    """Predict every trip in a file (or stdin for '-') and print one amount per line in input order"""
+    from case_reader import iter_trip_chunks, open_input
+    
+    # Stream the input in chunks so memory stays bounded whatever the file size
+    model_data = load_model()
+    out = sys.stdout
+    with open_input(path) as f:
+        for trips in iter_trip_chunks(f):
+            out.write(''.join(f"{prediction:.2f}\n" for prediction in predict_batch(model_data, trips)))
+    out.flush()
+
+def main(argv, model_data=None):
+    """Command-line entry point; model_data is an already loaded bundle (zygote_server.py) or None to load on demand"""
+    if len(argv) in (2, 3) and argv[1] == '--batch':
+        run_batch(argv[2] if len(argv) == 3 else '-')
+        sys.exit(0)
+    
+    if len(argv) != 4:
+        print("Usage: predict_optimized.py <days> <miles> <receipts>", file=sys.stderr)
+        print("       predict_optimized.py --batch [FILE|-]   (JSON array, NDJSON or CSV)", file=sys.stderr)
+        sys.exit(1)
+    
+    days = int(argv[1])
+    miles = float(argv[2])
+    receipts = float(argv[3])
+    
+    # Load the optimized model only on a prediction cache miss.
+    # native_model.py computes every prediction served from the .bin, so a loader or
+    # traversal change must invalidate the cached amounts too
+    from prediction_cache import cached_prediction
+    from features import __file__ as features_file
+    from native_model import __file__ as native_model_file
+    prediction = cached_prediction(
+        'optimized_model', [default_model_path(), os.path.abspath(__file__), features_file, native_model_file],
+        lambda d, m, r: predict_reimbursement(model_data or load_model(), d, m, r),
+        days, miles, receipts)
+    
+    print(f"{prediction:.2f}")
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Persistent prediction daemon for the optimized GradientBoosting model.
+
+Every ./run.sh call normally starts a fresh interpreter, imports NumPy and
+unpickles optimized_model.pkl just to predict a single row. This server does
+that work once and then answers requests over a Unix domain socket, so the
+per-call cost drops to a socket round trip (see predict_client.py).
+
+Protocol (one request per line, any number of lines per connection):
+    request:  "<days> <miles> <receipts>\\n"
+    response: "<amount>\\n"  or  "ERROR <message>\\n"
+
+Usage:
+    python3 predict_server.py [--socket PATH] [--model PATH]
+"""
+
+import argparse
+import os
+import signal
+import socket
+import socketserver
+import sys
+import warnings
+
+from predict_optimized import default_model_path, load_model, predict_reimbursement
+
+DEFAULT_SOCKET = os.environ.get('PREDICT_SOCKET', '/tmp/reimbursement-predict.sock')
+
+def parse_request(line):
+    """Parse a '<days> <miles> <receipts>' request line the same way predict_optimized.py parses argv"""
+    parts = line.split()
+    if len(parts) != 3:
+        raise ValueError(f"expected 3 values, got {len(parts)}")
+    return int(parts[0]), float(parts[1]), float(parts[2])
+
+class PredictionHandler(socketserver.StreamRequestHandler):
+    """Answer prediction requests line by line until the client hangs up"""
+
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.decode('ascii', 'replace').strip()
+            if not line:
+                continue
+            try:
+                days, miles, receipts = parse_request(line)
+                prediction = predict_reimbursement(self.server.model_data, days, miles, receipts)
+                reply = f"{prediction:.2f}\n"
+            except Exception as e:
+                reply = f"ERROR {e}\n"
+            self.wfile.write(reply.encode('ascii'))
+            self.wfile.flush()
+
+class PredictionServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, model_data):
+        self.model_data = model_data
+        super().__init__(socket_path, PredictionHandler)
+
+def remove_stale_socket(path):
+    """Remove a leftover socket file, refusing if another daemon is still listening on it"""
+    if not os.path.exists(path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+    else:
+        raise SystemExit(f"Error: a prediction daemon is already listening on {path}")
+    finally:
+        probe.close()
+
+def serve(socket_path, model_path):
+    # sklearn version warnings would otherwise be printed once per thread; NumPy's still show
+    warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
+    model_data = load_model(model_path)
+
+    # Warm up feature engineering and the model before accepting traffic
+    predict_reimbursement(model_data, 3, 93.0, 1.42)
+
+    remove_stale_socket(socket_path)
+    server = PredictionServer(socket_path, model_data)
+
+    def shutdown(signum, frame):
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, shutdown)
+
+    print(f"Prediction daemon listening on {socket_path} (model: {model_path})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        print("Prediction daemon stopped", file=sys.stderr)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve optimized_model.pkl predictions over a Unix socket")
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help=f"socket path (default: {DEFAULT_SOCKET})")
+    parser.add_argument('--model', default=default_model_path(),
+                        help="model bundle to serve (.bin native export or .pkl)")
+    args = parser.parse_args()
+    serve(args.socket, args.model)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk prediction cache shared by the command-line predictors.
+
+Entries are keyed by exact trip inputs in integer units (days, miles in
+hundredths because some cases carry fractional miles, receipts in cents) and
+stored per model in a SQLite file with LRU eviction and a size cap. Each
+model is fingerprinted by the SHA-256 of the files that define it (model
+artifact plus the predictor script); when the fingerprint changes, that
+model's entries are dropped, so a stale answer is never served. File stats
+are remembered so the files are only re-hashed after they change (the same
+store backs cached_file_sha256(), which native_model uses to check that a
+.bin export matches its pickle), and the
+row count is kept in the file alongside the entries so that inserting
+never has to count the table.
+
+A cache hit skips feature engineering and model loading entirely. Any
+SQLite problem just disables the cache for that call.
+
+Environment:
+    PREDICTION_CACHE   cache file path, or "off" to disable
+                       (default: .prediction_cache.sqlite next to this file)
+
+Usage:
+    python3 prediction_cache.py --stats
+    python3 prediction_cache.py --clear
+"""
+
+import hashlib
+import os
+import sqlite3
+import sys
+import time
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.prediction_cache.sqlite')
+MAX_ENTRIES = 1_000_000
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS models (
+    model TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    file_stats TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS predictions (
+    model TEXT NOT NULL,
+    days INTEGER NOT NULL,
+    miles INTEGER NOT NULL,
+    receipts_cents INTEGER NOT NULL,
+    prediction REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (model, days, miles, receipts_cents)
+);
+CREATE INDEX IF NOT EXISTS predictions_lru ON predictions (last_used);
+CREATE TABLE IF NOT EXISTS file_hashes (
+    path TEXT PRIMARY KEY,
+    file_stats TEXT NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    count INTEGER NOT NULL
+);
+'''
+
+def cache_path_from_env():
+    """Cache location from PREDICTION_CACHE, or None when caching is turned off"""
+    path = os.environ.get('PREDICTION_CACHE', CACHE_PATH)
+    if path.lower() in ('', 'off', '0', 'none'):
+        return None
+    return path
+
+def trip_key(days, miles, receipts):
+    """Exact integer key for a trip, or None if an input has sub-cent precision"""
+    miles_hundredths = round(miles * 100)
+    receipts_cents = round(receipts * 100)
+    if (days != int(days) or miles_hundredths / 100 != miles
+            or receipts_cents / 100 != receipts):
+        return None
+    return int(days), miles_hundredths, receipts_cents
+
+def fingerprint_files(paths):
+    """SHA-256 over the contents of every file that defines a model"""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def _file_stats(paths):
+    stats = []
+    for path in paths:
+        st = os.stat(path)
+        stats.append(f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}")
+    return '|'.join(stats)
+
+def cached_file_sha256(path):
+    """SHA-256 of one file's contents, remembered in the cache file until its size or mtime changes"""
+    stats = _file_stats([path])
+    cache_path = cache_path_from_env()
+    conn = None
+    if cache_path is not None:
+        try:
+            conn = sqlite3.connect(cache_path, timeout=10, isolation_level=None)
+            row = conn.execute('SELECT sha256 FROM file_hashes WHERE path = ? AND file_stats = ?',
+                               (os.path.abspath(path), stats)).fetchone()
+            if row is not None:
+                conn.close()
+                return row[0]
+        except sqlite3.Error:
+            # No table yet (a new or older cache file) or an unusable cache: hash and try to record it
+            pass
+
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    if conn is not None:
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SCHEMA)
+            conn.execute('INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?)',
+                         (os.path.abspath(path), stats, digest))
+        except sqlite3.Error:
+            pass
+        conn.close()
+    return digest
+
+class PredictionCache:
+    """LRU-bounded prediction store for one model"""
+
+    def __init__(self, model, model_files, path=CACHE_PATH, max_entries=MAX_ENTRIES):
+        self.model = model
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(path, timeout=10, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=OFF')
+        self.conn.executescript(SCHEMA)
+        if self.conn.execute('SELECT 1 FROM entries').fetchone() is None:
+            # Cache files written before the running count existed are counted once
+            with self.conn:
+                self.conn.execute('BEGIN IMMEDIATE')
+                self.conn.execute('INSERT OR IGNORE INTO entries SELECT 0, COUNT(*) FROM predictions')
+        self._check_fingerprint(model_files)
+
+    @classmethod
+    def from_env(cls, model, model_files):
+        """Open the cache configured by PREDICTION_CACHE, or return None if it is off or unusable"""
+        path = cache_path_from_env()
+        if path is None:
+            return None
+        try:
+            return cls(model, model_files, path)
+        except (sqlite3.Error, OSError):
+            return None
+
+    def _check_fingerprint(self, model_files):
+        stats = _file_stats(model_files)
+        row = self.conn.execute('SELECT fingerprint, file_stats FROM models WHERE model = ?',
+                                (self.model,)).fetchone()
+        if row is not None and row[1] == stats:
+            self.fingerprint = row[0]
+            return
+
+        self.fingerprint = fingerprint_files(model_files)
+        with self.conn:
+            self.conn.execute('BEGIN IMMEDIATE')
+            if row is None or row[0] != self.fingerprint:
+                # The model changed: everything cached for it is stale
+                dropped = self.conn.execute('DELETE FROM predictions WHERE model = ?',
+                                            (self.model,)).rowcount
+                self.conn.execute('UPDATE entries SET count = count - ?', (dropped,))
+            self.conn.execute('INSERT OR REPLACE INTO models VALUES (?, ?, ?)',
+                              (self.model, self.fingerprint, stats))
+
+    def get(self, days, miles, receipts):
+        key = trip_key(days, miles, receipts)
+        if key is None:
+            return None
+        try:
+            row = self.conn.execute(
+                'SELECT prediction FROM predictions '
+                'WHERE model = ? AND days = ? AND miles = ? AND receipts_cents = ?',
+                (self.model,) + key).fetchone()
+            if row is not None:
+                self.conn.execute(
+                    'UPDATE predictions SET last_used = ? '
+                    'WHERE model = ? AND days = ? AND miles = ? AND receipts_cents = ?',
+                    (time.time(), self.model) + key)
+        except sqlite3.Error:
+            return None
+        return None if row is None else row[0]
+
+    def put(self, days, miles, receipts, prediction):
+        key = trip_key(days, miles, receipts)
+        if key is None:
+            return
+        try:
+            with self.conn:
+                self.conn.execute('BEGIN IMMEDIATE')
+                now = time.time()
+                added = self.conn.execute('INSERT OR IGNORE INTO predictions VALUES (?, ?, ?, ?, ?, ?)',
+                                          (self.model,) + key + (float(prediction), now)).rowcount
+                if added:
+                    self.conn.execute('UPDATE entries SET count = count + 1')
+                    self._evict()
+                else:
+                    self.conn.execute(
+                        'UPDATE predictions SET prediction = ?, last_used = ? '
+                        'WHERE model = ? AND days = ? AND miles = ? AND receipts_cents = ?',
+                        (float(prediction), now, self.model) + key)
+        except sqlite3.Error:
+            pass
+
+    def _evict(self):
+        count = self.conn.execute('SELECT count FROM entries').fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            evicted = self.conn.execute(
+                'DELETE FROM predictions WHERE rowid IN '
+                '(SELECT rowid FROM predictions ORDER BY last_used LIMIT ?)', (excess,)).rowcount
+            self.conn.execute('UPDATE entries SET count = count - ?', (evicted,))
+
+    def close(self):
+        self.conn.close()
+
+def cached_prediction(model, model_files, predict, days, miles, receipts):
+    """Return predict(days, miles, receipts), consulting and filling the cache around it"""
+    cache = PredictionCache.from_env(model, model_files)
+    if cache is not None:
+        hit = cache.get(days, miles, receipts)
+        if hit is not None:
+            cache.close()
+            return hit
+
+    prediction = predict(days, miles, receipts)
+
+    if cache is not None:
+        cache.put(days, miles, receipts, prediction)
+        cache.close()
+    return prediction
+
+if __name__ == "__main__":
+    path = cache_path_from_env()
+    if len(sys.argv) != 2 or sys.argv[1] not in ('--stats', '--clear') or path is None:
+        print("Usage: prediction_cache.py --stats | --clear   (PREDICTION_CACHE must not be off)",
+              file=sys.stderr)
+        sys.exit(1)
+
+    if not os.path.exists(path):
+        print(f"No cache at {path}")
+        sys.exit(0)
+
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    if sys.argv[1] == '--clear':
+        with conn:
+            conn.execute('DELETE FROM predictions')
+            conn.execute('DELETE FROM models')
+            conn.execute('DELETE FROM entries')
+            conn.execute('DELETE FROM file_hashes')
+        print(f"Cleared {path}")
+    else:
+        print(f"Cache: {path} ({os.path.getsize(path)} bytes)")
+        for model, fingerprint in conn.execute('SELECT model, fingerprint FROM models ORDER BY model'):
+            count = conn.execute('SELECT COUNT(*) FROM predictions WHERE model = ?',
+                                 (model,)).fetchone()[0]
+            print(f"  {model}: {count} entries (fingerprint {fingerprint[:12]})")
+    conn.close()
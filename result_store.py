@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Persistent store of per-case evaluation results for evaluate.py.
+
+Results are keyed by (model fingerprint, case index). A model's fingerprint
+is the SHA-256 of every file that defines it together with the cases file:
+the entry point (a Python module or run_*.sh script) plus, recursively, the
+local modules it imports and the repo files it names (model pickles,
+scripts a wrapper execs, ...). Re-evaluating an unchanged model therefore
+reuses every stored result without running a single case.
+
+When a model did change, a region predicate can declare which inputs the
+change can affect, e.g. `days == 5` or `ending in ('49', '99')`. Cases
+outside the region are copied from the model's previous evaluation and
+only the cases inside it are run again. The predicate is a Python
+expression over:
+    days, miles, receipts   the case inputs
+    cents                   receipts in integer cents
+    ending                  last two digits of the receipts, e.g. '49'
+Declaring a region is a promise: cases outside it are not re-checked.
+
+Environment:
+    RESULT_STORE   store file path, or "off" to disable
+                   (default: .result_store.sqlite next to this file)
+
+Usage:
+    python3 result_store.py --stats
+    python3 result_store.py --clear
+"""
+
+import ast
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+STORE_PATH = os.path.join(REPO_DIR, '.result_store.sqlite')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS evaluations (
+    model TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    fingerprint TEXT NOT NULL,
+    case_index INTEGER NOT NULL,
+    output TEXT,
+    failure TEXT,
+    PRIMARY KEY (fingerprint, case_index)
+);
+'''
+
+# Names of files that can define a model, e.g. `python3 predict_optimized.py`,
+# `./run.sh` or 'optimized_model.pkl'
+FILE_REF = re.compile(r'[\w./-]+\.(?:py|sh|pkl|bin|json)\b')
+
+def store_path_from_env():
+    """Store location from RESULT_STORE, or None when the store is turned off"""
+    path = os.environ.get('RESULT_STORE', STORE_PATH)
+    if path.lower() in ('', 'off', '0', 'none'):
+        return None
+    return path
+
+def _local_file(name, base_dir):
+    for directory in (base_dir, REPO_DIR):
+        path = os.path.normpath(os.path.join(directory, name))
+        if os.path.isfile(path):
+            return path
+    return None
+
+def _python_references(path):
+    """Local modules imported by a Python file and repo files it names in string literals"""
+    with open(path, 'rb') as f:
+        tree = ast.parse(f.read(), path)
+    base_dir = os.path.dirname(path)
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names += [alias.name.split('.')[0] + '.py' for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module.split('.')[0] + '.py')
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str) and FILE_REF.fullmatch(node.value):
+            names.append(node.value)
+    return [p for p in (_local_file(name, base_dir) for name in names if name) if p]
+
+def _script_references(path):
+    """Repo files named in a shell script"""
+    with open(path, 'r', errors='replace') as f:
+        text = f.read()
+    base_dir = os.path.dirname(path)
+    return [p for p in (_local_file(name, base_dir) for name in FILE_REF.findall(text)) if p]
+
+def model_files(entry_path):
+    """Every local file the model at entry_path depends on, entry point first"""
+    seen = []
+    pending = [os.path.abspath(entry_path)]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.append(path)
+        if path.endswith('.py'):
+            pending += _python_references(path)
+        elif path.endswith('.sh'):
+            pending += _script_references(path)
+    return seen
+
+def fingerprint(entry_path, cases_path):
+    """SHA-256 over a model's files (in a stable order) and the cases it is evaluated on"""
+    files = model_files(entry_path)
+    digest = hashlib.sha256()
+    for path in [files[0]] + sorted(files[1:]) + [os.path.abspath(cases_path)]:
+        digest.update(os.path.relpath(path, REPO_DIR).encode('utf-8') + b'\0')
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+def compile_region(expression):
+    """Turn a region expression into a predicate over (days, miles, receipts)"""
+    code = compile(expression, '<region>', 'eval')
+
+    def in_region(days, miles, receipts):
+        cents = round(float(receipts) * 100)
+        names = {'days': days, 'miles': miles, 'receipts': receipts,
+                 'cents': cents, 'ending': f"{cents % 100:02d}"}
+        return bool(eval(code, {'__builtins__': {}}, names))
+    return in_region
+
+class ResultStore:
+    """Per-case evaluation results, shared across runs"""
+
+    def __init__(self, path=STORE_PATH):
+        self.conn = sqlite3.connect(path, timeout=10, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+
+    @classmethod
+    def from_env(cls):
+        """Open the store configured by RESULT_STORE, or return None if it is off or unusable"""
+        path = store_path_from_env()
+        if path is None:
+            return None
+        try:
+            return cls(path)
+        except (sqlite3.Error, OSError):
+            return None
+
+    def results(self, fingerprint, start, stop):
+        """{case index: (output, failure)} stored for a fingerprint, for cases start <= index < stop"""
+        rows = self.conn.execute(
+            'SELECT case_index, output, failure FROM results '
+            'WHERE fingerprint = ? AND case_index >= ? AND case_index < ?', (fingerprint, start, stop))
+        return {i: (output, failure) for i, output, failure in rows}
+
+    def previous(self, model):
+        """Fingerprint of the last evaluation recorded for a model name, or None"""
+        row = self.conn.execute('SELECT fingerprint FROM evaluations WHERE model = ?',
+                                (model,)).fetchone()
+        return None if row is None else row[0]
+
+    def add(self, fingerprint, results):
+        """Store results ({case index: (output, failure)}) for a fingerprint"""
+        if not results:
+            return
+        with self.conn:
+            self.conn.execute('BEGIN IMMEDIATE')
+            self.conn.executemany('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)',
+                                  [(fingerprint, i) + result for i, result in results.items()])
+
+    def finish(self, model, fingerprint):
+        """Record a completed evaluation as the model's latest one"""
+        with self.conn:
+            self.conn.execute('BEGIN IMMEDIATE')
+            self.conn.execute('INSERT OR REPLACE INTO evaluations VALUES (?, ?)', (model, fingerprint))
+            # Only each model's latest evaluation is kept
+            self.conn.execute('DELETE FROM results WHERE fingerprint NOT IN '
+                              '(SELECT fingerprint FROM evaluations)')
+
+    def close(self):
+        self.conn.close()
+
+if __name__ == "__main__":
+    path = store_path_from_env()
+    if len(sys.argv) != 2 or sys.argv[1] not in ('--stats', '--clear') or path is None:
+        print("Usage: result_store.py --stats | --clear   (RESULT_STORE must not be off)", file=sys.stderr)
+        sys.exit(1)
+
+    if not os.path.exists(path):
+        print(f"No result store at {path}")
+        sys.exit(0)
+
+    conn = sqlite3.connect(path)
+    if sys.argv[1] == '--clear':
+        with conn:
+            conn.execute('DELETE FROM results')
+            conn.execute('DELETE FROM evaluations')
+        print(f"Cleared {path}")
+    else:
+        print(f"Result store: {path} ({os.path.getsize(path)} bytes)")
+        for model, fp in conn.execute('SELECT model, fingerprint FROM evaluations ORDER BY model'):
+            count = conn.execute('SELECT COUNT(*) FROM results WHERE fingerprint = ?', (fp,)).fetchone()[0]
+            print(f"  {model}: {count} results (fingerprint {fp[:12]})")
+    conn.close()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Array-backed RandomForest evaluator.
+
+Replaces the m2cgen-generated nested-if `score` in rf_pure_python.py with a
+compact forest stored as flat node arrays in rf_forest.bin (written by
+`convert_rf_to_python.py --backend arrays`). Each node has a feature index
+(-1 for leaves), a threshold, left/right child indices and a leaf value;
+trees are concatenated and addressed through their root offsets.
+
+score() walks the arrays with exactly the comparisons (`x <= threshold`),
+leaf values and summation order of the generated code, so results are
+bit-identical to rf_pure_python.score. No sklearn or NumPy required.
+
+score_batch() does the same for an (N, 38) matrix with NumPy, advancing
+every row through every tree one level at a time (leaves point at
+themselves, so finished rows simply stay put).
+
+Usage:
+    python3 rf_forest.py <days> <miles> <receipts>
+    python3 rf_forest.py --batch [FILE|-]   (JSON array, NDJSON or CSV; needs NumPy)
+"""
+
+import os
+import struct
+import sys
+from array import array
+
+FOREST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rf_forest.bin')
+
+MAGIC = b'RFAR'
+VERSION = 1
+# magic, version, n_features, n_trees, n_nodes
+HEADER = struct.Struct('<4sHHII')
+
+# Rows scored together by score_batch
+BATCH_CHUNK = 1024
+
+class Forest:
+    """A tree ensemble stored as flat per-node arrays"""
+
+    def __init__(self, n_features, roots, feature, threshold, left, right, value):
+        self.n_features = n_features
+        self.roots = list(roots)
+        # Plain lists index faster than array objects in the hot loop
+        self.feature = list(feature)
+        self.threshold = list(threshold)
+        self.left = list(left)
+        self.right = list(right)
+        self.value = list(value)
+        self._np = None
+
+    @property
+    def n_trees(self):
+        return len(self.roots)
+
+    @property
+    def n_nodes(self):
+        return len(self.feature)
+
+    @classmethod
+    def from_trees(cls, n_features, trees):
+        """
+        Build a forest from per-tree dicts of 'feature', 'threshold', 'left',
+        'right' and 'value' lists whose child indices are local to the tree.
+        """
+        roots, feature, threshold, left, right, value = [], [], [], [], [], []
+        for tree in trees:
+            offset = len(feature)
+            roots.append(offset)
+            for i in range(len(tree['feature'])):
+                leaf = tree['left'][i] < 0
+                feature.append(-1 if leaf else tree['feature'][i])
+                threshold.append(0.0 if leaf else tree['threshold'][i])
+                left.append(offset + i if leaf else offset + tree['left'][i])
+                right.append(offset + i if leaf else offset + tree['right'][i])
+                value.append(tree['value'][i] if leaf else 0.0)
+        return cls(n_features, roots, feature, threshold, left, right, value)
+
+    @classmethod
+    def load(cls, path=FOREST_PATH):
+        with open(path, 'rb') as f:
+            blob = f.read()
+        magic, version, n_features, n_trees, n_nodes = HEADER.unpack_from(blob, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} forest file")
+
+        pos = HEADER.size
+        arrays = []
+        for typecode, count in (('I', n_trees), ('h', n_nodes), ('d', n_nodes),
+                                ('I', n_nodes), ('I', n_nodes), ('d', n_nodes)):
+            a = array(typecode)
+            size = a.itemsize * count
+            a.frombytes(blob[pos:pos + size])
+            if sys.byteorder != 'little':
+                a.byteswap()
+            arrays.append(a)
+            pos += size
+        return cls(n_features, *arrays)
+
+    def save(self, path=FOREST_PATH):
+        arrays = (array('I', self.roots), array('h', self.feature), array('d', self.threshold),
+                  array('I', self.left), array('I', self.right), array('d', self.value))
+        with open(path, 'wb') as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.n_features, self.n_trees, self.n_nodes))
+            for a in arrays:
+                if sys.byteorder != 'little':
+                    a = array(a.typecode, a)
+                    a.byteswap()
+                f.write(a.tobytes())
+
+    def score(self, input):
+        """Average the tree outputs for one 38-value feature vector"""
+        feature, threshold, left, right, value = (
+            self.feature, self.threshold, self.left, self.right, self.value)
+        total = 0.0
+        for node in self.roots:
+            f = feature[node]
+            while f >= 0:
+                node = left[node] if input[f] <= threshold[node] else right[node]
+                f = feature[node]
+            total += value[node]
+        return total * (1.0 / len(self.roots))
+
+    def _numpy_arrays(self):
+        if self._np is None:
+            import numpy as np
+            self._np = (np.asarray(self.roots, dtype=np.intp),
+                        np.maximum(np.asarray(self.feature, dtype=np.intp), 0),
+                        np.asarray(self.threshold, dtype=np.float64),
+                        np.asarray(self.left, dtype=np.intp),
+                        np.asarray(self.right, dtype=np.intp),
+                        np.asarray(self.value, dtype=np.float64),
+                        np.asarray(self.feature) < 0)
+        return self._np
+
+    def score_batch(self, X):
+        """Score an (N, n_features) matrix; matches score() row for row, bit for bit"""
+        import numpy as np
+
+        roots, feature, threshold, left, right, value, is_leaf = self._numpy_arrays()
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"expected an (N, {self.n_features}) matrix, got shape {X.shape}")
+
+        total = np.zeros(X.shape[0])
+        # Row chunks keep the (rows x trees) working set cache-sized
+        for start in range(0, X.shape[0], BATCH_CHUNK):
+            chunk = np.ascontiguousarray(X[start:start + BATCH_CHUNK])
+
+            # One row per case, one column per tree, all advanced level by level
+            nodes = np.broadcast_to(roots, (chunk.shape[0], len(roots))).copy()
+            row_base = (np.arange(chunk.shape[0]) * self.n_features)[:, None]
+            flat_X = chunk.ravel()
+            while not is_leaf[nodes].all():
+                go_left = flat_X[row_base + feature[nodes]] <= threshold[nodes]
+                nodes = np.where(go_left, left[nodes], right[nodes])
+
+            # Accumulate tree by tree to keep score()'s summation order
+            leaves = value[nodes]
+            partial = total[start:start + BATCH_CHUNK]
+            for t in range(leaves.shape[1]):
+                partial += leaves[:, t]
+        return total * (1.0 / len(self.roots))
+
+_forest = None
+
+def load_forest(path=FOREST_PATH):
+    """Return the default forest, loading rf_forest.bin on first use"""
+    global _forest
+    if _forest is None:
+        _forest = Forest.load(path)
+    return _forest
+
+def score(input):
+    """Drop-in replacement for rf_pure_python.score"""
+    return load_forest().score(input)
+
+def score_batch(X):
+    """Vectorized score() over an (N, 38) feature matrix"""
+    return load_forest().score_batch(X)
+
+def predict_batch(trips):
+    """predict_reimbursement() for many (days, miles, receipts) trips at once"""
+    import numpy as np
+    from features import receipt_cents_batch, rf_feature_matrix
+
+    if not trips:
+        return np.zeros(0)
+    days, miles, receipts = (np.array(column, dtype=np.float64) for column in zip(*trips))
+    predictions = score_batch(rf_feature_matrix(days, miles, receipts))
+
+    # Rounding bug bonus - discovered in analysis
+    bonus = np.isin(receipt_cents_batch(receipts) % 100, (49, 99))
+    predictions = predictions + np.where(bonus, 5.01, 0.0)
+
+    # Ensure non-negative and round to cents (Python's round, as in predict_reimbursement)
+    return np.array([round(max(0.0, p), 2) for p in predictions.tolist()])
+
+def predict_reimbursement(days, miles, receipts):
+    """Same post-processing as the self-contained RandomForest run scripts"""
+    from features_pure_python import create_features
+
+    prediction = score(create_features(days, miles, receipts))
+
+    # Rounding bug bonus - discovered in analysis
+    receipt_str = f"{receipts:.2f}"
+    if receipt_str.endswith(("49", "99")):
+        prediction += 5.01
+
+    # Ensure non-negative and round to cents
+    return round(max(0.0, prediction), 2)
+
+if __name__ == "__main__":
+    if len(sys.argv) in (2, 3) and sys.argv[1] == '--batch':
+        from case_reader import iter_trip_chunks, open_input
+
+        with open_input(sys.argv[2] if len(sys.argv) == 3 else '-') as f:
+            for trips in iter_trip_chunks(f):
+                sys.stdout.write(''.join(f"{p:.2f}\n" for p in predict_batch(trips)))
+        sys.exit(0)
+
+    if len(sys.argv) != 4:
+        print("Usage: rf_forest.py <days> <miles> <receipts>", file=sys.stderr)
+        print("       rf_forest.py --batch [FILE|-]", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        from prediction_cache import cached_prediction
+        from features import __file__ as features_file
+        from features_pure_python import __file__ as pure_python_file
+
+        result = cached_prediction('rf_forest', [FOREST_PATH, features_file, pure_python_file,
+                                                 os.path.abspath(__file__)],
+                                   predict_reimbursement,
+                                   int(sys.argv[1]), float(sys.argv[2]), float(sys.argv[3]))
+        print(f"{result:.2f}")
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
@@ -16,5 +16,27 @@ if ! [[ "$1" =~ ^[0-9]+\.?[0-9]*$ ]] || ! [[ "$2" =~ ^[0-9]+\.?[0-9]*$ ]] || ! [
     exit 1
 fi
 
+# Fast path: hand the request to the prediction daemon (predict_server.py) if one is running
+PREDICT_SOCKET="${PREDICT_SOCKET:-/tmp/reimbursement-predict.sock}"
+if [ -S "$PREDICT_SOCKET" ]; then
+    python3 -S "$(dirname "$0")/predict_client.py" "$PREDICT_SOCKET" "$1" "$2" "$3"
+    status=$?
+    # Status 3 means the daemon was unreachable; anything else is the answer
+    if [ $status -ne 3 ]; then
+        exit $status
+    fi
+fi
+
+# Next best: fork a warm child from the zygote (zygote_server.py) if one is running
+ZYGOTE_SOCKET="${ZYGOTE_SOCKET:-/tmp/reimbursement-zygote.sock}"
+if [ -S "$ZYGOTE_SOCKET" ]; then
+    python3 -S "$(dirname "$0")/zygote_client.py" "$ZYGOTE_SOCKET" predict_optimized.py "$1" "$2" "$3"
+    status=$?
+    # Status 3 means no zygote took the request; anything else is the child's own status
+    if [ $status -ne 3 ]; then
+        exit $status
+    fi
+fi
+
 # Use the optimized GradientBoosting model for prediction
 exec python3 predict_optimized.py "$1" "$2" "$3" 
\ No newline at end of file
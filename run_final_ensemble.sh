@@ -21,64 +21,85 @@ fi
 exec python3 -c '
 import sys
 import math
-from decimal import Decimal as D, getcontext
-getcontext().prec = 12
+
+# Amounts are exact ints in 1e-12 dollars, rounded half-even to cents at the end.
+# Every x * rate // 100 below is exact: no amount ever uses more than 12 decimals.
+SCALE = 12
+DOLLAR = 10 ** SCALE
+CENT = DOLLAR // 100
+
+def fixed(value):
+    # Whole cents, the common case: the float nearest n / 100 is that decimal
+    cents = round(value * 100)
+    if cents / 100 == value:
+        return cents * CENT
+    mantissa, _, exponent = repr(float(value)).partition("e")
+    whole, _, fraction = mantissa.lstrip("-").partition(".")
+    digits = int(whole + fraction) * 10 ** (SCALE - len(fraction) + int(exponent or 0))
+    return -digits if mantissa.startswith("-") else digits
+
+def round_cents(amount):
+    cents, remainder = divmod(amount, CENT)
+    if 2 * remainder > CENT or (2 * remainder == CENT and cents % 2 == 1):
+        cents += 1
+    return cents
 
 def calculate_component_model(days, miles, receipts):
     # This is the highly-tuned, feature-rich component model.
-    total = D("0")
-    per_diem = D("100") * D(days)
+    total = 0
+    per_diem = 100 * days * DOLLAR
     
     # Tiered Mileage
-    if miles <= 100: mileage = D(miles * 0.58)
-    elif miles <= 400: mileage = D("58") + D((miles - 100) * 0.419)
-    else: mileage = D("58") + D("125.7") + D((miles - 400) * 0.35)
+    if miles <= 100: mileage = fixed(miles) * 58 // 100
+    elif miles <= 400: mileage = 58 * DOLLAR + (fixed(miles) - 100 * DOLLAR) * 419 // 1000
+    else: mileage = 58 * DOLLAR + 1257 * DOLLAR // 10 + (fixed(miles) - 400 * DOLLAR) * 35 // 100
     
-    # Variable Rate Receipts
-    if days <= 2: receipt_rate = 0.55 if receipts <= 500 else 0.45
-    elif days <= 4: receipt_rate = 0.50 if receipts <= 600 else 0.40
-    elif days <= 7: receipt_rate = 0.45 if receipts <= 800 else 0.35
-    else: receipt_rate = 0.40 if receipts <= 1000 else 0.30
-    receipt_component = D(receipts * receipt_rate)
+    # Variable Rate Receipts (in hundredths)
+    if days <= 2: receipt_rate = 55 if receipts <= 500 else 45
+    elif days <= 4: receipt_rate = 50 if receipts <= 600 else 40
+    elif days <= 7: receipt_rate = 45 if receipts <= 800 else 35
+    else: receipt_rate = 40 if receipts <= 1000 else 30
+    receipt_component = fixed(receipts) * receipt_rate // 100
     
     total = per_diem + mileage + receipt_component
     
     # Adjustments
     receipt_str = f"{receipts:.2f}"
-    if receipt_str.endswith("49"): total -= D("472")
-    elif receipt_str.endswith("99"): total -= D("319")
-    else: total += D("5")
+    if receipt_str.endswith("49"): total -= 472 * DOLLAR
+    elif receipt_str.endswith("99"): total -= 319 * DOLLAR
+    else: total += 5 * DOLLAR
     
     miles_per_day = miles / days if days > 0 else miles
-    if 175 <= miles_per_day <= 212: total *= D("1.10")
+    if 175 <= miles_per_day <= 212: total = total * 110 // 100
     
-    if days == 5: total -= D("46")
-    elif days >= 10: total -= D("25")
+    if days == 5: total -= 46 * DOLLAR
+    elif days >= 10: total -= 25 * DOLLAR
     
     return total
 
 def calculate_ratio_model(days, miles, receipts):
     # This is the simple, elegant ratio-based model.
-    total_input = D(days + miles + receipts)
+    miles_amount = fixed(miles)
+    total_input = days * DOLLAR + miles_amount + fixed(receipts)
     receipt_str = f"{receipts:.2f}"
     
-    # Determine Ratio
+    # Determine Ratio (in hundredths)
     if receipt_str.endswith("49"):
-        base_ratio = 0.22 if receipts > 1000 else 0.30
+        base_ratio = 22 if receipts > 1000 else 30
     elif receipt_str.endswith("99"):
-        base_ratio = 0.35 if receipts > 1000 else 0.45
+        base_ratio = 35 if receipts > 1000 else 45
     else:
-        base_ratio = 0.60 if receipts > 1000 else 0.70
+        base_ratio = 60 if receipts > 1000 else 70
         
-    # Adjust Ratio
+    # Adjust Ratio (in millionths after both adjustments)
     miles_per_day = miles / days if days > 0 else miles
-    if 180 <= miles_per_day <= 210: base_ratio *= 1.08
-    if days == 5: base_ratio *= 0.94
+    base_ratio *= 108 if 180 <= miles_per_day <= 210 else 100
+    base_ratio *= 94 if days == 5 else 100
     
-    base_reimbursement = total_input * D(base_ratio)
+    base_reimbursement = total_input * base_ratio // 10 ** 6
     
     # Minimum Guarantee
-    minimum = D(days * 50) + (D(miles) * D("0.25"))
+    minimum = days * 50 * DOLLAR + miles_amount * 25 // 100
     return max(base_reimbursement, minimum)
 
 def calculate_reimbursement(days_in, miles_in, receipts_in):
@@ -95,23 +116,25 @@ def calculate_reimbursement(days_in, miles_in, receipts_in):
         receipt_str = f"{receipts:.2f}"
         if receipt_str.endswith("49") or receipt_str.endswith("99"):
             # Trust the aggressive ratio model more for punitive cases
-            final_total = ratio_pred * D("0.9") + component_pred * D("0.1")
+            final_total = ratio_pred * 90 // 100 + component_pred * 10 // 100
         else:
             # Balance both approaches for normal cases
-            final_total = component_pred * D("0.7") + ratio_pred * D("0.3")
+            final_total = component_pred * 70 // 100 + ratio_pred * 30 // 100
             
         # Final safety cap
-        if final_total > D("2500"):
-            final_total = D("2500") + (final_total - D("2500")) * D("0.5")
+        if final_total > 2500 * DOLLAR:
+            final_total = 2500 * DOLLAR + (final_total - 2500 * DOLLAR) * 50 // 100
             
-        return round(max(D("0"), final_total), 2)
+        return round_cents(max(0, final_total))
         
     except (ValueError, TypeError, ZeroDivisionError) as e:
         print(f"Error: Invalid input - {e}", file=sys.stderr)
         sys.exit(1)
 
 if __name__ == "__main__":
-    result = calculate_reimbursement(sys.argv[1], sys.argv[2], sys.argv[3])
-    print(f"{result:.2f}")
+    cents = calculate_reimbursement(sys.argv[1], sys.argv[2], sys.argv[3])
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), 100)
+    print(f"{sign}{dollars}.{cents:02d}")
 
 ' "$1" "$2" "$3" 
\ No newline at end of file
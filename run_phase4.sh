@@ -16,8 +16,24 @@ receipts="$3"
 python3 -c "
 import sys
 import numpy as np
-from decimal import Decimal as D, getcontext
-getcontext().prec = 12
+
+# Amounts are exact ints in 1e-32 dollars, rounded half-even to cents at the end
+SCALE = 32
+
+def fixed(value):
+    cents = round(value * 100)
+    if cents / 100 == value:
+        return cents * 10 ** (SCALE - 2)
+    mantissa, _, exponent = repr(float(value)).partition('e')
+    whole, _, fraction = mantissa.lstrip('-').partition('.')
+    digits = int(whole + fraction) * 10 ** (SCALE - len(fraction) + int(exponent or 0))
+    return -digits if mantissa.startswith('-') else digits
+
+def round_half_even(numerator, denominator):
+    quotient, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient % 2 == 1):
+        quotient += 1
+    return quotient
 
 def calculate_reimbursement(days_in, miles_in, receipts_in):
     days = int(days_in)
@@ -72,44 +88,46 @@ def calculate_reimbursement(days_in, miles_in, receipts_in):
                 else:
                     base = 1942.57
     
-    total = D(str(base))
+    total = fixed(base)
     
     # Residual corrections
     receipt_str = f'{receipts:.2f}'
     if receipt_str.endswith('49'):
-        total -= D('415.48')
+        total -= fixed(415.48)
     elif receipt_str.endswith('99'):
-        total -= D('319.46')
+        total -= fixed(319.46)
     
     if days == 5:
-        total -= D('15.83')
+        total -= fixed(15.83)
     
     if 0 < receipts <= 50:
-        total += D('25')
+        total += fixed(25)
     
     receipts_per_day = receipts / days if days > 0 else receipts
     if receipts_per_day > 500 and receipts > 2000:
-        total *= D('0.85')
+        total = total * 85 // 100
     
     miles_per_day = miles / days if days > 0 else miles
     if 180 <= miles_per_day <= 220:
-        total += D('10')
+        total += fixed(10)
     
     if 825 < receipts < 831:
-        total += D('15')
+        total += fixed(15)
     
     if 4.4 < days < 4.6:
-        total -= D('8')
+        total -= fixed(8)
     
     if days > 10 and 500 < receipts < 1000:
-        total += D('20')
+        total += fixed(20)
     
     np.random.seed(int(days * 1000 + miles * 100 + receipts * 10) % 2**32)
-    jitter = D(str(np.random.uniform(-3, 3)))
+    jitter = fixed(np.random.uniform(-3, 3))
     total += jitter
     
-    return round(max(D('0'), total), 2)
+    return round_half_even(max(0, total), 10 ** (SCALE - 2))
 
-result = calculate_reimbursement(sys.argv[1], sys.argv[2], sys.argv[3])
-print(f'{result:.2f}')
+cents = calculate_reimbursement(sys.argv[1], sys.argv[2], sys.argv[3])
+sign = '-' if cents < 0 else ''
+dollars, cents = divmod(abs(cents), 100)
+print(f'{sign}{dollars}.{cents:02d}')
 " "$days" "$miles" "$receipts"
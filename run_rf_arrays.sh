@@ -0,0 +1,20 @@
+#!/bin/bash
+
+# Black Box Legacy Reimbursement System - Array-backed RandomForest Solution
+# Same forest and output as run_self_contained.sh, evaluated from rf_forest.bin
+# Expected score: ~5364 (MAE ~$52.64)
+
+# Validate arguments
+if [ "$#" -ne 3 ]; then
+    echo "Usage: $0 <trip_duration_days> <miles_traveled> <total_receipts_amount>" >&2
+    exit 1
+fi
+
+# Input validation
+if ! [[ "$1" =~ ^[0-9]+\.?[0-9]*$ ]] || ! [[ "$2" =~ ^[0-9]+\.?[0-9]*$ ]] || ! [[ "$3" =~ ^[0-9]+\.?[0-9]*$ ]]; then
+    echo "Error: All arguments must be numeric" >&2
+    exit 1
+fi
+
+# Walk the flat forest arrays (regenerate with: python3 convert_rf_to_python.py --backend arrays)
+exec python3 "$(dirname "$0")/rf_forest.py" "$1" "$2" "$3"
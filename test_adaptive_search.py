@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Test the adaptive search: checkpoints resume exactly, and an interrupted generation is rolled back"""
+
+import json
+import os
+import tempfile
+
+from adaptive_search import AdaptiveSearch
+from param_eval import DEFAULT_PARAMS
+from param_search import Search
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CASES = os.path.join(HERE, 'public_cases.json')
+
+class Interrupted(Search):
+    """A Search whose next evaluate() raises KeyboardInterrupt partway through the generation"""
+
+    interrupt = False
+
+    def evaluate(self, candidates):
+        for i, result in enumerate(super().evaluate(candidates)):
+            if self.interrupt and i == 3:
+                self.interrupt = False
+                raise KeyboardInterrupt
+            yield result
+
+def state(optimizer):
+    return json.dumps(optimizer.state(), sort_keys=True)
+
+def run(search, steps, optimizer=None):
+    optimizer = optimizer or AdaptiveSearch(search, DEFAULT_PARAMS, seed=3)
+    for _ in range(steps):
+        optimizer.step()
+    return optimizer
+
+def test_checkpoint_round_trip():
+    with Search(CASES, jobs=1) as search, tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'checkpoint.json')
+        optimizer = run(search, 4)
+        optimizer.save(path)
+        resumed = AdaptiveSearch.load(path, search)
+        assert state(resumed) == state(optimizer)
+        # Both CMA-ES (even) and TPE (odd) generations continue identically
+        assert state(run(search, 3, resumed)) == state(run(search, 3, optimizer))
+
+def test_interrupted_generation_is_rolled_back():
+    with Interrupted(CASES, jobs=2, chunk_size=2) as search, tempfile.TemporaryDirectory() as tmp:
+        expected = state(run(search, 5))
+        for interrupted_at in (2, 3):
+            optimizer = run(search, interrupted_at)
+            before = state(optimizer)
+            search.interrupt = True
+            try:
+                optimizer.step()
+            except KeyboardInterrupt:
+                pass
+            else:
+                raise AssertionError("step() swallowed the interrupt")
+            assert state(optimizer) == before
+            # What adaptive_search.py does on Ctrl-C: stop the workers, save, and resume later
+            search.terminate()
+            assert search._pool is None
+            path = os.path.join(tmp, 'checkpoint.json')
+            optimizer.save(path)
+            resumed = AdaptiveSearch.load(path, search)
+            assert state(run(search, 5 - interrupted_at, resumed)) == expected, interrupted_at
+
+if __name__ == "__main__":
+    for test in (test_checkpoint_round_trip, test_interrupted_generation_is_rolled_back):
+        test()
+        print(f"✅ {test.__name__}")
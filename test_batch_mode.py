@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Test predict_optimized.py --batch: every input layout prints what one CLI call per trip prints, in order"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ENV = dict(os.environ, PREDICTION_CACHE='off')
+
+def load_cases(count=25):
+    with open(os.path.join(HERE, 'public_cases.json'), 'r') as f:
+        return json.load(f)[:count]
+
+def batch(text, *args):
+    result = subprocess.run([sys.executable, os.path.join(HERE, 'predict_optimized.py'), '--batch', *args],
+                            input=text, cwd=HERE, env=ENV, capture_output=True, text=True, check=True)
+    return result.stdout.splitlines()
+
+def single(trip):
+    result = subprocess.run([sys.executable, os.path.join(HERE, 'predict_optimized.py'), *map(str, trip)],
+                            cwd=HERE, env=ENV, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+def trips(cases):
+    return [(case['input']['trip_duration_days'], case['input']['miles_traveled'],
+             case['input']['total_receipts_amount']) for case in cases]
+
+def test_layouts_match_single_calls():
+    cases = load_cases()
+    expected = [single(trip) for trip in trips(cases)]
+    layouts = {
+        'json array': json.dumps(cases),
+        'flat json array': json.dumps([case['input'] for case in cases]),
+        'ndjson': ''.join(json.dumps(case) + '\n' for case in cases),
+        'csv': 'days,miles,receipts\n' + ''.join(f"{d},{m},{r}\n" for d, m, r in trips(cases)),
+        'headerless csv': ''.join(f"{d},{m},{r}\n" for d, m, r in trips(cases)),
+    }
+    for name, text in layouts.items():
+        assert batch(text) == expected, name
+
+def test_batch_from_file():
+    cases = load_cases(5)
+    with tempfile.NamedTemporaryFile('w', suffix='.json') as f:
+        json.dump(cases, f)
+        f.flush()
+        assert batch('', f.name) == [single(trip) for trip in trips(cases)]
+
+def test_empty_input():
+    assert batch('[]') == []
+
+if __name__ == "__main__":
+    for test in (test_layouts_match_single_calls, test_batch_from_file, test_empty_input):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Test the precompiled standalone scripts: same output as the one-file heredoc program they replaced"""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import build_standalone
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CASES = build_standalone.load_cases(os.path.join(HERE, 'public_cases.json'), 1000)[::125] + [
+    (1, 1082, 1809.49), (5, 0, 0), (3, 93, 1.42), (14, 1317.07, 476.87)]
+
+def heredoc_program():
+    """rf_standalone.py with the forest pasted in, as the run scripts used to pipe it to python3 -"""
+    with open(os.path.join(HERE, 'rf_pure_python.py'), 'r') as f:
+        forest = f.read()
+    with open(os.path.join(HERE, 'rf_standalone.py'), 'r') as f:
+        module = f.read()
+    forest = forest[forest.index('def score'):]
+    return module.replace('from rf_pure_python import score\n',
+                          '\n# ===== PURE PYTHON RANDOM FOREST MODEL =====\n' + forest, 1)
+
+def test_scripts_match_heredoc_program():
+    program = heredoc_program()
+    for case in CASES:
+        args = [str(value) for value in case]
+        expected = subprocess.run([sys.executable, '-', *args], input=program, capture_output=True, text=True,
+                                  check=True).stdout
+        for script in build_standalone.RUN_SCRIPTS:
+            # Called from elsewhere: the scripts find rf_standalone.py next to themselves
+            result = subprocess.run([os.path.join(HERE, script), *args], cwd='/', capture_output=True, text=True)
+            assert (result.returncode, result.stdout) == (0, expected), (script, case)
+
+def test_check_finds_no_mismatches():
+    assert build_standalone.check(CASES[:3]) == []
+
+def test_checked_hash_pyc():
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in build_standalone.MODULES:
+            shutil.copy(os.path.join(HERE, name), tmp)
+        compiled = build_standalone.build(tmp)
+        assert compiled == [importlib.util.cache_from_source(os.path.join(tmp, name))
+                            for name in build_standalone.MODULES]
+        for path in compiled:
+            with open(path, 'rb') as f:
+                header = f.read(16)
+            # PEP 552 flags: hash-based (bit 0), checked against the source (bit 1)
+            assert int.from_bytes(header[4:8], 'little') == 0b11, path
+
+        # An edit with the same size and mtime, which a timestamp-based .pyc would miss, is recompiled
+        source = os.path.join(tmp, 'rf_standalone.py')
+        stat = os.stat(source)
+        with open(source, 'r') as f:
+            text = f.read()
+        with open(source, 'w') as f:
+            f.write(text.replace('"""Main prediction function', '"""MAIN PREDICTION FUNCTION', 1))
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        code = 'import rf_standalone; print(rf_standalone.predict_reimbursement.__doc__)'
+        result = subprocess.run([sys.executable, '-c', code], cwd=tmp, capture_output=True, text=True, check=True)
+        assert result.stdout.startswith('MAIN PREDICTION FUNCTION')
+
+if __name__ == "__main__":
+    for test in (test_scripts_match_heredoc_program, test_check_finds_no_mismatches, test_checked_hash_pyc):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Test the streaming case reader: same records as json.load, whatever the layout and block boundaries"""
+
+import io
+import json
+import os
+
+import case_reader
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def load(name):
+    with open(os.path.join(HERE, name), 'r') as f:
+        return json.load(f)
+
+def read_all(text, block_size):
+    saved = case_reader.BLOCK_SIZE
+    case_reader.BLOCK_SIZE = block_size
+    try:
+        return [record for chunk in case_reader.iter_case_chunks(io.StringIO(text), chunk_size=7) for record in chunk]
+    finally:
+        case_reader.BLOCK_SIZE = saved
+
+def test_case_files_match_json_load():
+    for name in ('public_cases.json', 'private_cases.json'):
+        assert list(case_reader.iter_cases(os.path.join(HERE, name))) == load(name)
+        assert case_reader.count_cases(os.path.join(HERE, name)) == len(load(name))
+
+def test_small_blocks_and_layouts():
+    cases = load('public_cases.json')[:40]
+    # Strings with separators and brackets inside must not end a record
+    cases[3]['note'] = '], {"input": [1, 2]}, '
+    layouts = (json.dumps(cases), json.dumps(cases, indent=2), '\n\n  ' + json.dumps(cases) + '\n',
+               ''.join(json.dumps(case) + '\n' for case in cases), '[]', '')
+    for text in layouts:
+        expected = json.loads(text) if text.strip().startswith('[') else [
+            json.loads(line) for line in text.splitlines() if line.strip()]
+        for block_size in (1, 7, 64, 1 << 16):
+            assert read_all(text, block_size) == expected, (text[:30], block_size)
+
+def test_trip_chunks_from_csv():
+    text = 'trip_duration_days,miles_traveled,total_receipts_amount\n3,93,1.42\n\n5, 130.5 ,306.9\n'
+    chunks = list(case_reader.iter_trip_chunks(io.StringIO(text), chunk_size=1))
+    assert chunks == [[(3, 93.0, 1.42)], [(5, 130.5, 306.9)]]
+
+def test_bad_input_raises():
+    for text in ('[{"a": 1}, 3]', '[{"a": 1}, {"b": '):
+        try:
+            read_all(text, 4)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {text!r}")
+
+if __name__ == "__main__":
+    for test in (test_case_files_match_json_load, test_small_blocks_and_layouts, test_trip_chunks_from_csv,
+                 test_bad_input_raises):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Test the columnar case store: columns equal the JSON, and the store follows the JSON's contents"""
+
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import case_store
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def test_columns_match_json():
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ('public_cases.json', 'private_cases.json'):
+            json_path = shutil.copy(os.path.join(HERE, name), tmp)
+            with open(json_path) as f:
+                trips = [case.get('input', case) for case in json.load(f)]
+            cases = case_store.load_cases(json_path)
+            assert isinstance(cases, np.memmap)
+            assert cases['days'].tolist() == [trip['trip_duration_days'] for trip in trips]
+            assert cases['miles'].tolist() == [float(trip['miles_traveled']) for trip in trips]
+            assert (cases['receipts_cents'] / 100).tolist() == [float(trip['total_receipts_amount']) for trip in trips]
+        assert np.isnan(cases['expected']).all()
+
+def test_store_follows_json_contents():
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, 'cases.json')
+        with open(os.path.join(HERE, 'public_cases.json')) as f:
+            cases = json.load(f)[:10]
+        with open(json_path, 'w') as f:
+            json.dump(cases, f)
+        case_store.load_cases(json_path)
+        built = os.stat(case_store.store_path(json_path)).st_mtime_ns
+
+        # Touched, same contents: kept
+        os.utime(json_path, ns=(0, 0))
+        assert case_store.is_current(json_path)
+        case_store.load_cases(json_path)
+        assert os.stat(case_store.store_path(json_path)).st_mtime_ns == built
+
+        # New contents: rebuilt
+        cases[3]['expected_output'] = 1.25
+        with open(json_path, 'w') as f:
+            json.dump(cases, f)
+        assert not case_store.is_current(json_path)
+        assert case_store.load_cases(json_path)['expected'][3] == 1.25
+
+def test_sub_cent_receipts_are_refused():
+    try:
+        case_store.receipts_to_cents([1.42, 1.425])
+    except ValueError:
+        return
+    raise AssertionError("accepted a sub-cent receipt amount")
+
+if __name__ == "__main__":
+    for test in (test_columns_match_json, test_store_follows_json_contents, test_sub_cent_receipts_are_refused):
+        test()
+        print(f"✅ {test.__name__}")
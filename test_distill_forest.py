@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Test distill_forest.py: the written surrogate stays within its stated deviation from the forest"""
+
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from case_store import columns
+from distill_forest import ShallowTrees, check_source, fit_candidates, post_process, synthetic_grid, teacher
+from rf_forest import predict_batch
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def case_inputs():
+    return [np.concatenate(column) for column in zip(*(columns(os.path.join(HERE, name))[:3]
+                                                       for name in ('public_cases.json', 'private_cases.json')))]
+
+def distill(tmp, *args):
+    out = os.path.join(tmp, 'run_distilled.sh')
+    result = subprocess.run([sys.executable, os.path.join(HERE, 'distill_forest.py'), '--step', '100',
+                             '--out', out, *args], cwd=HERE, capture_output=True, text=True)
+    return result, out
+
+def test_post_process_matches_forest():
+    days, miles, receipts = case_inputs()
+    trips = list(zip(days.tolist(), miles.tolist(), receipts.tolist()))
+    assert post_process(receipts, teacher(days, miles, receipts)).tolist() == predict_batch(trips).tolist()
+
+def test_emitted_code_matches_batch_evaluation():
+    grid = synthetic_grid(100)
+    cases = case_inputs()
+    candidates = fit_candidates(*grid, teacher(*grid))
+    assert [c.size for c in candidates] == sorted(c.size for c in candidates)
+    for candidate in candidates:
+        check_source(candidate, *cases)
+    assert any(isinstance(c, ShallowTrees) for c in candidates)
+
+def test_written_script_within_stated_deviation():
+    with tempfile.TemporaryDirectory() as tmp:
+        result, out = distill(tmp, '--max-deviation', '400', '--mean-deviation', '100')
+        assert result.returncode == 0, result.stderr
+        with open(out) as f:
+            script = f.read()
+        worst, mean = (float(x) for x in re.search(r'max \$([\d.]+), mean \$([\d.]+)', script).groups())
+        assert worst <= 400 and mean <= 100
+        days, miles, receipts = (column[::500] for column in case_inputs())
+        forest = predict_batch(list(zip(days.tolist(), miles.tolist(), receipts.tolist())))
+        for trip, expected in zip(zip(days.tolist(), miles.tolist(), receipts.tolist()), forest.tolist()):
+            args = [str(int(trip[0])), str(trip[1]), str(trip[2])]
+            amount = float(subprocess.run(['bash', out, *args], capture_output=True, text=True, check=True).stdout)
+            # Rounding to cents and the clamp at zero can only bring it closer
+            assert abs(amount - expected) <= worst + 0.01, trip
+
+def test_nothing_written_when_no_candidate_fits():
+    with tempfile.TemporaryDirectory() as tmp:
+        result, out = distill(tmp, '--max-deviation', '0')
+        assert result.returncode == 1 and 'nothing written' in result.stderr
+        assert not os.path.exists(out)
+
+if __name__ == "__main__":
+    for test in (test_post_process_matches_forest, test_emitted_code_matches_batch_evaluation,
+                 test_written_script_within_stated_deviation, test_nothing_written_when_no_candidate_fits):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Test evaluate.py: the in-process report is exactly what eval.sh prints for the same model and cases"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from decimal import Decimal
+
+import pytest
+
+from evaluate import bc_str, truncate
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# A fast stand-in for run.sh: stub()'s amounts, and an error for 99-day trips
+STUB_RUN_SH = '''#!/bin/bash
+exec python3 -c '
+import sys
+days, miles, receipts = int(sys.argv[1]), float(sys.argv[2]), float(sys.argv[3])
+if days == 99:
+    sys.exit("Error: no such trip")
+print(f"{days * 100 + miles * 0.5 + receipts * 0.4:.2f}")
+' "$1" "$2" "$3"
+'''
+
+def stub(days, miles, receipts):
+    return days * 100 + miles * 0.5 + receipts * 0.4
+
+def write_stub_case_dir(tmp, count=60):
+    """A directory with eval.sh, its runner, the stub run.sh and a case file that has exact, close and failing cases"""
+    with open(os.path.join(HERE, 'public_cases.json'), 'r') as f:
+        cases = json.load(f)[:count]
+    for i, case in enumerate(cases):
+        trip = case['input']
+        amount = round(stub(trip['trip_duration_days'], trip['miles_traveled'], trip['total_receipts_amount']), 2)
+        if i % 5 == 0:
+            case['expected_output'] = amount
+        elif i % 7 == 0:
+            case['expected_output'] = round(amount + 0.5, 2)
+    cases.append({'input': {'trip_duration_days': 99, 'miles_traveled': 1, 'total_receipts_amount': 1.5},
+                  'expected_output': 100.0})
+    with open(os.path.join(tmp, 'public_cases.json'), 'w') as f:
+        json.dump(cases, f)
+    run_sh = os.path.join(tmp, 'run.sh')
+    with open(run_sh, 'w') as f:
+        f.write(STUB_RUN_SH)
+    os.chmod(run_sh, 0o755)
+    for script in ('eval.sh', 'case_runner.sh'):
+        shutil.copy(os.path.join(HERE, script), tmp)
+    return run_sh
+
+def evaluate_report(model, cases_path, env=None):
+    result = subprocess.run([sys.executable, os.path.join(HERE, 'evaluate.py'), model, '--cases', cases_path,
+                             '--no-store'], cwd=HERE, env=env, capture_output=True, text=True, check=True)
+    return result.stdout
+
+def test_report_matches_eval_sh():
+    if shutil.which('bc') is None or shutil.which('jq') is None:
+        pytest.skip("eval.sh needs bc and jq")
+    with tempfile.TemporaryDirectory() as tmp:
+        run_sh = write_stub_case_dir(tmp)
+        expected = subprocess.run(['bash', 'eval.sh'], cwd=tmp, capture_output=True, text=True).stdout
+        # eval.sh's header always says 1,000 cases; evaluate.py counts them
+        expected = expected.replace("against 1,000 test cases", "against 61 test cases", 1)
+        assert evaluate_report(run_sh, os.path.join(tmp, 'public_cases.json')) == expected
+
+def test_function_and_script_models_agree():
+    with tempfile.TemporaryDirectory() as tmp:
+        cases_path = os.path.join(tmp, 'cases.json')
+        with open(os.path.join(HERE, 'public_cases.json'), 'r') as f, open(cases_path, 'w') as out:
+            json.dump(json.load(f)[:12], out)
+        env = dict(os.environ, PREDICTION_CACHE='off', PREDICT_SOCKET=os.path.join(tmp, 'none.sock'),
+                   ZYGOTE_SOCKET=os.path.join(tmp, 'none.sock'))
+        assert (evaluate_report('predict_optimized:calculate_reimbursement', cases_path, env)
+                == evaluate_report(os.path.join(HERE, 'run.sh'), cases_path, env))
+
+def test_bc_number_formatting():
+    assert bc_str(Decimal('0')) == '0'
+    assert bc_str(Decimal('0.50')) == '.50'
+    assert bc_str(Decimal('-0.25')) == '-.25'
+    assert bc_str(Decimal('12.3400')) == '12.3400'
+    assert truncate(Decimal('2.999'), 2) == Decimal('2.99')
+    assert truncate(Decimal('-2.999'), 1) == Decimal('-2.9')
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
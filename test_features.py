@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Test features.py against the training code's own feature builders, scalar and batch, bit for bit"""
+
+import json
+import os
+
+import numpy as np
+
+from features import (ENHANCED_FEATURES, RF_FEATURES, enhanced_feature_matrix, enhanced_features,
+                      feature_matrix, feature_vector, rf_feature_matrix, rf_features)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def training_rf_features(days, miles, receipts):
+    """create_features() as create_rf_model.py trained rf_model.pkl with it"""
+    f = {'days': days, 'miles': miles, 'receipts': receipts}
+    f['miles_per_day'] = miles / days if days > 0 else miles
+    f['receipts_per_day'] = receipts / days if days > 0 else receipts
+    f['total_input'] = days + miles + receipts
+    for d in range(1, 6):
+        f[f'is_{d}_day'] = int(days == d)
+    f['is_weekend'] = int(days in [2, 3])
+    f['log_receipts'] = np.log1p(receipts)
+    f['sqrt_receipts'] = np.sqrt(receipts)
+    f['receipts_squared'] = receipts ** 2
+    f['receipts_cubed'] = receipts ** 3
+    receipt_str = f"{receipts:.2f}"
+    f['ends_49'] = int(receipt_str.endswith('49'))
+    f['ends_99'] = int(receipt_str.endswith('99'))
+    f['ends_00'] = int(receipt_str.endswith('00'))
+    f['last_digit'] = int(receipt_str[-1])
+    f['second_last_digit'] = int(receipt_str[-2])
+    f['tier1_miles'] = min(miles, 100)
+    f['tier2_miles'] = max(0, min(miles - 100, 300))
+    f['tier3_miles'] = max(0, miles - 400)
+    mpd, rpd = f['miles_per_day'], f['receipts_per_day']
+    f['efficiency_bonus'] = int(180 <= mpd <= 220)
+    f['high_efficiency'] = int(mpd > 200)
+    f['low_efficiency'] = int(mpd < 50)
+    f['low_spend'] = int(rpd < 100)
+    f['medium_spend'] = int(100 <= rpd < 300)
+    f['high_spend'] = int(300 <= rpd < 500)
+    f['very_high_spend'] = int(rpd >= 500)
+    f['days_x_miles'] = days * miles
+    f['days_x_receipts'] = days * receipts
+    f['miles_x_receipts'] = miles * receipts
+    f['efficiency_x_receipts'] = mpd * receipts
+    f['miles_to_receipts'] = miles / (receipts + 1)
+    f['receipts_to_miles'] = receipts / (miles + 1)
+    f['days_to_miles'] = days / (miles + 1)
+    return [float(f[name]) for name in RF_FEATURES]
+
+def training_enhanced_features(days, miles, receipts):
+    """The feature rows optimize_further.py trained optimized_model.pkl on"""
+    f = {'days': days, 'miles': miles, 'receipts': receipts}
+    f['miles_per_day'] = miles / days if days > 0 else miles
+    f['receipts_per_day'] = receipts / days if days > 0 else receipts
+    f['total_input'] = days + miles + receipts
+    for d in range(1, 15):
+        f[f'is_{d}_day'] = int(days == d)
+    f['log_receipts'] = np.log1p(receipts)
+    f['sqrt_receipts'] = np.sqrt(receipts)
+    f['receipts_squared'] = receipts ** 2
+    f['receipts_cubed'] = receipts ** 3
+    receipt_str = f"{receipts:.2f}"
+    f['ends_49'] = int(receipt_str.endswith('49'))
+    f['ends_99'] = int(receipt_str.endswith('99'))
+    f['ends_00'] = int(receipt_str.endswith('00'))
+    for digit in range(10):
+        f[f'last_digit_{digit}'] = int(receipt_str[-1] == str(digit))
+    f['ends_49_x_receipts'] = f['ends_49'] * receipts
+    f['ends_99_x_receipts'] = f['ends_99'] * receipts
+    f['ends_49_x_log_receipts'] = f['ends_49'] * f['log_receipts']
+    f['ends_99_x_log_receipts'] = f['ends_99'] * f['log_receipts']
+    f['tier1_miles'] = min(miles, 100)
+    f['tier2_miles'] = max(0, min(miles - 100, 300))
+    f['tier3_miles'] = max(0, miles - 400)
+    f['miles_squared'] = miles ** 2
+    f['log_miles'] = np.log1p(miles)
+    f['sqrt_miles'] = np.sqrt(miles)
+    mpd, rpd = f['miles_per_day'], f['receipts_per_day']
+    f['efficiency_bonus'] = int(180 <= mpd <= 220)
+    f['efficiency_penalty'] = int(mpd > 300)
+    f['very_low_spend'] = int(rpd < 50)
+    f['low_spend'] = int(50 <= rpd < 100)
+    f['medium_spend'] = int(100 <= rpd < 300)
+    f['high_spend'] = int(300 <= rpd < 500)
+    f['very_high_spend'] = int(rpd >= 500)
+    f['extreme_spend'] = int(rpd >= 700)
+    f['days_squared'] = days ** 2
+    f['days_x_miles_squared'] = days * miles ** 2
+    f['days_squared_x_miles'] = days ** 2 * miles
+    f['days_x_receipts_squared'] = days * receipts ** 2
+    f['receipts_to_total'] = receipts / (days + miles + receipts + 1)
+    f['miles_to_total'] = miles / (days + miles + receipts + 1)
+    f['days_to_total'] = days / (days + miles + receipts + 1)
+    return [float(f[name]) for name in ENHANCED_FEATURES]
+
+def load_trips():
+    trips = []
+    for name in ('public_cases.json', 'private_cases.json'):
+        with open(os.path.join(HERE, name), 'r') as f:
+            for case in json.load(f):
+                trip = case.get('input', case)
+                trips.append((trip['trip_duration_days'], trip['miles_traveled'], trip['total_receipts_amount']))
+    # Every cent ending, half-cent neighbours and fractional miles
+    rng = np.random.default_rng(0)
+    n = 20_000
+    trips += zip(rng.integers(0, 15, n).tolist(), (rng.integers(0, 150_000, n) / 100).tolist(),
+                 (rng.integers(0, 300_000, n) / 100 + rng.integers(0, 10, n) / 1000).tolist())
+    return trips
+
+def test_scalar_and_batch_match_training():
+    trips = load_trips()
+    days, miles, receipts = (np.array(column, dtype=np.float64) for column in zip(*trips))
+    for training, scalar, batch in ((training_rf_features, rf_features, rf_feature_matrix),
+                                    (training_enhanced_features, enhanced_features, enhanced_feature_matrix)):
+        expected = np.array([training(*trip) for trip in trips])
+        assert np.array_equal(np.array([scalar(*trip) for trip in trips]), expected), training.__name__
+        assert np.array_equal(batch(days, miles, receipts), expected), training.__name__
+
+def test_reordered_columns():
+    cols = list(reversed(RF_FEATURES))
+    assert feature_vector(cols, 3, 93, 1.42) == training_rf_features(3, 93, 1.42)[::-1]
+    matrix = feature_matrix(cols, np.array([3.0, 5.0]), np.array([93.0, 130.5]), np.array([1.42, 306.9]))
+    assert matrix.tolist() == [training_rf_features(3, 93, 1.42)[::-1], training_rf_features(5, 130.5, 306.9)[::-1]]
+
+if __name__ == "__main__":
+    for test in (test_scalar_and_batch_match_training, test_reordered_columns):
+        test()
+        print(f"✅ {test.__name__}")
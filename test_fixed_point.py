@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""Test the fixed-point rule models against the Decimal code they replaced, to the cent"""
+
+import contextlib
+import io
+import json
+import os
+import random
+import subprocess
+import sys
+import types
+from decimal import ROUND_HALF_EVEN, Decimal as D, localcontext
+
+import numpy as np
+import pytest
+
+from fixed_point import fixed, round_half_even
+from simple_ratio import calculate_simple, get_reimbursement_ratio
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def inputs(n_random=20_000):
+    """Every public and private case, then random trips with fractional miles and zero-day trips"""
+    trips = []
+    for name in ('public_cases.json', 'private_cases.json'):
+        with open(os.path.join(HERE, name), 'r') as f:
+            for case in json.load(f):
+                trip = case.get('input', case)
+                trips.append((trip['trip_duration_days'], trip['miles_traveled'], trip['total_receipts_amount']))
+    rng = random.Random(1)
+    for _ in range(n_random):
+        miles = rng.choice([rng.randint(0, 1500), round(rng.uniform(0, 1500), rng.randint(0, 2))])
+        trips.append((rng.randint(0, 20), miles, round(rng.uniform(0, 3000), 2)))
+    return trips
+
+def shell_program(script):
+    """The Python program a run_*.sh script hands to python3 -c"""
+    with open(os.path.join(HERE, script), 'r') as f:
+        text = f.read()
+    return text.split("exec python3 -c '", 1)[1].rsplit("' \"$1\"", 1)[0]
+
+def shell_model(script, marker):
+    """The script's calculate_reimbursement, defined without running the part after marker"""
+    namespace = {'__name__': os.path.splitext(script)[0]}
+    exec(shell_program(script).split(marker, 1)[0], namespace)
+    return namespace['calculate_reimbursement']
+
+# The Decimal implementations, as the scripts had them before the fixed-point port
+
+def decimal_simple_ratio(days, miles, receipts):
+    with localcontext() as context:
+        context.prec = 12
+        total = D(str(days + miles + receipts))
+        reimbursement = total * D(str(get_reimbursement_ratio(days, miles, receipts)))
+        if days == 1 and miles > 1000 and receipts > 1800:
+            if f"{receipts:.2f}".endswith("49"):
+                reimbursement = D(str(receipts * 0.247))
+        min_amount = D(str(days * 50 + miles * 0.20))
+        if reimbursement < min_amount:
+            reimbursement = min_amount
+        return round(reimbursement, 2)
+
+def decimal_phase2(days_in, miles_in, receipts_in):
+    with localcontext() as context:
+        context.prec = 12
+        days = int(days_in)
+        miles = D(str(miles_in))
+        receipts = D(str(receipts_in))
+        total = D('711.32') + days * D('64.94')
+        total += min(miles, D('100')) * D('0.824')
+        if miles > D('100'):
+            total += min(miles - D('100'), D('300')) * D('0.490')
+        if miles > D('400'):
+            total += (miles - D('400')) * D('0.434')
+        if receipts > 0:
+            total -= D(str(387.56 * float(np.log1p(float(receipts)))))
+        total -= receipts * D('0.8008')
+        if receipts > 0:
+            total += D(str(111.99 * float(np.sqrt(float(receipts)))))
+        if days == 5:
+            total -= D('46.24')
+        if D('0') < receipts <= D('50'):
+            total += D('44.52')
+        if f'{receipts:.2f}'.endswith(('49', '99')):
+            total -= D('472.73')
+        daily_spending = receipts / days if days > 0 else receipts
+        if daily_spending > D('450'):
+            total -= D('54.64')
+        if daily_spending > D('500'):
+            total += D('35.59')
+        if receipts > D('2000'):
+            total -= D('139.33')
+        if days <= 3:
+            total -= D('16.38')
+        elif 3 < days <= 7:
+            total += D('62.90')
+        else:
+            total -= D('46.52')
+        miles_per_day = miles / days if days > 0 else miles
+        if D('180') <= miles_per_day <= D('220'):
+            total += D('14.75')
+        if D('185') <= miles_per_day <= D('215'):
+            total -= D('18.51')
+        return round(max(D('0'), total), 2)
+
+def decimal_zero_error(days_in, miles_in, receipts_in):
+    with localcontext() as context:
+        context.prec = 15
+        days, miles, receipts = int(days_in), float(miles_in), float(receipts_in)
+        receipt_str = f"{receipts:.2f}"
+        total_input = D(str(days + miles + receipts))
+        exact_matches = {(1, 1082.0, 1809.49): D("446.94"), (8, 795.0, 1645.99): D("644.69"),
+                         (8, 482.0, 1411.49): D("631.81"), (11, 740.0, 1171.99): D("902.09"),
+                         (14, 487.0, 579.29): D("1516.68")}
+        if (days, miles, receipts) in exact_matches:
+            return exact_matches[days, miles, receipts]
+        if receipt_str.endswith((".49", ".99")):
+            bands = (300, 500, 800, 1200, 1600)
+            ratios = ("0.52", "0.42", "0.32", "0.24", "0.18", "0.15") if receipt_str.endswith(".49") else \
+                     ("0.68", "0.58", "0.48", "0.39", "0.32", "0.28")
+            base_ratio = D(ratios[sum(receipts >= band for band in bands)])
+        else:
+            per_diem = D(str(days * 95))
+            if miles <= 100:
+                mileage = D(str(miles * 0.58))
+            elif miles <= 400:
+                mileage = D("58") + D(str((miles - 100) * 0.48))
+            else:
+                mileage = D("58") + D("144") + D(str((miles - 400) * 0.40))
+            miles_per_day = miles / days if days > 0 else miles
+            if receipts < 200:
+                receipt_mult = D("0.75")
+            elif 175 <= miles_per_day <= 212:
+                receipt_mult = D("0.72")
+            elif receipts > 2000:
+                receipt_mult = D("0.42")
+            elif miles_per_day < 50:
+                receipt_mult = D("0.52")
+            else:
+                receipt_mult = D("0.62")
+            receipt_component = D(str(receipts)) * receipt_mult
+            if days == 5:
+                per_diem -= D("46")
+            elif days == 7:
+                per_diem -= D("22")
+            elif days >= 10:
+                per_diem -= D("30")
+            return round(per_diem + mileage + receipt_component, 2)
+        base_amount = total_input * base_ratio
+        if days == 1:
+            base_amount *= D("1.02")
+        elif days == 5:
+            base_amount *= D("0.96")
+        elif days >= 14:
+            base_amount *= D("0.94")
+        miles_per_day = miles / days if days > 0 else miles
+        if 180 <= miles_per_day <= 210:
+            base_amount *= D("1.03")
+        elif miles_per_day > 400:
+            base_amount *= D("0.97")
+        if days == 8 and 700 <= miles <= 900 and 1500 <= receipts <= 1700:
+            base_amount *= D("0.92")
+        if days == 1 and miles > 1000 and receipts > 1800:
+            base_amount *= D("0.85")
+        if base_amount < D("50"):
+            base_amount = D("50")
+        return round(base_amount, 2)
+
+def decimal_final_ensemble(days_in, miles_in, receipts_in):
+    with localcontext() as context:
+        context.prec = 12
+        days, miles, receipts = int(days_in), float(miles_in), float(receipts_in)
+        receipt_str = f"{receipts:.2f}"
+        miles_per_day = miles / days if days > 0 else miles
+
+        # Component model
+        per_diem = D("100") * D(days)
+        if miles <= 100: mileage = D(miles * 0.58)
+        elif miles <= 400: mileage = D("58") + D((miles - 100) * 0.419)
+        else: mileage = D("58") + D("125.7") + D((miles - 400) * 0.35)
+        if days <= 2: receipt_rate = 0.55 if receipts <= 500 else 0.45
+        elif days <= 4: receipt_rate = 0.50 if receipts <= 600 else 0.40
+        elif days <= 7: receipt_rate = 0.45 if receipts <= 800 else 0.35
+        else: receipt_rate = 0.40 if receipts <= 1000 else 0.30
+        component = per_diem + mileage + D(receipts * receipt_rate)
+        if receipt_str.endswith("49"): component -= D("472")
+        elif receipt_str.endswith("99"): component -= D("319")
+        else: component += D("5")
+        if 175 <= miles_per_day <= 212: component *= D("1.10")
+        if days == 5: component -= D("46")
+        elif days >= 10: component -= D("25")
+
+        # Ratio model
+        if receipt_str.endswith("49"):
+            base_ratio = 0.22 if receipts > 1000 else 0.30
+        elif receipt_str.endswith("99"):
+            base_ratio = 0.35 if receipts > 1000 else 0.45
+        else:
+            base_ratio = 0.60 if receipts > 1000 else 0.70
+        if 180 <= miles_per_day <= 210: base_ratio *= 1.08
+        if days == 5: base_ratio *= 0.94
+        ratio = max(D(days + miles + receipts) * D(base_ratio), D(days * 50) + (D(miles) * D("0.25")))
+
+        if receipt_str.endswith("49") or receipt_str.endswith("99"):
+            final_total = ratio * D("0.9") + component * D("0.1")
+        else:
+            final_total = component * D("0.7") + ratio * D("0.3")
+        if final_total > D("2500"):
+            final_total = D("2500") + (final_total - D("2500")) * D("0.5")
+        return round(max(D("0"), final_total), 2)
+
+def cents_str(cents):
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), 100)
+    return f"{sign}{dollars}.{cents:02d}"
+
+def test_fixed_matches_decimal():
+    rng = random.Random(0)
+    for _ in range(20_000):
+        decimals = rng.randint(0, 12)
+        value = round(rng.uniform(-1e6, 1e6), rng.randint(0, min(decimals, 6)))
+        assert fixed(value, decimals) == D(repr(value)).scaleb(decimals), (value, decimals)
+    assert fixed(7, 3) == 7000
+    assert fixed(' -12.5 ', 2) == -1250
+    assert fixed('1.25e-2', 4) == 125
+    assert fixed(1e20, 0) == 10 ** 20
+    assert fixed(0.1 + 0.2, 17) == 30000000000000004
+    with pytest.raises(ValueError):
+        fixed(0.125, 2)
+
+def test_round_half_even_matches_decimal():
+    rng = random.Random(0)
+    for _ in range(20_000):
+        numerator, denominator = rng.randint(-10 ** 6, 10 ** 6), rng.choice([1, 2, 4, 10, 100, 1000, 7])
+        expected = (D(numerator) / D(denominator)).quantize(D(1), rounding=ROUND_HALF_EVEN)
+        assert round_half_even(numerator, denominator) == expected, (numerator, denominator)
+    assert [round_half_even(n, 10) for n in (5, 15, 25, -5, -15)] == [0, 2, 2, 0, -2]
+
+def test_python_models_match_decimal():
+    # phase2_rules.py prints a report on public_cases.json when imported
+    cwd = os.getcwd()
+    os.chdir(HERE)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            from phase2_rules import calculate_reimbursement_v2
+    finally:
+        os.chdir(cwd)
+    for trip in inputs():
+        assert f"{calculate_simple(*trip):.2f}" == f"{decimal_simple_ratio(*trip):.2f}", trip
+        assert f"{calculate_reimbursement_v2(*trip):.2f}" == f"{decimal_phase2(*trip):.2f}", trip
+
+def test_shell_models_match_decimal():
+    for script, marker, reference in (('run_zero_error.sh', '\n# Execute\n', decimal_zero_error),
+                                      ('run_final_ensemble.sh', '\nif __name__', decimal_final_ensemble)):
+        calculate = shell_model(script, marker)
+        for trip in inputs():
+            assert cents_str(calculate(*(str(value) for value in trip))) == f"{reference(*trip):.2f}", (script, trip)
+
+def test_shell_scripts_print_decimal_results():
+    trips = inputs(0)[::600] + [(1, 1082, 1809.49), (0, 0, 0), (5, 900.5, 12.45), (3, 5, 0.01)]
+    for script, reference in (('run_zero_error.sh', decimal_zero_error),
+                              ('run_final_ensemble.sh', decimal_final_ensemble)):
+        for trip in trips:
+            args = [str(value) for value in trip]
+            result = subprocess.run(['bash', os.path.join(HERE, script), *args], capture_output=True, text=True)
+            assert result.stdout == f"{reference(*trip):.2f}\n", (script, trip)
+
+def test_negative_amounts_keep_their_sign():
+    for script, marker in (('run_zero_error.sh', '\n# Execute\n'), ('run_final_ensemble.sh', '\nif __name__')):
+        main = marker.lstrip() + shell_program(script).split(marker, 1)[1]
+        for cents, expected in ((-5, "-0.05\n"), (-1234, "-12.34\n"), (7, "0.07\n"), (0, "0.00\n")):
+            namespace = {'__name__': '__main__', 'calculate_reimbursement': lambda *args: cents,
+                         'sys': types.SimpleNamespace(argv=['run', '1', '2', '3'], stderr=sys.stderr, exit=sys.exit)}
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                exec(main, namespace)
+            assert out.getvalue() == expected, (script, cents)
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
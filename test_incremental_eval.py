@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Test the incremental objective: every total equals a full ParamEvaluator evaluation"""
+
+import os
+import random
+
+import numpy as np
+
+from incremental_eval import FullEvaluator, IncrementalEvaluator, coordinate_descent, step_ladder
+from param_eval import DEFAULT_PARAMS, ParamEvaluator
+from param_search import SEARCH_SPACE, perturb
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EVALUATOR = ParamEvaluator(os.path.join(HERE, 'public_cases.json'))
+
+def full_total(params):
+    return int(EVALUATOR.error_cents(params).sum())
+
+def test_ladders_match_full_evaluation():
+    state = IncrementalEvaluator(EVALUATOR, DEFAULT_PARAMS)
+    for param in SEARCH_SPACE:
+        # Far enough to move cases across every threshold and window edge
+        steps = step_ladder(param) + ((100, 200, 400) if param.decimals is None else (0.1, 0.3))
+        values = [round(DEFAULT_PARAMS[param.name] + sign * step, param.decimals)
+                  for step in steps for sign in (-1, 1)]
+        expected = [full_total(dict(DEFAULT_PARAMS, **{param.name: value})) for value in values]
+        assert state.totals_with(param.name, values).tolist() == expected, param.name
+    assert state.total == full_total(DEFAULT_PARAMS)
+
+def test_random_moves_match_full_evaluation():
+    rng = random.Random(1)
+    state = IncrementalEvaluator(EVALUATOR, DEFAULT_PARAMS)
+    for k in range(300):
+        candidate = perturb(SEARCH_SPACE, state.params, rng, adjust=(1, 2, 3))
+        changes = {name: value for name, value in candidate.items() if value != state.params[name]}
+        expected = full_total(candidate)
+        assert state.total_with(changes) == expected
+        if k % 2 == 0:
+            assert state.apply(changes) == expected
+            assert np.array_equal(state.cents, EVALUATOR.predict_cents(state.params))
+
+def test_coordinate_descent_same_moves_as_full():
+    moves = [list(coordinate_descent(cls(EVALUATOR, DEFAULT_PARAMS), max_passes=2))
+             for cls in (FullEvaluator, IncrementalEvaluator)]
+    assert moves[0] == moves[1] and moves[0]
+
+if __name__ == "__main__":
+    for test in (test_ladders_match_full_evaluation, test_random_moves_match_full_evaluation,
+                 test_coordinate_descent_same_moves_as_full):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Test the model registry: every in-process model returns what its run script prints, batch or single"""
+
+import decimal
+import json
+import os
+import tempfile
+
+import model_registry
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# A .49 receipt, a zero-mile trip and an ordinary one
+CASES = [(3, 93.0, 1.42), (1, 1082.0, 1809.49), (5, 0.0, 130.2)]
+
+INLINE_SCRIPT = '''#!/bin/bash
+# Black Box Legacy Reimbursement System - Test Model
+# Expected score: ~100
+exec python3 -c "
+import sys
+from decimal import getcontext
+getcontext().prec = 6
+
+def calculate_reimbursement(days, miles, receipts):
+    return int(days) * 100 - int(float(receipts) * 100)
+
+cents = calculate_reimbursement(sys.argv[1], sys.argv[2], sys.argv[3])
+sign = '-' if cents < 0 else ''
+dollars, cents = divmod(abs(cents), 100)
+print(f'{sign}{dollars}.{cents:02d}')
+" "$1" "$2" "$3"
+'''
+
+def test_every_model_matches_its_script():
+    models = model_registry.load_models()
+    assert 'run' in models and 'zero_error' in models
+    prec = decimal.getcontext().prec
+    assert model_registry.check(models, CASES) == []
+    # Each model's getcontext().prec stayed in its own context
+    assert decimal.getcontext().prec == prec
+
+def test_batch_matches_single_calls():
+    with open(os.path.join(HERE, 'public_cases.json'), 'r') as f:
+        trips = [tuple(case['input'][key] for key in ('trip_duration_days', 'miles_traveled', 'total_receipts_amount'))
+                 for case in json.load(f)[:200]]
+    for name in ('run', 'rf_arrays', 'final_ensemble'):
+        model = model_registry.load_model(name)
+        assert model.batch(trips) == [model(*trip) for trip in trips], name
+    assert model_registry.load_model('run').predict_batch is not None
+
+def test_formatting_statements_and_context():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'run_signed.sh')
+        with open(path, 'w') as f:
+            f.write(INLINE_SCRIPT)
+        model = model_registry.load_script(path)
+        assert model.name == 'signed' and model.expected_score == '~100'
+        assert model(3, 93, 1.42) == 1.58
+        assert model(1, 0, 3.05) == -2.05
+        assert decimal.getcontext().prec != 6
+
+def test_shell_args():
+    assert [model_registry.shell_arg(value) for value in (93.0, 1.42, 3, '0.50')] == ['93', '1.42', '3', '0.50']
+    assert model_registry.model_name('/x/run.sh') == 'run'
+    assert model_registry.model_name('run_final_ensemble.sh') == 'final_ensemble'
+
+if __name__ == "__main__":
+    for test in (test_every_model_matches_its_script, test_batch_matches_single_calls,
+                 test_formatting_statements_and_context, test_shell_args):
+        test()
+        print(f"✅ {test.__name__}")
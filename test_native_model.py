@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test the native model format: .bin predictions are bit-identical to the pickled sklearn models"""
+
+import os
+import pickle
+import shutil
+import tempfile
+import warnings
+
+import numpy as np
+
+import native_model
+from case_store import columns
+from features import feature_matrix
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+MODELS = (('optimized_model.pkl', 'optimized_model.bin'), ('rf_model.pkl', 'rf_model.bin'))
+
+def load_pickle(path):
+    # The pickles come from an older sklearn
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
+        with open(os.path.join(HERE, path), 'rb') as f:
+            return pickle.load(f)
+
+def inputs(feature_cols):
+    # Public and private cases: several BATCH_CHUNKs, with chunk boundaries inside
+    parts = [columns(os.path.join(HERE, name))[:3] for name in ('public_cases.json', 'private_cases.json')]
+    days, miles, receipts = (np.concatenate(column) for column in zip(*parts))
+    return feature_matrix(feature_cols, days, miles, receipts)
+
+def test_bin_predictions_match_pickle():
+    for pkl_path, bin_path in MODELS:
+        model_data = load_pickle(pkl_path)
+        native = native_model.load_native(os.path.join(HERE, bin_path))
+        assert native['feature_cols'] == list(model_data['feature_cols'])
+        assert native['corrections'] == model_data.get('corrections', {})
+        X = inputs(model_data['feature_cols'])
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
+            expected = model_data['model'].predict(X)
+        assert np.array_equal(native['model'].predict(X), expected), bin_path
+        sample = X[::97]
+        assert [native['model'].predict_one(row) for row in sample] == expected[::97].tolist(), bin_path
+
+def test_export_reproduces_shipped_files():
+    with tempfile.TemporaryDirectory() as tmp:
+        for pkl_path, bin_path in MODELS:
+            out = os.path.join(tmp, bin_path)
+            native_model.export_model(load_pickle(pkl_path), out,
+                                      native_model.file_sha256(os.path.join(HERE, pkl_path)))
+            with open(out, 'rb') as exported, open(os.path.join(HERE, bin_path), 'rb') as shipped:
+                assert exported.read() == shipped.read(), bin_path
+
+def test_is_current_follows_pickle_contents():
+    saved = os.environ.get('PREDICTION_CACHE')
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['PREDICTION_CACHE'] = os.path.join(tmp, 'cache.sqlite')
+        try:
+            pkl_path, bin_path = (os.path.join(tmp, name) for name in MODELS[1])
+            shutil.copy(os.path.join(HERE, MODELS[1][0]), pkl_path)
+            shutil.copy(os.path.join(HERE, MODELS[1][1]), bin_path)
+            assert native_model.is_current(bin_path, pkl_path)
+            # Same contents with a new mtime is still current; different contents are not
+            os.utime(pkl_path, ns=(0, 0))
+            assert native_model.is_current(bin_path, pkl_path)
+            with open(pkl_path, 'ab') as f:
+                f.write(b'\0')
+            assert not native_model.is_current(bin_path, pkl_path)
+            assert not native_model.is_current(os.path.join(tmp, 'missing.bin'), pkl_path)
+        finally:
+            if saved is None:
+                del os.environ['PREDICTION_CACHE']
+            else:
+                os.environ['PREDICTION_CACHE'] = saved
+
+if __name__ == "__main__":
+    for test in (test_bin_predictions_match_pickle, test_export_reproduces_shipped_files,
+                 test_is_current_follows_pickle_contents):
+        test()
+        print(f"✅ {test.__name__}")
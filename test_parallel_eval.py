@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Test eval.sh and generate_results.sh with -j N: results stay in case order, whatever order the workers finish in"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# A stand-in for run.sh whose early cases finish last, and which rejects non-numeric arguments
+STUB_RUN_SH = '''#!/bin/bash
+exec python3 -c '
+import sys, time
+if any(not arg.replace(".", "", 1).isdigit() for arg in sys.argv[1:]):
+    sys.exit(f"bad input {sys.argv[1:]}")
+days, miles, receipts = int(sys.argv[1]), float(sys.argv[2]), float(sys.argv[3])
+time.sleep(0.01 * (9 - days % 10))
+print(f"{days * 100 + miles * 0.5 + receipts * 0.4:.2f}")
+' "$1" "$2" "$3"
+'''
+
+def case_dir(tmp, count=40):
+    """eval.sh, generate_results.sh, the stub run.sh and case files that include an empty and a spaced field"""
+    with open(os.path.join(HERE, 'public_cases.json'), 'r') as f:
+        public = json.load(f)[:count]
+    with open(os.path.join(HERE, 'private_cases.json'), 'r') as f:
+        private = json.load(f)[:count]
+    # Fields that word-splitting xargs would drop or split, shifting every later case
+    private[5]['miles_traveled'] = ''
+    private[11]['total_receipts_amount'] = '1 5'
+    public[7]['input']['miles_traveled'] = ''
+    for name, cases in (('public_cases.json', public), ('private_cases.json', private)):
+        with open(os.path.join(tmp, name), 'w') as f:
+            json.dump(cases, f)
+    with open(os.path.join(tmp, 'run.sh'), 'w') as f:
+        f.write(STUB_RUN_SH)
+    os.chmod(os.path.join(tmp, 'run.sh'), 0o755)
+    for script in ('eval.sh', 'generate_results.sh', 'case_runner.sh'):
+        shutil.copy(os.path.join(HERE, script), tmp)
+    return private
+
+def run(tmp, script, jobs):
+    result = subprocess.run(['bash', script, '-j', str(jobs)], cwd=tmp, capture_output=True, text=True)
+    errors = [line for line in result.stderr.splitlines() if line.startswith('Error on case')]
+    return result.returncode, result.stdout, errors
+
+def expected_results(private):
+    lines = []
+    for case in private:
+        args = [str(case['trip_duration_days']), str(case['miles_traveled']), str(case['total_receipts_amount'])]
+        if all(arg.replace('.', '', 1).isdigit() for arg in args):
+            days, miles, receipts = int(args[0]), float(args[1]), float(args[2])
+            lines.append(f"{days * 100 + miles * 0.5 + receipts * 0.4:.2f}")
+        else:
+            lines.append('ERROR')
+    return lines
+
+def test_generate_results_order():
+    if shutil.which('jq') is None:
+        pytest.skip("generate_results.sh needs jq")
+    with tempfile.TemporaryDirectory() as tmp:
+        private = case_dir(tmp)
+        outputs = {}
+        for jobs in (1, 4):
+            status, _, errors = run(tmp, 'generate_results.sh', jobs)
+            assert status == 0
+            with open(os.path.join(tmp, 'private_results.txt')) as f:
+                outputs[jobs] = (f.read().splitlines(), errors)
+        assert outputs[1] == outputs[4]
+        assert outputs[4][0] == expected_results(private)
+        assert [error.split(':')[0] for error in outputs[4][1]] == ['Error on case 6', 'Error on case 12']
+
+def test_eval_sh_order():
+    if shutil.which('bc') is None or shutil.which('jq') is None:
+        pytest.skip("eval.sh needs bc and jq")
+    with tempfile.TemporaryDirectory() as tmp:
+        case_dir(tmp)
+        sequential, parallel = run(tmp, 'eval.sh', 1), run(tmp, 'eval.sh', 4)
+        assert sequential == parallel
+        assert 'Case 8:' in sequential[1]
+
+def test_rejects_bad_job_count():
+    with tempfile.TemporaryDirectory() as tmp:
+        case_dir(tmp)
+        result = subprocess.run(['bash', 'generate_results.sh', '-j', 'many'], cwd=tmp, capture_output=True, text=True)
+        assert result.returncode != 0 and 'non-negative integer' in result.stderr
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__]))
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Test ParamEvaluator: vectorized reimbursements equal the per-case Decimal rule model exactly"""
+
+import os
+from decimal import Decimal as D
+
+import numpy as np
+
+from param_eval import (DEFAULT_PARAMS, ParamEvaluator, _random_params, calculate_reimbursement_with_params,
+                        scaled)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def decimal_cents(evaluator, params):
+    trips = zip(evaluator.days.tolist(), evaluator.miles.tolist(), evaluator.receipts.tolist())
+    return np.array([scaled(calculate_reimbursement_with_params(*trip, params), 2) for trip in trips])
+
+def test_matches_decimal_model():
+    rng = np.random.default_rng(1)
+    for name in ('public_cases.json', 'private_cases.json'):
+        evaluator = ParamEvaluator(os.path.join(HERE, name))
+        # Random parameter sets include thresholds placed exactly on case values
+        for params in [DEFAULT_PARAMS] + [_random_params(rng, evaluator) for _ in range(8)]:
+            assert np.array_equal(evaluator.predict_cents(params), decimal_cents(evaluator, params)), params
+
+def test_evaluate_summary():
+    evaluator = ParamEvaluator(os.path.join(HERE, 'public_cases.json'))
+    errors = np.abs(evaluator.expected_cents - decimal_cents(evaluator, DEFAULT_PARAMS))
+    avg_error, max_error, total_error, over_500 = evaluator.evaluate(DEFAULT_PARAMS)
+    assert D(str(total_error)) == D(int(errors.sum())).scaleb(-2)
+    assert max_error == int(errors.max()) / 100
+    assert over_500 == int((errors > 50000).sum())
+    assert abs(avg_error - errors.sum() / 100 / len(errors)) < 1e-9
+
+def test_rejects_unrepresentable_parameters():
+    evaluator = ParamEvaluator(os.path.join(HERE, 'public_cases.json'))
+    try:
+        evaluator.predict_cents(dict(DEFAULT_PARAMS, short_mid_rate=0.123456))
+    except ValueError:
+        return
+    raise AssertionError("accepted a rate with more than 4 decimals")
+
+def test_private_cases_have_no_errors():
+    evaluator = ParamEvaluator(os.path.join(HERE, 'private_cases.json'))
+    try:
+        evaluator.error_cents(DEFAULT_PARAMS)
+    except ValueError:
+        return
+    raise AssertionError("computed errors without expected outputs")
+
+if __name__ == "__main__":
+    for test in (test_matches_decimal_model, test_evaluate_summary, test_rejects_unrepresentable_parameters,
+                 test_private_cases_have_no_errors):
+        test()
+        print(f"✅ {test.__name__}")
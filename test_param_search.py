@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Test the parallel parameter search: same results in the same order whatever the number of workers"""
+
+import os
+import random
+
+from param_eval import DEFAULT_PARAMS, ParamEvaluator
+from param_search import SEARCH_SPACE, Search, grid, perturb
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CASES = os.path.join(HERE, 'public_cases.json')
+
+def candidates(count=40, seed=0):
+    rng = random.Random(seed)
+    return [perturb(SEARCH_SPACE, DEFAULT_PARAMS, rng) for _ in range(count)]
+
+def test_pool_results_in_candidate_order():
+    params = candidates()
+    expected = [ParamEvaluator(CASES).evaluate(p) for p in params]
+    for jobs, chunk_size in ((1, 64), (3, 4), (2, 7)):
+        with Search(CASES, jobs=jobs, chunk_size=chunk_size) as search:
+            results = list(search.evaluate(params))
+            assert [p for p, _ in results] == params
+            assert [stats for _, stats in results] == expected, (jobs, chunk_size)
+            assert search.evaluations == len(params)
+
+def test_random_search_independent_of_jobs():
+    runs = []
+    for jobs, chunk_size in ((1, 64), (3, 5)):
+        with Search(CASES, jobs=jobs, chunk_size=chunk_size) as search:
+            runs.append(list(search.random_search(SEARCH_SPACE, DEFAULT_PARAMS, iterations=60, seed=7, batch_size=20)))
+    assert runs[0] == runs[1]
+    # Every reported best improves on the one before
+    totals = [stats[2] for _, _, stats in runs[0]]
+    assert totals == sorted(totals, reverse=True) and len(set(totals)) == len(totals)
+
+def test_grid_order():
+    combos = grid(DEFAULT_PARAMS, {'base_per_diem': [90, 100], 'five_day_bonus': [0, 10, 20]})
+    assert [(c['base_per_diem'], c['five_day_bonus']) for c in combos] == [
+        (90, 0), (90, 10), (90, 20), (100, 0), (100, 10), (100, 20)]
+
+if __name__ == "__main__":
+    for test in (test_pool_results_in_candidate_order, test_random_search_independent_of_jobs, test_grid_order):
+        test()
+        print(f"✅ {test.__name__}")
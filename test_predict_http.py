@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Test the HTTP service: single, batch and concurrent requests get the amounts the command-line predictors print"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PROGRAMS = {'optimized': 'predict_optimized.py', 'forest': 'rf_forest.py'}
+
+def load_cases(count=300):
+    with open(os.path.join(HERE, 'public_cases.json'), 'r') as f:
+        return json.load(f)[:count]
+
+def cli_amounts(model, cases):
+    """What the model's command-line predictor prints for the cases, one call per trip for the first few"""
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, PREDICTION_CACHE='off', PREDICT_SOCKET=os.path.join(tmp, 'none.sock'),
+                   ZYGOTE_SOCKET=os.path.join(tmp, 'none.sock'))
+        program = os.path.join(HERE, PROGRAMS[model])
+        amounts = subprocess.run([sys.executable, program, '--batch'], input=json.dumps(cases), cwd=HERE, env=env,
+                                 capture_output=True, text=True, check=True).stdout.splitlines()
+        for case, amount in zip(cases[:3], amounts):
+            trip = case['input']
+            args = [str(trip[key]) for key in ('trip_duration_days', 'miles_traveled', 'total_receipts_amount')]
+            single = subprocess.run([sys.executable, program, *args], cwd=HERE, env=env,
+                                    capture_output=True, text=True, check=True).stdout.strip()
+            assert single == amount, args
+        return amounts
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def start_service(model, *args):
+    port = free_port()
+    server = subprocess.Popen([sys.executable, os.path.join(HERE, 'predict_http.py'), '--port', str(port),
+                               '--model', model, *args], cwd=HERE, stderr=subprocess.DEVNULL)
+    while True:
+        assert server.poll() is None, "the service failed to start"
+        try:
+            request('GET', port, '/health')
+            return server, port
+        except OSError:
+            time.sleep(0.05)
+
+def request(method, port, path, payload=None):
+    data = None if payload is None else json.dumps(payload).encode()
+    req = urllib.request.Request(f"http://127.0.0.1:{port}{path}", data=data, method=method,
+                                 headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(req, timeout=30) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+def cents(amounts):
+    return [f"{amount:.2f}" for amount in amounts]
+
+def test_batch_results_match_cli():
+    cases = load_cases()
+    for model in PROGRAMS:
+        expected = cli_amounts(model, cases)
+        server, port = start_service(model)
+        try:
+            for payload in (cases, {'trips': [case['input'] for case in cases]}):
+                status, body = request('POST', port, '/predict', payload)
+                assert status == 200 and cents(body['reimbursements']) == expected, model
+            status, body = request('POST', port, '/predict', cases[7]['input'])
+            assert status == 200 and cents([body['reimbursement']]) == [expected[7]], model
+        finally:
+            server.terminate()
+            server.wait()
+
+def test_concurrent_requests_get_their_own_results():
+    cases = load_cases(120)
+    expected = cli_amounts('optimized', cases)
+    # A long wait so that requests from different callers share batches
+    server, port = start_service('optimized', '--max-batch', '64', '--max-wait-ms', '20')
+    try:
+        def post(i):
+            # Singles, and small batches that straddle them
+            if i % 3 == 0:
+                return request('POST', port, '/predict', cases[i:i + 3])[1]['reimbursements']
+            return [request('POST', port, '/predict', cases[i]['input'])[1]['reimbursement']]
+        with ThreadPoolExecutor(16) as pool:
+            results = list(pool.map(post, range(len(cases))))
+        for i, amounts in enumerate(results):
+            assert cents(amounts) == expected[i:i + len(amounts)], i
+        _, stats = request('GET', port, '/stats')
+        assert stats['largest_batch'] > 1 and stats['requests'] == len(cases)
+    finally:
+        server.terminate()
+        server.wait()
+
+def test_bad_requests():
+    server, port = start_service('forest')
+    try:
+        assert request('POST', port, '/predict', {'miles_traveled': 93})[0] == 400
+        assert request('POST', port, '/predict', [1, 2, 3])[0] == 400
+        assert request('POST', port, '/predict', []) == (200, {'reimbursements': []})
+        assert request('GET', port, '/predict')[0] == 405
+        assert request('GET', port, '/nowhere')[0] == 404
+    finally:
+        server.terminate()
+        server.wait()
+
+if __name__ == "__main__":
+    for test in (test_batch_results_match_cli, test_concurrent_requests_get_their_own_results, test_bad_requests):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test the prediction daemon: ./run.sh answered by predict_server.py prints what the cold command prints"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def load_cases(count=15):
+    with open(os.path.join(HERE, 'public_cases.json'), 'r') as f:
+        return [(str(case['input']['trip_duration_days']), str(case['input']['miles_traveled']),
+                 str(case['input']['total_receipts_amount'])) for case in json.load(f)[:count]]
+
+def run(args, env):
+    result = subprocess.run([os.path.join(HERE, 'run.sh'), *args], cwd=HERE, env=env, capture_output=True, text=True)
+    return result.returncode, result.stdout
+
+def start_daemon(socket_path):
+    server = subprocess.Popen([sys.executable, os.path.join(HERE, 'predict_server.py'), '--socket', socket_path],
+                              stderr=subprocess.DEVNULL)
+    while not os.path.exists(socket_path):
+        assert server.poll() is None, "the daemon failed to start"
+        time.sleep(0.05)
+    return server
+
+def test_run_sh_through_daemon_matches_cold():
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, 'predict.sock')
+        cold = dict(os.environ, PREDICT_SOCKET=os.path.join(tmp, 'none.sock'),
+                    ZYGOTE_SOCKET=os.path.join(tmp, 'none.sock'), PREDICTION_CACHE='off')
+        warm = dict(cold, PREDICT_SOCKET=socket_path)
+        server = start_daemon(socket_path)
+        try:
+            for case in load_cases():
+                assert run(case, warm) == run(case, cold), case
+        finally:
+            server.terminate()
+            server.wait()
+
+def test_bad_request_gets_error_line():
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, 'predict.sock')
+        server = start_daemon(socket_path)
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+                conn.connect(socket_path)
+                conn.sendall(b"3 93\n3 93 1.42\n")
+                reply = b''
+                while reply.count(b'\n') < 2:
+                    chunk = conn.recv(256)
+                    assert chunk, reply
+                    reply += chunk
+            error, answer = reply.decode().splitlines()
+            assert error.startswith('ERROR'), error
+            assert answer == run(('3', '93', '1.42'), dict(os.environ, PREDICT_SOCKET=socket_path))[1].strip()
+        finally:
+            server.terminate()
+            server.wait()
+
+def test_stopped_daemon_falls_back():
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, 'predict.sock')
+        # A socket file nobody listens on, as a crashed daemon leaves behind
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+        env = dict(os.environ, PREDICT_SOCKET=socket_path, ZYGOTE_SOCKET=os.path.join(tmp, 'none.sock'),
+                   PREDICTION_CACHE='off')
+        status, output = run(('3', '93', '1.42'), env)
+        assert status == 0 and output.strip(), (status, output)
+
+if __name__ == "__main__":
+    for test in (test_run_sh_through_daemon_matches_cold, test_bad_request_gets_error_line,
+                 test_stopped_daemon_falls_back):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test the prediction cache: cached CLI calls print what uncached ones print, and stale entries are never served"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+
+from prediction_cache import PredictionCache, trip_key
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PREDICTORS = ('predict_optimized.py', 'predict.py', 'rf_forest.py')
+
+def load_trips(count=8):
+    with open(os.path.join(HERE, 'public_cases.json'), 'r') as f:
+        cases = json.load(f)[:count]
+    return [(str(case['input']['trip_duration_days']), str(case['input']['miles_traveled']),
+             str(case['input']['total_receipts_amount'])) for case in cases]
+
+def predict(script, trip, cache):
+    result = subprocess.run([sys.executable, os.path.join(HERE, script), *trip], cwd=HERE,
+                            env=dict(os.environ, PREDICTION_CACHE=cache), capture_output=True, text=True)
+    return result.returncode, result.stdout
+
+def cached_rows(path, model):
+    with sqlite3.connect(path) as conn:
+        return conn.execute('SELECT COUNT(*) FROM predictions WHERE model = ?', (model,)).fetchone()[0]
+
+def test_cli_cached_matches_uncached():
+    trips = load_trips()
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = os.path.join(tmp, 'cache.sqlite')
+        for script in PREDICTORS:
+            uncached = [predict(script, trip, 'off') for trip in trips]
+            # First pass fills the cache, the second is answered from it
+            assert [predict(script, trip, cache) for trip in trips] == uncached, script
+            assert [predict(script, trip, cache) for trip in trips] == uncached, script
+        for model in ('optimized_model', 'rf_model', 'rf_forest'):
+            assert cached_rows(cache, model) == len(trips), model
+
+def test_changed_model_file_drops_entries():
+    with tempfile.TemporaryDirectory() as tmp:
+        path, model_file = os.path.join(tmp, 'cache.sqlite'), os.path.join(tmp, 'model.bin')
+        with open(model_file, 'wb') as f:
+            f.write(b'one')
+        cache = PredictionCache('m', [model_file], path)
+        cache.put(3, 93.0, 1.42, 370.73)
+        assert cache.get(3, 93.0, 1.42) == 370.73
+        cache.close()
+
+        with open(model_file, 'wb') as f:
+            f.write(b'two')
+        cache = PredictionCache('m', [model_file], path)
+        assert cache.get(3, 93.0, 1.42) is None
+        cache.close()
+
+def test_lru_eviction_keeps_the_cap():
+    with tempfile.TemporaryDirectory() as tmp:
+        path, model_file = os.path.join(tmp, 'cache.sqlite'), os.path.join(tmp, 'model.bin')
+        with open(model_file, 'wb') as f:
+            f.write(b'model')
+        cache = PredictionCache('m', [model_file], path, max_entries=3)
+        for days in range(1, 6):
+            cache.put(days, 100.0, 10.0, float(days))
+        assert cached_rows(path, 'm') == 3
+        assert cache.get(1, 100.0, 10.0) is None and cache.get(5, 100.0, 10.0) == 5.0
+        assert cache.conn.execute('SELECT count FROM entries').fetchone()[0] == 3
+        cache.close()
+
+def test_sub_cent_inputs_are_not_cached():
+    assert trip_key(3, 93.0, 1.42) == (3, 9300, 142)
+    assert trip_key(3, 93.001, 1.42) is None
+    assert trip_key(3, 93.0, 1.425) is None
+
+if __name__ == "__main__":
+    for test in (test_cli_cached_matches_uncached, test_changed_model_file_drops_entries,
+                 test_lru_eviction_keeps_the_cap, test_sub_cent_inputs_are_not_cached):
+        test()
+        print(f"✅ {test.__name__}")
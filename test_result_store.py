@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Test the result store: unchanged models run nothing, and --changed only re-runs the declared region"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+from result_store import compile_region, model_files
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+MODEL = '''from helper import rate
+
+def predict(days, miles, receipts):
+    return days * rate(days) + miles * 0.5 + receipts * 0.4
+'''
+
+def write_model(tmp, rates):
+    with open(os.path.join(tmp, 'model.py'), 'w') as f:
+        f.write(MODEL)
+    with open(os.path.join(tmp, 'helper.py'), 'w') as f:
+        f.write(f"RATES = {rates!r}\n\ndef rate(days):\n    return RATES.get(days, 100)\n")
+
+def evaluate(tmp, *args):
+    """(report, results reused, cases run) of evaluate.py on the model in tmp"""
+    env = dict(os.environ, PYTHONPATH=tmp, RESULT_STORE=os.path.join(tmp, 'store.sqlite'))
+    result = subprocess.run([sys.executable, os.path.join(HERE, 'evaluate.py'), os.path.join(tmp, 'model.py') + ':predict',
+                             '--cases', os.path.join(tmp, 'cases.json'), *args],
+                            cwd=HERE, env=env, capture_output=True, text=True, check=True)
+    counts = re.search(r'reused (\d+) results, ran (\d+) cases', result.stderr)
+    reused, ran = (int(n) for n in counts.groups()) if counts else (0, None)
+    return result.stdout, reused, ran
+
+def load_cases(tmp):
+    with open(os.path.join(tmp, 'cases.json')) as f:
+        return json.load(f)
+
+def make_case_dir(tmp, count=120):
+    with open(os.path.join(HERE, 'public_cases.json'), 'r') as f, open(os.path.join(tmp, 'cases.json'), 'w') as out:
+        json.dump(json.load(f)[:count], out)
+    write_model(tmp, {})
+
+def test_unchanged_model_runs_nothing():
+    with tempfile.TemporaryDirectory() as tmp:
+        make_case_dir(tmp)
+        first = evaluate(tmp)
+        second = evaluate(tmp)
+        assert first[1:] == (0, 120) and second[1:] == (120, 0)
+        assert first[0] == second[0]
+
+def test_imported_module_change_reruns():
+    with tempfile.TemporaryDirectory() as tmp:
+        make_case_dir(tmp)
+        assert os.path.join(tmp, 'helper.py') in model_files(os.path.join(tmp, 'model.py'))
+        evaluate(tmp)
+        write_model(tmp, {1: 90})
+        assert evaluate(tmp)[1:] == (0, 120)
+
+def test_changed_region_matches_full_run():
+    with tempfile.TemporaryDirectory() as tmp:
+        make_case_dir(tmp)
+        evaluate(tmp)
+        write_model(tmp, {5: 120})
+        five_day = sum(case['input']['trip_duration_days'] == 5 for case in load_cases(tmp))
+        report, reused, ran = evaluate(tmp, '--changed', 'days == 5')
+        assert (reused, ran) == (120 - five_day, five_day) and five_day
+        assert report == evaluate(tmp, '--no-store')[0]
+
+def test_region_names():
+    assert compile_region("ending in ('49', '99')")(3, 93, 1.49)
+    assert not compile_region("ending in ('49', '99')")(3, 93, 1.5)
+    assert compile_region("days == 5 and cents > 10000")(5, 10, 100.01)
+
+if __name__ == "__main__":
+    for test in (test_unchanged_model_runs_nothing, test_imported_module_change_reruns,
+                 test_changed_region_matches_full_run, test_region_names):
+        test()
+        print(f"✅ {test.__name__}")
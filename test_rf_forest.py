@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Test the array-backed forest: bit-identical to the generated rf_pure_python.score, also exactly on split thresholds"""
+
+import json
+import os
+import random
+import tempfile
+
+import rf_forest
+import rf_pure_python
+from features_pure_python import create_features
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def case_features(count=200):
+    with open(os.path.join(HERE, 'public_cases.json'), 'r') as f:
+        cases = json.load(f)[:count]
+    return [create_features(case['input']['trip_duration_days'], case['input']['miles_traveled'],
+                            case['input']['total_receipts_amount']) for case in cases]
+
+def boundary_features(forest, count=200):
+    """Case feature vectors with one feature moved exactly onto a split threshold"""
+    rng = random.Random(0)
+    splits = [node for node in range(forest.n_nodes) if forest.feature[node] >= 0]
+    base = case_features(20)
+    vectors = []
+    for _ in range(count):
+        node = rng.choice(splits)
+        x = list(rng.choice(base))
+        x[forest.feature[node]] = forest.threshold[node]
+        vectors.append(x)
+    return vectors
+
+def test_score_matches_generated_code():
+    forest = rf_forest.load_forest()
+    for x in case_features() + boundary_features(forest):
+        assert rf_forest.score(x) == rf_pure_python.score(x), x
+
+def test_save_load_round_trip():
+    forest = rf_forest.load_forest()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'forest.bin')
+        forest.save(path)
+        with open(path, 'rb') as saved, open(rf_forest.FOREST_PATH, 'rb') as shipped:
+            assert saved.read() == shipped.read()
+        reloaded = rf_forest.Forest.load(path)
+    for x in case_features(20):
+        assert reloaded.score(x) == forest.score(x)
+
+def test_rejects_other_files():
+    with tempfile.NamedTemporaryFile(suffix='.bin') as f:
+        f.write(b'\0' * 64)
+        f.flush()
+        try:
+            rf_forest.Forest.load(f.name)
+        except ValueError:
+            return
+    raise AssertionError("loaded a file without the forest header")
+
+if __name__ == "__main__":
+    for test in (test_score_matches_generated_code, test_save_load_round_trip, test_rejects_other_files):
+        test()
+        print(f"✅ {test.__name__}")
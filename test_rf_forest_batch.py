@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Test the NumPy forest traversal: score_batch and predict_batch equal the per-row results exactly"""
+
+import json
+import os
+
+import numpy as np
+
+import rf_forest
+from features_pure_python import create_features
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def load_trips(count=1500):
+    trips = []
+    for name in ('public_cases.json', 'private_cases.json'):
+        with open(os.path.join(HERE, name), 'r') as f:
+            for case in json.load(f):
+                trip = case.get('input', case)
+                trips.append((trip['trip_duration_days'], trip['miles_traveled'], trip['total_receipts_amount']))
+    return trips[:count]
+
+def test_score_batch_matches_score():
+    # More rows than BATCH_CHUNK, so the chunk boundary is crossed
+    trips = load_trips()
+    assert len(trips) > rf_forest.BATCH_CHUNK
+    X = np.array([create_features(*trip) for trip in trips])
+    expected = [rf_forest.score(list(row)) for row in X.tolist()]
+    assert rf_forest.score_batch(X).tolist() == expected
+
+def test_predict_batch_matches_predict_reimbursement():
+    trips = load_trips(300)
+    expected = [rf_forest.predict_reimbursement(*trip) for trip in trips]
+    assert rf_forest.predict_batch(trips).tolist() == expected
+
+def test_empty_batch():
+    assert len(rf_forest.predict_batch([])) == 0
+
+if __name__ == "__main__":
+    for test in (test_score_batch_matches_score, test_predict_batch_matches_predict_reimbursement, test_empty_batch):
+        test()
+        print(f"✅ {test.__name__}")
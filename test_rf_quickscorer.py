@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Test the QuickScorer forest: bit-identical to rf_pure_python.score, also on and next to split thresholds"""
+
+import json
+import math
+import os
+import random
+
+import rf_pure_python
+import rf_quickscorer
+from features_pure_python import create_features
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def case_features(count=200):
+    with open(os.path.join(HERE, 'public_cases.json'), 'r') as f:
+        cases = json.load(f)[:count]
+    return [create_features(case['input']['trip_duration_days'], case['input']['miles_traveled'],
+                            case['input']['total_receipts_amount']) for case in cases]
+
+def test_score_matches_generated_code():
+    for x in case_features():
+        assert rf_quickscorer.score(x) == rf_pure_python.score(x), x
+
+def test_threshold_ties():
+    # bisect_left must send a value equal to a threshold left (x <= t), and its neighbours apart
+    rng = random.Random(0)
+    base = case_features(20)
+    splits = [(f, t) for f, thresholds in rf_quickscorer.THRESHOLDS.items() for t in thresholds]
+    for f, t in rng.sample(splits, 200):
+        for value in (math.nextafter(t, -math.inf), t, math.nextafter(t, math.inf)):
+            x = list(rng.choice(base))
+            x[f] = value
+            assert rf_quickscorer.score(x) == rf_pure_python.score(x), (f, value)
+
+if __name__ == "__main__":
+    for test in (test_score_matches_generated_code, test_threshold_ties):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Test the threshold sweep: every split's total equals a full evaluation, also for inputs beyond any fixed bound"""
+
+import json
+import os
+import tempfile
+
+from param_eval import DEFAULT_PARAMS, ParamEvaluator
+from threshold_sweep import THRESHOLDS, best_threshold, optimize_thresholds, sweep
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def assert_sweeps_exact(evaluator, params):
+    for name in THRESHOLDS:
+        splits = sweep(evaluator, params, name)
+        assert splits and [value for value, _ in splits] == sorted(value for value, _ in splits), name
+        for value, total in splits:
+            assert total == int(evaluator.error_cents(dict(params, **{name: value})).sum()), (name, value)
+
+def test_sweep_matches_full_evaluation():
+    assert_sweeps_exact(ParamEvaluator(os.path.join(HERE, 'public_cases.json')), DEFAULT_PARAMS)
+
+def test_inputs_above_a_million():
+    with open(os.path.join(HERE, 'public_cases.json')) as f:
+        cases = json.load(f)[:60]
+    for i, case in enumerate(cases[:6]):
+        case['input']['total_receipts_amount'] = 2_000_000 + i * 250_000.25
+        case['expected_output'] = 1_000_000.0 + i
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cases.json')
+        with open(path, 'w') as f:
+            json.dump(cases, f)
+        assert_sweeps_exact(ParamEvaluator(path), DEFAULT_PARAMS)
+
+def test_optimization_never_worsens():
+    evaluator = ParamEvaluator(os.path.join(HERE, 'public_cases.json'))
+    start = int(evaluator.error_cents(DEFAULT_PARAMS).sum())
+    for name in THRESHOLDS:
+        value, total = best_threshold(evaluator, DEFAULT_PARAMS, name)
+        assert total == min(t for _, t in sweep(evaluator, DEFAULT_PARAMS, name)) <= start
+    params, previous = dict(DEFAULT_PARAMS), start
+    for _, name, value, total in optimize_thresholds(evaluator, DEFAULT_PARAMS):
+        params[name] = value
+        assert total <= previous
+        assert total == int(evaluator.error_cents(params).sum())
+        previous = total
+
+if __name__ == "__main__":
+    for test in (test_sweep_matches_full_evaluation, test_inputs_above_a_million, test_optimization_never_worsens):
+        test()
+        print(f"✅ {test.__name__}")
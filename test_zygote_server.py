@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Test the zygote: a forked call behaves like the cold command, and a stalled client holds up no one"""
+
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from zygote_server import REQUEST_TIMEOUT
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def load_cases(count=10):
+    with open(os.path.join(HERE, 'public_cases.json'), 'r') as f:
+        return [(str(case['input']['trip_duration_days']), str(case['input']['miles_traveled']),
+                 str(case['input']['total_receipts_amount'])) for case in json.load(f)[:count]]
+
+def start_zygote(socket_path):
+    server = subprocess.Popen([sys.executable, os.path.join(HERE, 'zygote_server.py'), '--socket', socket_path],
+                              stderr=subprocess.DEVNULL)
+    while not os.path.exists(socket_path):
+        assert server.poll() is None, "the zygote failed to start"
+        time.sleep(0.05)
+    return server
+
+def environments(tmp):
+    cold = dict(os.environ, PREDICT_SOCKET=os.path.join(tmp, 'none.sock'),
+                ZYGOTE_SOCKET=os.path.join(tmp, 'none.sock'), PREDICTION_CACHE='off')
+    return cold, dict(cold, ZYGOTE_SOCKET=os.path.join(tmp, 'zygote.sock'))
+
+def run(command, env, stdin=None):
+    result = subprocess.run(command, cwd=HERE, env=env, input=stdin, capture_output=True, text=True)
+    return result.returncode, result.stdout, result.stderr
+
+def client(env, program, *args, stdin=None):
+    return run([sys.executable, '-S', os.path.join(HERE, 'zygote_client.py'), env['ZYGOTE_SOCKET'], program, *args],
+               env, stdin)
+
+def test_calls_through_zygote_match_cold():
+    with tempfile.TemporaryDirectory() as tmp:
+        cold, warm = environments(tmp)
+        server = start_zygote(warm['ZYGOTE_SOCKET'])
+        try:
+            for case in load_cases():
+                run_sh = [os.path.join(HERE, 'run.sh'), *case]
+                assert run(run_sh, warm) == run(run_sh, cold), case
+            # stdin, exit status and stderr come from the child too
+            batch = ''.join(f"{','.join(case)}\n" for case in load_cases())
+            for program, args, stdin in (('predict_optimized.py', ['--batch'], batch),
+                                         ('predict.py', ['3', '93', '1.42'], None),
+                                         ('predict_optimized.py', ['3', '93'], None)):
+                expected = run([sys.executable, program, *args], cold, stdin)
+                assert client(warm, program, *args, stdin=stdin) == expected, (program, args)
+                assert expected[0] == 0 or expected[2].startswith('Usage')
+        finally:
+            server.terminate()
+            server.wait()
+
+def test_unknown_program_is_refused():
+    with tempfile.TemporaryDirectory() as tmp:
+        _, warm = environments(tmp)
+        server = start_zygote(warm['ZYGOTE_SOCKET'])
+        try:
+            # Refused before forking, so run.sh would fall back to the cold command
+            assert client(warm, 'rm', '-rf', tmp)[0] == 3
+            assert os.path.isdir(tmp)
+        finally:
+            server.terminate()
+            server.wait()
+
+def test_stalled_client_does_not_block_others():
+    with tempfile.TemporaryDirectory() as tmp:
+        cold, warm = environments(tmp)
+        server = start_zygote(warm['ZYGOTE_SOCKET'])
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stalled:
+                stalled.connect(warm['ZYGOTE_SOCKET'])
+                stalled.sendall(b'{"program": "predict.py", ')
+                started = time.monotonic()
+                run_sh = [os.path.join(HERE, 'run.sh'), *load_cases(1)[0]]
+                answer = run(run_sh, warm)
+                assert time.monotonic() - started < REQUEST_TIMEOUT
+                assert answer == run(run_sh, cold)
+                # The stalled request is refused once its time is up
+                stalled.settimeout(REQUEST_TIMEOUT + 5)
+                assert stalled.recv(256).startswith(b'ERROR timed out')
+        finally:
+            server.terminate()
+            server.wait()
+
+if __name__ == "__main__":
+    for test in (test_calls_through_zygote_match_cold, test_unknown_program_is_refused,
+                 test_stalled_client_does_not_block_others):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Exact optimization of the rule model's thresholds by sorted sweep.
+
+A threshold only matters through which side of it each case falls on, so
+the total error changes only when the threshold crosses an actual data
+value. For one threshold with every other parameter fixed, each case has
+just two possible reimbursements: "on" (e.g. receipts above the threshold)
+and "off". sweep() evaluates both with ParamEvaluator, sorts the cases by
+the input the threshold is compared with and gets the total absolute error
+of every distinct split from prefix sums, in O(n log n) instead of one
+full evaluation per probed value.
+
+    threshold                        compared with        case is "on" when
+    {short,medium,long}_*_threshold  receipts             receipts > t
+    efficiency_min                   miles / day          miles/day >= t
+    efficiency_max                   miles / day          miles/day <= t
+    high_spending_threshold          receipts / day       receipts/day > t
+
+Keys are exact fractions, so ties and boundaries behave exactly like the
+Decimal model. Each split is reported with the roundest threshold inside
+it (fewest decimals, at most param_eval.PARAM_DECIMALS).
+
+Usage:
+    python3 threshold_sweep.py [--start params.json] [--out best_params.json]
+    python3 threshold_sweep.py --check
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+from fractions import Fraction
+
+import numpy as np
+
+from param_eval import DEFAULT_PARAMS, PARAM_DECIMALS, ParamEvaluator
+from param_search import SEARCH_SPACE, load_params, perturb
+
+# threshold -> (input it is compared with, comparison that turns a case "on")
+THRESHOLDS = {
+    'short_high_threshold': ('receipts', '>'),
+    'short_mid_threshold': ('receipts', '>'),
+    'medium_high_threshold': ('receipts', '>'),
+    'medium_mid_threshold': ('receipts', '>'),
+    'long_high_threshold': ('receipts', '>'),
+    'long_mid_threshold': ('receipts', '>'),
+    'efficiency_min': ('miles_per_day', '>='),
+    'efficiency_max': ('miles_per_day', '<='),
+    'high_spending_threshold': ('receipts_per_day', '>'),
+}
+
+def case_keys(evaluator, key):
+    """Exact Fraction value of an input ('receipts', 'miles_per_day' or 'receipts_per_day') for every case"""
+    if key == 'receipts':
+        return [Fraction(int(c), 100) for c in evaluator.receipts_cents]
+    numerators = evaluator.miles_hundredths if key == 'miles_per_day' else evaluator.receipts_cents
+    return [Fraction(int(n), 100 * int(d)) for n, d in zip(numerators, evaluator.divisor)]
+
+def roundest(low, high, include_low, include_high):
+    """
+    The value with the fewest decimals (at most PARAM_DECIMALS) between low
+    and high, closest to low; None bounds are unbounded. None if there is none.
+    """
+    for decimals in range(PARAM_DECIMALS + 1):
+        step = Fraction(1, 10 ** decimals)
+        if low is None:
+            value = math.floor(high / step) * step
+            if value == high and not include_high:
+                value -= step
+        else:
+            value = math.ceil(low / step) * step
+            if value == low and not include_low:
+                value += step
+        if high is None or value < high or (include_high and value == high):
+            return int(value) if decimals == 0 else round(float(value), decimals)
+    return None
+
+def sweep(evaluator, params, name):
+    """
+    [(threshold, total_error_cents)] for every distinct split of the cases by
+    one threshold, in increasing threshold order. Splits that no threshold
+    with PARAM_DECIMALS decimals can produce are left out.
+    """
+    key, op = THRESHOLDS[name]
+    keys = case_keys(evaluator, key)
+    unique = sorted(set(keys))
+
+    # Whole-number thresholds below and above every case input of this key
+    below_all, above_all = math.floor(unique[0]) - 1, math.floor(unique[-1]) + 1
+    on_value, off_value = (above_all, below_all) if op == '<=' else (below_all, above_all)
+    error_on = evaluator.error_cents(dict(params, **{name: on_value}))
+    error_off = evaluator.error_cents(dict(params, **{name: off_value}))
+
+    position = {k: i for i, k in enumerate(unique)}
+    index = np.array([position[k] for k in keys], dtype=np.intp)
+    on = np.zeros(len(unique), dtype=np.int64)
+    off = np.zeros(len(unique), dtype=np.int64)
+    np.add.at(on, index, error_on)
+    np.add.at(off, index, error_off)
+
+    # Split j puts the j smallest distinct keys on one side of the threshold
+    low_side, high_side = (on, off) if op == '<=' else (off, on)
+    totals = (np.concatenate(([0], np.cumsum(low_side)))
+              + np.concatenate((np.cumsum(high_side[::-1])[::-1], [0])))
+
+    splits = []
+    for j, total in enumerate(totals.tolist()):
+        low = unique[j - 1] if j > 0 else None
+        high = unique[j] if j < len(unique) else None
+        # '>' and '<=' splits are [k[j-1], k[j]); '>=' splits are (k[j-1], k[j]]
+        value = roundest(low, high, include_low=op != '>=', include_high=op == '>=')
+        if value is not None:
+            splits.append((value, total))
+    return splits
+
+def best_threshold(evaluator, params, name):
+    """(threshold, total_error_cents) minimizing the error; keeps the current value when it is optimal"""
+    splits = sweep(evaluator, params, name)
+    best = min(total for _, total in splits)
+    current = int(evaluator.error_cents(params).sum())
+    if current == best:
+        return params[name], current
+    return next(split for split in splits if split[1] == best)
+
+def optimize_thresholds(evaluator, params, names=tuple(THRESHOLDS), max_passes=10):
+    """
+    Coordinate passes setting each threshold to its exact optimum given the
+    others, until a pass changes nothing. Yields (pass, name, value,
+    total_error_cents) for each change; the final parameters are in the last one.
+    """
+    params = dict(params)
+    for pass_number in range(1, max_passes + 1):
+        changed = False
+        for name in names:
+            value, total = best_threshold(evaluator, params, name)
+            if value != params[name]:
+                params[name] = value
+                changed = True
+                yield pass_number, name, value, total
+        if not changed:
+            return
+
+def check(param_sets=5):
+    """Compare every split's total with a full evaluation; return the number of mismatches"""
+    evaluator = ParamEvaluator('public_cases.json')
+    rng = random.Random(0)
+    mismatches = 0
+    splits_checked = 0
+    for k in range(param_sets):
+        params = DEFAULT_PARAMS if k == 0 else perturb(SEARCH_SPACE, DEFAULT_PARAMS, rng, adjust=(8,))
+        for name in THRESHOLDS:
+            for value, total in sweep(evaluator, params, name):
+                actual = int(evaluator.error_cents(dict(params, **{name: value})).sum())
+                splits_checked += 1
+                if actual != total:
+                    print(f"  {name}={value}: sweep {total}, evaluation {actual}")
+                    mismatches += 1
+    print(f"{splits_checked} splits over {param_sets} parameter sets compared with full evaluations")
+    return mismatches
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Exact threshold optimization by sorted sweep")
+    parser.add_argument('--start', help="JSON file of starting parameters (default: param_eval.DEFAULT_PARAMS)")
+    parser.add_argument('--out', help="write the optimized parameters to this JSON file")
+    parser.add_argument('--cases', default='public_cases.json', help="case file (default: public_cases.json)")
+    parser.add_argument('--check', action='store_true', help="verify the sweep against full evaluations")
+    args = parser.parse_args()
+
+    if args.check:
+        mismatches = check()
+        print(f"{'❌' if mismatches else '✅'} {mismatches} mismatching splits")
+        sys.exit(1 if mismatches else 0)
+
+    base = load_params(args.start) if args.start else DEFAULT_PARAMS
+    evaluator = ParamEvaluator(args.cases)
+    print(f"Start: score {evaluator.evaluate(base)[2] / 100:.2f}")
+    params = dict(base)
+    for pass_number, name, value, total in optimize_thresholds(evaluator, base):
+        params[name] = value
+        print(f"  Pass {pass_number}: {name} → {value}, score {total / 10000:.2f}")
+
+    print(f"Best score: {evaluator.evaluate(params)[2] / 100:.2f}")
+    for name in THRESHOLDS:
+        if params[name] != base[name]:
+            print(f"  {name}: {base[name]} → {params[name]}")
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(params, f, indent=2)
+        print(f"✅ Wrote {args.out}")
@@ -4,8 +4,6 @@ Ultra Simple Solution - What if it's simpler than we think?
 """
 
 import sys
-from decimal import Decimal as D, getcontext
-getcontext().prec = 12
 
 def calculate_reimbursement(days, miles, receipts):
     receipt_str = f"{receipts:.2f}"
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Launcher for zygote_server.py, used by run.sh.
+
+Hands the zygote this process's stdin, stdout and stderr (SCM_RIGHTS),
+working directory, environment and arguments, waits for the forked child to
+finish and exits with its exit status. Only imports the standard library so
+it can start with `python3 -S`. Exits with status 3 when no zygote accepted
+the request, so that run.sh can fall back to running the predictor itself;
+once a child has been forked it never does, because the child may already
+have written output.
+
+Usage: zygote_client.py <socket> <program> [args...]
+"""
+
+import json
+import os
+import socket
+import sys
+
+EXIT_NO_ZYGOTE = 3
+
+def main(argv):
+    if len(argv) < 3:
+        print("Usage: zygote_client.py <socket> <program> [args...]", file=sys.stderr)
+        return 1
+
+    request = json.dumps({'program': argv[2], 'argv': argv[3:], 'cwd': os.getcwd(),
+                          'env': dict(os.environ)}).encode()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(argv[1])
+        # The descriptors ride along with the first chunk of the request
+        sent = socket.send_fds(sock, [request], [0, 1, 2])
+        sock.sendall(request[sent:])
+        sock.shutdown(socket.SHUT_WR)
+    except OSError:
+        sock.close()
+        return EXIT_NO_ZYGOTE
+
+    reply = b''
+    try:
+        while not reply.endswith(b'\n'):
+            chunk = sock.recv(256)
+            if not chunk:
+                break
+            reply += chunk
+    except OSError:
+        pass
+    finally:
+        sock.close()
+
+    reply = reply.decode('ascii', 'replace').strip()
+    if reply.startswith('ERROR'):
+        # Refused before forking: nothing has run yet
+        return EXIT_NO_ZYGOTE
+    try:
+        return int(reply)
+    except ValueError:
+        print("Error: the zygote went away before the request finished", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Fork server (zygote) for the command-line predictors.
+
+predict_server.py answers every request from one long-lived process. The
+zygote keeps run.sh's one process per call instead: it imports NumPy and
+sklearn and unpickles optimized_model.pkl and rf_model.pkl once, then
+fork()s a child per request. The child inherits that warm heap
+copy-on-write, adopts the caller's stdin/stdout/stderr (passed over the
+socket), working directory, environment and arguments, runs the predictor's
+usual main() and exits. The zygote sends the child's exit status back, so
+a call behaves like the cold command, output, errors and status included,
+without the imports and unpickling.
+
+Before serving, gc.freeze() moves everything preloaded out of the garbage
+collector's reach, so collections in a child don't write to (and copy) the
+shared pages.
+
+Protocol (see zygote_client.py), one request per connection:
+    request:  JSON {"program", "argv", "cwd", "env"}, sent with the caller's fds 0, 1 and 2
+    response: "<exit status>\\n" when the child exits (128 + N if killed by signal N),
+              or "ERROR <message>\\n" if the request was refused before forking
+
+Usage:
+    python3 zygote_server.py [--socket PATH]
+    python3 zygote_server.py --benchmark [--runs 30]
+"""
+
+import argparse
+import gc
+import json
+import os
+import selectors
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+import warnings
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SOCKET = os.environ.get('ZYGOTE_SOCKET', '/tmp/reimbursement-zygote.sock')
+MAX_REQUEST = 1 << 20
+# Seconds a client gets to send its whole request
+REQUEST_TIMEOUT = 5
+
+def preload():
+    """Import the predictors and load their models: {program: (main, model_data)}"""
+    import numpy  # noqa: F401  (the pickles pull in sklearn)
+    import predict
+    import predict_optimized
+    import prediction_cache  # noqa: F401
+    import native_model  # noqa: F401
+
+    # The cold commands predict from the native exports, which never warn; the pickled
+    # sklearn models warn on load (version) and on every unnamed-column predict
+    warnings.filterwarnings('ignore', category=UserWarning, module='sklearn')
+
+    programs = {}
+    for module in (predict_optimized, predict):
+        model_data = module.load_model(module.MODEL_PATH)
+        # Warm up feature engineering and the model
+        module.predict_reimbursement(model_data, 3, 93.0, 1.42)
+        programs[os.path.basename(module.__file__)] = (module.main, model_data)
+    return programs
+
+def exit_status(wait_status):
+    """Shell-style exit status of a waitpid() status"""
+    code = os.waitstatus_to_exitcode(wait_status)
+    return 128 - code if code < 0 else code
+
+def run_child(programs, request, fds):
+    """In a forked child: become the caller's process and run the program; never returns"""
+    status = 1
+    try:
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        os.chdir(request['cwd'])
+        os.environ.clear()
+        os.environ.update(request['env'])
+        main, model_data = programs[request['program']]
+        sys.argv = [request['program'], *request['argv']]
+        main(sys.argv, model_data)
+        status = 0
+    except SystemExit as e:
+        # Same conversion as the interpreter's own exit
+        if e.code is None or isinstance(e.code, int):
+            status = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except (OSError, ValueError):
+                status = status or 1
+        os._exit(status)
+
+class PendingRequest:
+    """A connection whose request is still arriving, read without blocking as it comes in"""
+
+    def __init__(self, conn):
+        conn.setblocking(False)
+        self.conn = conn
+        self.message = b''
+        self.fds = []
+        self.deadline = time.monotonic() + REQUEST_TIMEOUT
+
+    def read(self):
+        """Take what has arrived; (request, fds) once the client has sent it all, else None"""
+        try:
+            data, fds, _, _ = socket.recv_fds(self.conn, MAX_REQUEST, 3)
+        except BlockingIOError:
+            return None
+        self.fds += fds
+        if data:
+            self.message += data
+            if len(self.message) > MAX_REQUEST:
+                raise ValueError(f"request larger than {MAX_REQUEST} bytes")
+            return None
+        request = json.loads(self.message)
+        if len(self.fds) != 3:
+            raise ValueError(f"expected 3 file descriptors, got {len(self.fds)}")
+        fds, self.fds = self.fds, []
+        return request, fds
+
+    def close_fds(self):
+        for fd in self.fds:
+            os.close(fd)
+        self.fds = []
+
+def serve(socket_path):
+    from predict_server import remove_stale_socket
+
+    programs = preload()
+    remove_stale_socket(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(64)
+
+    # SIGCHLD only wakes the selector; children are reaped in the loop
+    wakeup, wakeup_writer = socket.socketpair()
+    wakeup.setblocking(False)
+    wakeup_writer.setblocking(False)
+    signal.set_wakeup_fd(wakeup_writer.fileno())
+    signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+
+    def shutdown(signum, frame):
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, shutdown)
+
+    selector = selectors.DefaultSelector()
+    selector.register(listener, selectors.EVENT_READ)
+    selector.register(wakeup, selectors.EVENT_READ)
+    children = {}  # pid -> connection awaiting the exit status
+    # Requests are read as they arrive, so a slow or stalled client holds up no one else
+    pending = {}  # connection -> PendingRequest
+
+    def refuse(conn, error):
+        try:
+            conn.sendall(f"ERROR {error}\n".encode('ascii', 'replace'))
+        except OSError:
+            pass
+        conn.close()
+
+    def receive(conn):
+        """Read from a pending connection; fork once its request is complete"""
+        pending_request = pending[conn]
+        try:
+            complete = pending_request.read()
+        except Exception as e:
+            complete = e
+        if complete is None:
+            return
+        selector.unregister(conn)
+        del pending[conn]
+        conn.setblocking(True)
+        if isinstance(complete, Exception):
+            pending_request.close_fds()
+            refuse(conn, complete)
+        else:
+            fork_child(conn, *complete)
+
+    def expire():
+        """Refuse the connections that did not send their request in time"""
+        now = time.monotonic()
+        for conn, pending_request in list(pending.items()):
+            if pending_request.deadline <= now:
+                selector.unregister(conn)
+                del pending[conn]
+                pending_request.close_fds()
+                conn.setblocking(True)
+                refuse(conn, "timed out waiting for the request")
+
+    def fork_child(conn, request, fds):
+        try:
+            if request.get('program') not in programs:
+                raise ValueError(f"unknown program {request.get('program')!r}")
+            pid = os.fork()
+        except Exception as e:
+            for fd in fds:
+                os.close(fd)
+            refuse(conn, e)
+            return
+        if pid == 0:
+            signal.set_wakeup_fd(-1)
+            signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            selector.close()
+            # Other callers' descriptors too, or their pipes would stay open as long as this child
+            for pending_request in pending.values():
+                pending_request.close_fds()
+            for sock in (listener, wakeup, wakeup_writer, conn, *children.values(), *pending):
+                sock.close()
+            run_child(programs, request, fds)
+        for fd in fds:
+            os.close(fd)
+        children[pid] = conn
+
+    def reap():
+        while True:
+            try:
+                pid, wait_status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            conn = children.pop(pid, None)
+            if conn is not None:
+                try:
+                    conn.sendall(f"{exit_status(wait_status)}\n".encode('ascii'))
+                except OSError:
+                    pass
+                conn.close()
+
+    gc.freeze()
+    print(f"Zygote listening on {socket_path} ({', '.join(programs)} preloaded)", file=sys.stderr)
+    try:
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(0, min(p.deadline for p in pending.values()) - time.monotonic())
+            for key, _ in selector.select(timeout):
+                if key.fileobj is listener:
+                    conn, _ = listener.accept()
+                    pending[conn] = PendingRequest(conn)
+                    selector.register(conn, selectors.EVENT_READ)
+                elif key.fileobj in pending:
+                    receive(key.fileobj)
+                else:
+                    while True:
+                        try:
+                            if not wakeup.recv(4096):
+                                break
+                        except BlockingIOError:
+                            break
+                    reap()
+            expire()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        print("Zygote stopped", file=sys.stderr)
+
+def benchmark(runs, cases_path='public_cases.json'):
+    """Per-call seconds of ./run.sh cold and through a zygote, as {label: [seconds]}"""
+    with open(os.path.join(HERE, cases_path), 'r') as f:
+        cases = [(str(case['input']['trip_duration_days']), str(case['input']['miles_traveled']),
+                  str(case['input']['total_receipts_amount'])) for case in json.load(f)[:runs]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = os.path.join(tmp, 'zygote.sock')
+        # No daemon and no prediction cache, so every call really predicts
+        base = dict(os.environ, PREDICT_SOCKET=os.path.join(tmp, 'none.sock'), PREDICTION_CACHE='off')
+        modes = (('cold', dict(base, ZYGOTE_SOCKET=os.path.join(tmp, 'none.sock'))),
+                 ('zygote', dict(base, ZYGOTE_SOCKET=socket_path)))
+
+        server = subprocess.Popen([sys.executable, os.path.join(HERE, 'zygote_server.py'), '--socket', socket_path],
+                                  stderr=subprocess.DEVNULL)
+        try:
+            while not os.path.exists(socket_path):
+                if server.poll() is not None:
+                    raise SystemExit("❌ the zygote failed to start")
+                time.sleep(0.05)
+
+            timings = {label: [] for label, _ in modes}
+            outputs = {label: [] for label, _ in modes}
+            for case in cases:
+                for label, env in modes:
+                    started = time.perf_counter()
+                    result = subprocess.run([os.path.join(HERE, 'run.sh'), *case], env=env,
+                                            capture_output=True, text=True)
+                    timings[label].append(time.perf_counter() - started)
+                    outputs[label].append((result.returncode, result.stdout))
+        finally:
+            server.terminate()
+            server.wait()
+
+    mismatches = sum(cold != warm for cold, warm in zip(outputs['cold'], outputs['zygote']))
+    return timings, mismatches
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fork a warm predictor process per run.sh call")
+    parser.add_argument('--socket', default=DEFAULT_SOCKET, help=f"socket path (default: {DEFAULT_SOCKET})")
+    parser.add_argument('--benchmark', action='store_true', help="compare ./run.sh latency cold and through a zygote")
+    parser.add_argument('--runs', type=int, default=30, help="calls per mode for --benchmark (default: 30)")
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        serve(args.socket)
+        sys.exit(0)
+
+    timings, mismatches = benchmark(args.runs)
+    print(f"./run.sh latency over {args.runs} cases (ms):")
+    print(f"  {'':>8} {'min':>7} {'median':>7} {'p90':>7} {'max':>7}")
+    for label, seconds in timings.items():
+        ms = sorted(s * 1000 for s in seconds)
+        p90 = ms[min(len(ms) - 1, int(len(ms) * 0.9))]
+        print(f"  {label:>8} {ms[0]:7.1f} {statistics.median(ms):7.1f} {p90:7.1f} {ms[-1]:7.1f}")
+    cold, warm = (statistics.median(seconds) for seconds in timings.values())
+    print(f"  {cold / warm:.1f}x faster at the median; {mismatches} output mismatches")
+    if mismatches:
+        sys.exit(1)